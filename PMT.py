@@ -1,9 +1,13 @@
 import sys
+from utils import startup_timer
 from PyQt5.QtWidgets import QApplication
+startup_timer.mark("import Qt")
 from gui.main_window import MainWindow
+startup_timer.mark("import app modules")
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    startup_timer.mark("create QApplication")
     window = MainWindow()
     window.show()
     sys.exit(app.exec_())
\ No newline at end of file
@@ -0,0 +1,330 @@
+import io
+import os
+import json
+import time
+import uuid
+import shutil
+import hashlib
+import tarfile
+import zipfile
+from collections import namedtuple
+
+from core.content_index import CHUNK_SIZE, StubMatcher, hash_file
+from core.project_generation import LAZY_STUB_SUFFIX, instantiate_template
+from utils.file_utils import ROOT_DIR, clone_file, is_valid_name
+
+"""
+Export of a project to a tar or zip archive, and import of such an archive.
+
+An archive holds a manifest.json followed by one "objects/<sha256>" member per
+distinct file content. The manifest lists every folder and file of the project
+with the hash of its contents, so the thousands of untouched template stubs of
+a project are stored once. Files are hashed and copied in chunks, so memory
+use does not grow with file sizes, and a tar archive is written and read as a
+stream without seeking.
+
+With skip_templates, assets that are still untouched stubs (see
+core.content_index) are not stored at all: the manifest names the template
+they are made from and importing creates them again like a new asset.
+
+Importing unpacks into a staging folder next to the projects, copies each
+repeated content from its first file (sharing blocks where the filesystem
+allows it), renames the folder into place and registers the project and its
+assets in the store.
+"""
+
+ARCHIVE_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+OBJECT_DIR = "objects"
+# Per-machine caches that are rebuilt on demand and not worth shipping
+SKIPPED_FILES = {"Config/audit_cache.json", "Config/stat_cache.json", "Config/content_index.json"}
+
+# Outcome of an export or import: files in the project, distinct contents,
+# bytes of all files, and bytes of the distinct contents
+ArchiveResult = namedtuple("ArchiveResult", ["project", "files", "objects", "size", "stored_size"])
+
+def archive_format(path):
+    """
+    Returns the tarfile mode suffix ("", "gz", "bz2" or "xz") of a tar archive
+    path, or "zip".
+    """
+    name = path.lower()
+    if name.endswith(".zip"):
+        return "zip"
+    for suffixes, compression in (((".tar.gz", ".tgz"), "gz"), ((".tar.bz2", ".tbz2"), "bz2"),
+                                  ((".tar.xz", ".txz"), "xz"), ((".tar",), "")):
+        if name.endswith(suffixes):
+            return compression
+    raise ValueError(f"Unknown archive type '{os.path.basename(path)}', use .zip, .tar, .tar.gz, .tar.bz2 or .tar.xz.")
+
+def _walk_project(base):
+    """
+    Returns the folders and the regular files of a project, relative to its
+    folder with '/' separators. Symlinks and other special files are left out.
+    """
+    dirs = []
+    files = []
+    for folder, subdirs, names in os.walk(base):
+        subdirs[:] = sorted(d for d in subdirs if not os.path.islink(os.path.join(folder, d)))
+        rel = os.path.relpath(folder, base).replace(os.sep, "/")
+        if rel != ".":
+            dirs.append(rel)
+        for name in sorted(names):
+            path = os.path.join(folder, name)
+            rel_path = name if rel == "." else f"{rel}/{name}"
+            if os.path.isfile(path) and not os.path.islink(path) and rel_path not in SKIPPED_FILES:
+                files.append(rel_path)
+    return dirs, files
+
+class _VerifyingReader(io.RawIOBase):
+    """
+    File wrapper that hashes what is read and stops at the size the manifest
+    recorded, so a file changed since it was hashed is caught instead of
+    silently corrupting the archive.
+    """
+
+    def __init__(self, f, path, expected_hash, size):
+        self.f = f
+        self.path = path
+        self.expected_hash = expected_hash
+        self.remaining = size
+        self.digest = hashlib.sha256()
+
+    def readable(self):
+        return True
+
+    def read(self, n=-1):
+        if n is None or n < 0 or n > self.remaining:
+            n = self.remaining
+        chunk = self.f.read(min(n, CHUNK_SIZE))
+        self.digest.update(chunk)
+        self.remaining -= len(chunk)
+        if not chunk and self.remaining:
+            raise ValueError(f"{self.path} changed while it was being exported.")
+        if not self.remaining and self.digest.hexdigest() != self.expected_hash:
+            raise ValueError(f"{self.path} changed while it was being exported.")
+        return chunk
+
+def _copy(src, dst):
+    while True:
+        chunk = src.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        dst.write(chunk)
+
+class _TarWriter:
+    def __init__(self, path, compression):
+        self.archive = tarfile.open(path, f"w|{compression}", format=tarfile.PAX_FORMAT)
+
+    def add(self, name, f, size, mtime):
+        info = tarfile.TarInfo(name)
+        info.size = size
+        info.mtime = mtime
+        info.mode = 0o644
+        self.archive.addfile(info, f)
+
+    def close(self):
+        self.archive.close()
+
+class _ZipWriter:
+    def __init__(self, path):
+        self.archive = zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED)
+
+    def add(self, name, f, size, mtime):
+        info = zipfile.ZipInfo(name, time.localtime(max(mtime, 315532800))[:6])
+        info.compress_type = zipfile.ZIP_DEFLATED
+        with self.archive.open(info, 'w', force_zip64=size >= zipfile.ZIP64_LIMIT) as out:
+            _copy(f, out)
+
+    def close(self):
+        self.archive.close()
+
+def export_project(store, project, archive_path, skip_templates=False):
+    """
+    Writes a project's folder and its assets in the store to a tar or zip
+    archive; the type follows archive_path's extension. With skip_templates,
+    untouched stubs are recorded by template instead of stored.
+    Returns an ArchiveResult.
+    """
+    if project not in store.get_projects():
+        raise ValueError(f"Project '{project}' does not exist.")
+    base = os.path.join(ROOT_DIR, "Projects", project)
+    dirs, files = _walk_project(base)
+    matcher = StubMatcher(project) if skip_templates else None
+
+    entries = []
+    objects = {}  # Hash -> (first file with these contents, size)
+    sizes = {}  # Hash -> size
+    for rel_path in files:
+        path = os.path.join(base, *rel_path.split("/"))
+        mtime = os.path.getmtime(path)
+        digest, size = hash_file(path)
+        stub = None
+        if matcher is not None and rel_path.startswith("ArtDepot/"):
+            stub = matcher.match(rel_path[len("ArtDepot/"):], digest, size)
+        if stub is not None:
+            entries.append({"path": rel_path, "template": stub.template, "suffix": stub.suffix, "mtime": mtime})
+        else:
+            entries.append({"path": rel_path, "hash": digest, "mtime": mtime})
+        sizes[digest] = size
+    if matcher is not None:
+        # Lazy stubs are made again with their marker, if the importing side uses them
+        templated = {e["path"] for e in entries if "template" in e}
+        entries = [e for e in entries if not _is_marker_of(e["path"], templated)]
+    for entry in entries:
+        if "hash" in entry:
+            objects.setdefault(entry["hash"], (os.path.join(base, *entry["path"].split("/")), sizes[entry["hash"]]))
+    manifest = {
+        "version": ARCHIVE_VERSION,
+        "project": project,
+        "assets": store.get_assets(project),
+        "dirs": dirs,
+        "files": entries,
+    }
+
+    compression = archive_format(archive_path)
+    writer = _ZipWriter(archive_path) if compression == "zip" else _TarWriter(archive_path, compression)
+    try:
+        data = json.dumps(manifest, indent=1).encode('utf-8')
+        writer.add(MANIFEST_NAME, io.BytesIO(data), len(data), time.time())
+        for digest, (path, size) in objects.items():
+            with open(path, 'rb') as f:
+                reader = _VerifyingReader(f, path, digest, size)
+                writer.add(f"{OBJECT_DIR}/{digest}", reader, size, os.path.getmtime(path))
+                if reader.remaining or f.read(1):
+                    raise ValueError(f"{path} changed while it was being exported.")
+        writer.close()
+    except BaseException:
+        try:
+            writer.close()
+        except Exception:
+            pass
+        os.remove(archive_path)
+        raise
+    return ArchiveResult(project, len(entries), len(objects),
+                         sum(sizes[e["hash"]] for e in entries if "hash" in e),
+                         sum(size for _, size in objects.values()))
+
+def _is_marker_of(rel_path, paths):
+    folder, _, name = rel_path.rpartition("/")
+    if not (name.startswith(".") and name.endswith(LAZY_STUB_SUFFIX)):
+        return False
+    return f"{folder}/{name[1:-len(LAZY_STUB_SUFFIX)]}" in paths
+
+def _iter_members(archive_path):
+    """
+    Yields (name, file object) for the members of an archive in order.
+    """
+    compression = archive_format(archive_path)
+    if compression == "zip":
+        with zipfile.ZipFile(archive_path) as archive:
+            for info in archive.infolist():
+                if not info.is_dir():
+                    with archive.open(info) as f:
+                        yield info.filename, f
+        return
+    with tarfile.open(archive_path, f"r|{compression}") as archive:
+        for info in archive:
+            if info.isfile():
+                yield info.name, archive.extractfile(info)
+
+def _check_path(rel_path):
+    parts = rel_path.split("/")
+    if rel_path.startswith("/") or "\\" in rel_path or any(p in ("", ".", "..") for p in parts) or ":" in parts[0]:
+        raise ValueError(f"Invalid path '{rel_path}' in archive.")
+    return parts
+
+def _read_manifest(name, f):
+    if name != MANIFEST_NAME:
+        raise ValueError(f"Not a project archive: it should start with {MANIFEST_NAME}.")
+    manifest = json.load(f)
+    if manifest.get("version") != ARCHIVE_VERSION:
+        raise ValueError(f"Unsupported project archive version {manifest.get('version')}.")
+    return manifest
+
+def import_project(store, archive_path, project=None):
+    """
+    Restores a project from an archive made by export_project(), under its
+    own name or the given one, and registers it and its assets in the store.
+    Returns an ArchiveResult.
+    """
+    members = _iter_members(archive_path)
+    try:
+        manifest = _read_manifest(*next(members))
+    except StopIteration:
+        raise ValueError("The archive is empty.")
+    project = project or manifest["project"]
+    if not is_valid_name(project):
+        raise ValueError("Project names can only contain letters, numbers, underscores, and dashes.")
+    target = os.path.join(ROOT_DIR, "Projects", project)
+    if project in store.get_projects() or os.path.exists(target):
+        raise FileExistsError(f"Project '{project}' already exists.")
+
+    by_hash = {}  # Hash -> files with these contents
+    for entry in manifest["files"]:
+        _check_path(entry["path"])
+        if "hash" in entry:
+            by_hash.setdefault(entry["hash"], []).append(entry)
+
+    # Unpack next to the projects so the finished folder can be renamed into place
+    staging = os.path.join(ROOT_DIR, "Projects", f".{project}.{uuid.uuid4().hex[:8]}.importing")
+    os.makedirs(staging)
+    size = stored_size = 0
+    try:
+        for rel in manifest["dirs"]:
+            os.makedirs(os.path.join(staging, *_check_path(rel)), exist_ok=True)
+        for entry in manifest["files"]:
+            if "template" in entry:
+                if os.path.basename(entry["template"]) != entry["template"]:
+                    raise ValueError(f"Invalid template '{entry['template']}' in archive.")
+                path = os.path.join(staging, *entry["path"].split("/"))
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                instantiate_template(entry["template"], path, entry["suffix"])
+                os.utime(path, (entry["mtime"], entry["mtime"]))
+                size += os.path.getsize(path)
+        for name, f in members:
+            digest = name[len(OBJECT_DIR) + 1:]
+            if not name.startswith(OBJECT_DIR + "/") or digest not in by_hash:
+                raise ValueError(f"Unexpected member '{name}' in archive.")
+            first, *others = by_hash.pop(digest)
+            path = os.path.join(staging, *first["path"].split("/"))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            checked = hashlib.sha256()
+            with open(path, 'wb') as out:
+                while True:
+                    chunk = f.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    checked.update(chunk)
+                    out.write(chunk)
+            if checked.hexdigest() != digest:
+                raise ValueError(f"The archive is damaged: {first['path']} does not match its hash.")
+            stored_size += os.path.getsize(path)
+            for entry in [first] + others:
+                copy = os.path.join(staging, *entry["path"].split("/"))
+                if entry is not first:
+                    os.makedirs(os.path.dirname(copy), exist_ok=True)
+                    clone_file(path, copy)
+                os.utime(copy, (entry["mtime"], entry["mtime"]))
+                size += os.path.getsize(copy)
+        if by_hash:
+            raise ValueError(f"The archive is incomplete: {len(by_hash)} file contents are missing.")
+
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        os.rename(staging, target)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    finally:
+        members.close()
+
+    try:
+        with store.transaction():
+            store.add_project(project)
+            for asset in manifest["assets"]:
+                store.add_asset(project, asset["name"], asset["type"])
+    except BaseException:
+        shutil.rmtree(target, ignore_errors=True)
+        raise
+    return ArchiveResult(project, len(manifest["files"]), len({e["hash"] for e in manifest["files"] if "hash" in e}),
+                         size, stored_size)
@@ -0,0 +1,44 @@
+"""
+In-memory index of a project store's assets by (project, category, subtype).
+
+Built from the store on first use for each project, so lookups such as
+"all Character models" never touch the disk.
+"""
+
+class AssetIndex:
+    """
+    Sorted asset names of a ProjectStore, bucketed by project, category and subtype.
+    """
+
+    def __init__(self, store):
+        """
+        Creates an empty index over a store; projects are loaded on demand.
+        """
+        self.store = store
+        self._buckets = {}   # (project, category, subtype) -> sorted asset names
+        self._loaded = set()
+
+    def names(self, project, category, subtype):
+        """
+        Returns the names of a project's assets of the given category and subtype.
+        """
+        if project not in self._loaded:
+            self._load(project)
+        return self._buckets.get((project, category, subtype), [])
+
+    def invalidate(self, project=None):
+        """
+        Drops one project, or every project, so it is reloaded from the store on next use.
+        """
+        projects = set(self._loaded) if project is None else {project}
+        self._loaded -= projects
+        self._buckets = {k: v for k, v in self._buckets.items() if k[0] not in projects}
+
+    def _load(self, project):
+        for asset in self.store.get_assets(project):
+            category, _, subtype = asset.get("type", "").partition("/")
+            self._buckets.setdefault((project, category, subtype), []).append(asset["name"])
+        for key, names in self._buckets.items():
+            if key[0] == project:
+                names.sort(key=str.lower)
+        self._loaded.add(project)
@@ -0,0 +1,219 @@
+import os
+import re
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from core.asset_scan import get_asset_dir, get_asset_key, get_asset_prefix
+from core.audit import resolve_reference
+from core.maya_ascii import rewrite_references
+from core.project_generation import create_project_structure, create_asset_structure, get_reference_key
+from core.reference_index import ReferenceIndex
+from utils.file_utils import ROOT_DIR, BATCH_WORKERS, DEFAULT_PROJECT_TREE, is_valid_name
+
+"""
+Asset operations that keep files, the project store and the reference index in step.
+
+When the store is served by the project service (see pmt_service.py), the
+operations run inside the service, which then notifies every client.
+"""
+
+# Suffixes of the temporary files used while dependents are rewritten
+REWRITE_SUFFIX = ".pmtrename"
+BACKUP_SUFFIX = ".pmtbak"
+
+# Outcome of a rename: the asset's new folder and the dependent files that were rewritten
+RenameResult = namedtuple("RenameResult", ["path", "rewritten"])
+
+def _remote(store):
+    # Stores served by the project service hand these operations to it
+    return getattr(store.backend, "remote", False)
+
+def create_project(store, project, template=DEFAULT_PROJECT_TREE):
+    """
+    Registers a project in the store and creates its folder tree.
+    Returns the project's folder.
+    """
+    if _remote(store):
+        return store.backend.call("ops.create_project", project, template)
+    store.add_project(project)
+    return create_project_structure(project, template)
+
+def rename_project(store, old_name, new_name):
+    """
+    Renames a project in the store, then its folder. If the folder cannot be
+    renamed, the store is renamed back and the error is raised. Returns the
+    project's new folder.
+    """
+    if not is_valid_name(new_name):
+        raise ValueError("Project names can only contain letters, numbers, underscores, and dashes.")
+    old_dir = os.path.join(ROOT_DIR, "Projects", old_name)
+    new_dir = os.path.join(ROOT_DIR, "Projects", new_name)
+    if os.path.exists(new_dir):
+        raise FileExistsError(f"The folder {new_dir} already exists.")
+    # The store decides who wins when two artists rename at once; only then is the folder moved
+    store.rename_project(old_name, new_name)
+    try:
+        os.rename(old_dir, new_dir)
+    except BaseException:
+        store.rename_project(new_name, old_name)
+        raise
+    return new_dir
+
+def create_asset(store, project, asset_type, asset_name, reference=None, index=None):
+    """
+    Creates an asset's folders and stub files, registers it in the store and
+    records its reference in the reference index. Returns the asset's folder.
+    An asset that already exists, in the store or on disk, is left alone and
+    ValueError is raised.
+    """
+    if _remote(store):
+        return store.backend.call("ops.create_asset", project, asset_type, asset_name, reference)
+    if any(asset["name"] == asset_name for asset in store.get_assets(project)):
+        raise ValueError(f"Asset '{asset_name}' already exists in project '{project}'.")
+    if os.path.exists(get_asset_dir(project, asset_type, asset_name)):
+        raise FileExistsError(f"The folder {get_asset_dir(project, asset_type, asset_name)} already exists.")
+    path = create_asset_structure(project, asset_type, asset_name, reference)
+    store.add_asset(project, asset_name, asset_type)
+    target = get_reference_key(asset_type, reference)
+    if target:
+        if index is None:
+            index = ReferenceIndex(project)
+        index.add_reference(get_asset_key(asset_type, asset_name), target)
+        index.save()
+    return path
+
+def _renamed_file(fname, prefix, old_name, new_name):
+    # SM_<old>.ma -> SM_<new>.ma, including the hidden '.SM_<old>.ma.pmtstub' lazy stub marker
+    for lead in ("", "."):
+        stem = f"{lead}{prefix}{old_name}"
+        if fname.startswith(stem) and fname[len(stem):len(stem) + 1] in ("", ".", "_"):
+            return f"{lead}{prefix}{new_name}{fname[len(stem):]}"
+    return None
+
+def _replace_reference(source, path, old_dir, new_dir, file_renames):
+    """
+    Return the rewritten form of a reference path if it points into old_dir, otherwise None.
+    The path keeps its form (relative, absolute, environment variables, separators);
+    only the asset folder and file name components are replaced.
+    """
+    resolved = resolve_reference(source, path)
+    if not resolved.startswith(old_dir + os.sep):
+        return None
+    tail = os.path.relpath(resolved, old_dir).split(os.sep)
+    new_tail = tail[:-1] + [file_renames.get(tail[-1], tail[-1])]
+
+    parts = re.split(r'([/\\])', path)
+    components = parts[::2]
+    count = len(tail) + 1
+    if components[-count:] == [os.path.basename(old_dir)] + tail:
+        components[-count:] = [os.path.basename(new_dir)] + new_tail
+        parts[::2] = components
+        return "".join(parts)
+    # Unusual spelling of the path; write it relative to the referencing file
+    new_resolved = os.path.join(new_dir, *new_tail)
+    return os.path.relpath(new_resolved, os.path.dirname(source)).replace(os.sep, "/")
+
+def _dependent_files(project, key):
+    # Maya files of the asset with the given key
+    asset_dir = os.path.join(ROOT_DIR, "Projects", project, "ArtDepot", *key.split("/"))
+    try:
+        names = os.listdir(asset_dir)
+    except FileNotFoundError:
+        return []
+    return [os.path.join(asset_dir, n) for n in names if n.endswith(".ma")]
+
+def _prepare_rewrite(path, old_dir, new_dir, file_renames):
+    """
+    Write the rewritten contents of a dependent next to it. Returns the
+    temporary file's path, or None if the file has no reference to rewrite.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    new_data = rewrite_references(
+        data, lambda ref: _replace_reference(path, ref, old_dir, new_dir, file_renames))
+    if new_data is None:
+        return None
+    tmp = path + REWRITE_SUFFIX
+    with open(tmp, 'wb') as f:
+        f.write(new_data)
+        f.flush()
+        os.fsync(f.fileno())
+    return tmp
+
+def rename_asset(store, project, asset_type, old_name, new_name, index=None, max_workers=BATCH_WORKERS):
+    """
+    Rename an asset everywhere at once: its folder, its prefixed files, the
+    reference paths in every dependent Maya file, the store entry and the
+    reference index. Dependents are found through the reference index, not
+    by scanning the project.
+
+    Rewritten dependents are prepared as temporary files first, then all
+    changes are applied with renames. If any step fails, every change made
+    so far is undone and the error is raised.
+    """
+    if _remote(store):
+        return RenameResult(*store.backend.call("ops.rename_asset", project, asset_type, old_name, new_name))
+    if not is_valid_name(new_name):
+        raise ValueError("Asset names can only contain letters, numbers, underscores, and dashes.")
+    if any(asset["name"] == new_name for asset in store.get_assets(project)):
+        raise ValueError(f"Asset '{new_name}' already exists in project '{project}'.")
+    old_dir = get_asset_dir(project, asset_type, old_name)
+    new_dir = get_asset_dir(project, asset_type, new_name)
+    if os.path.exists(new_dir):
+        raise FileExistsError(f"The folder {new_dir} already exists.")
+
+    if index is None:
+        index = ReferenceIndex(project)
+    old_key = get_asset_key(asset_type, old_name)
+    new_key = get_asset_key(asset_type, new_name)
+
+    prefix = get_asset_prefix(asset_type)
+    file_renames = {}
+    for fname in os.listdir(old_dir):
+        renamed = _renamed_file(fname, prefix, old_name, new_name)
+        if renamed:
+            file_renames[fname] = renamed
+
+    sources = [path for key in index.dependents(old_key) for path in _dependent_files(project, key)]
+    temps = {}
+    undo = []
+    try:
+        # Nothing visible changes until every dependent has been rewritten
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(
+                lambda path: _prepare_rewrite(path, old_dir, new_dir, file_renames), sources))
+        temps = {path: tmp for path, tmp in zip(sources, results) if tmp}
+
+        os.rename(old_dir, new_dir)
+        undo.append(lambda: os.rename(new_dir, old_dir))
+        for old_file, new_file in file_renames.items():
+            src, dst = os.path.join(new_dir, old_file), os.path.join(new_dir, new_file)
+            os.rename(src, dst)
+            undo.append(lambda src=src, dst=dst: os.rename(dst, src))
+        for path, tmp in temps.items():
+            backup = path + BACKUP_SUFFIX
+            os.replace(path, backup)
+            undo.append(lambda path=path, backup=backup: os.replace(backup, path))
+            os.replace(tmp, path)
+
+        def restore_index():
+            index.rename_asset(new_key, old_key)
+            index.save()
+        index.rename_asset(old_key, new_key)
+        undo.append(restore_index)
+        index.save()
+        store.rename_asset(project, old_name, new_name)
+    except BaseException:
+        for step in reversed(undo):
+            try:
+                step()
+            except OSError:
+                pass
+        for path in sources:
+            if os.path.exists(path + REWRITE_SUFFIX):
+                os.remove(path + REWRITE_SUFFIX)
+        raise
+
+    for path in temps:
+        os.remove(path + BACKUP_SUFFIX)
+    return RenameResult(new_dir, sorted(temps))
@@ -0,0 +1,123 @@
+import os
+import datetime
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from utils.file_utils import ROOT_DIR, SCAN_WORKERS
+
+# File extensions that can hold an asset's main file
+ASSET_EXTENSIONS = (".ma", ".psd", ".txt")
+
+# File name prefix for each asset category
+ASSET_PREFIXES = {
+    "Models": "SM_",
+    "Rigs": "RIG_",
+    "Animations": "A_",
+    "Textures": "T_",
+    "VFX": "VFX_",
+}
+
+# Compact snapshot of one asset row; mtime and size are None when the file can't be stat'ed
+AssetRecord = namedtuple("AssetRecord", ["name", "type", "path", "mtime", "size"], defaults=(None,))
+
+def get_asset_prefix(asset_type):
+    """
+    Return the file name prefix for an asset type such as 'Models/Props'.
+    """
+    return ASSET_PREFIXES.get(asset_type.split("/")[0], "")
+
+def get_category_dir(project, asset_type):
+    """
+    Return the ArtDepot folder that holds all assets of the given type.
+    """
+    return os.path.join(ROOT_DIR, "Projects", project, "ArtDepot", *asset_type.split("/"))
+
+def get_asset_dir(project, asset_type, asset_name):
+    """
+    Return the ArtDepot folder of a single asset.
+    """
+    return os.path.join(get_category_dir(project, asset_type), asset_name)
+
+def get_asset_key(asset_type, asset_name):
+    """
+    Return the key identifying an asset within its project, e.g. 'Rigs/Characters/hero'.
+    """
+    return f"{asset_type}/{asset_name}"
+
+def get_asset_key_for_path(project, path):
+    """
+    Return the key of the asset folder that contains path, or None if
+    path is not inside a Category/Subtype/Name folder of the project's ArtDepot.
+    """
+    art_depot = os.path.join(ROOT_DIR, "Projects", project, "ArtDepot")
+    rel = os.path.relpath(os.path.abspath(path), art_depot)
+    parts = rel.split(os.sep)
+    if len(parts) < 4 or parts[0] == os.pardir:
+        return None
+    return "/".join(parts[:3])
+
+def find_asset_file(asset_dir, asset_type):
+    """
+    Return the path of the asset's main file, or None if the folder or file is missing.
+    """
+    prefix = get_asset_prefix(asset_type)
+    try:
+        names = os.listdir(asset_dir)
+    except OSError:
+        return None
+    for fname in names:
+        if fname.endswith(ASSET_EXTENSIONS) and fname.startswith(prefix):
+            return os.path.join(asset_dir, fname)
+    return None
+
+def scan_asset(project, asset_name, asset_type):
+    """
+    Build an AssetRecord for an asset, or return None if it has no file on disk.
+    """
+    prefix = get_asset_prefix(asset_type)
+    try:
+        # scandir returns the matching entry with its stat info in one pass over the folder
+        with os.scandir(get_asset_dir(project, asset_type, asset_name)) as entries:
+            for entry in entries:
+                if entry.name.endswith(ASSET_EXTENSIONS) and entry.name.startswith(prefix):
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        return AssetRecord(asset_name, asset_type, entry.path, None)
+                    return AssetRecord(asset_name, asset_type, entry.path, st.st_mtime, st.st_size)
+    except OSError:
+        pass
+    return None
+
+def scan_assets(project, assets, batch_size=200, cancelled=None, max_workers=SCAN_WORKERS):
+    """
+    Scan a project's assets on a thread pool and yield AssetRecords in batches.
+    Stops early, dropping pending work, once cancelled() returns True.
+    """
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = [
+            pool.submit(scan_asset, project, asset.get("name"), asset.get("type", "Unknown"))
+            for asset in assets
+        ]
+        batch = []
+        for future in as_completed(futures):
+            if cancelled and cancelled():
+                return
+            record = future.result()
+            if record:
+                batch.append(record)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+def format_mtime(mtime):
+    """
+    Format a modification time for display, or 'File Missing' if there is none.
+    """
+    if mtime is None:
+        return "File Missing"
+    return datetime.datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M')
@@ -0,0 +1,108 @@
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from core.maya_ascii import read_references
+from utils.file_utils import ROOT_DIR, AUDIT_WORKERS, load_data, save_data
+
+"""
+Broken-reference audit of a project's Maya files.
+
+Every .ma under the project's ArtDepot is read for 'file -r' commands and each
+referenced path is checked on disk. Relative paths, such as the ones the rig
+and animation stubs use, are resolved against the referencing file's folder.
+The references read from each file are cached with its mtime and size in the
+project's Config/audit_cache.json, so repeat audits only re-read changed files;
+the referenced files themselves are always checked again.
+"""
+
+# Below this many files to read, a process pool costs more than it saves
+POOL_MIN_FILES = 32
+
+# A reference whose target is missing; resolved is the absolute path that was checked
+BrokenReference = namedtuple("BrokenReference", ["source", "namespace", "path", "resolved"])
+# Outcome of an audit: files checked, files actually read, and the broken references
+AuditResult = namedtuple("AuditResult", ["files", "read", "broken"])
+
+def get_audit_cache_path(project):
+    """
+    Return the path of a project's audit cache.
+    """
+    return os.path.join(ROOT_DIR, "Projects", project, "Config", "audit_cache.json")
+
+def find_maya_files(folder):
+    """
+    Return {path: (mtime_ns, size)} for every .ma file under folder.
+    """
+    found = {}
+    stack = [folder]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except FileNotFoundError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".ma"):
+                    st = entry.stat()
+                    found[entry.path] = (st.st_mtime_ns, st.st_size)
+    return found
+
+def resolve_reference(source, path):
+    """
+    Return the absolute path a reference in source points at.
+    """
+    path = os.path.expandvars(path)
+    if not os.path.isabs(path):
+        path = os.path.join(os.path.dirname(source), path)
+    return os.path.normpath(path)
+
+def _read_all(paths, max_workers):
+    if len(paths) < POOL_MIN_FILES or max_workers <= 1:
+        return [read_references(path) for path in paths]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        chunksize = max(1, len(paths) // (max_workers * 4))
+        return list(pool.map(read_references, paths, chunksize=chunksize))
+
+def audit_project(project, use_cache=True, max_workers=AUDIT_WORKERS):
+    """
+    Audit a project's Maya files for references to missing files.
+    Returns an AuditResult.
+    """
+    art_depot = os.path.join(ROOT_DIR, "Projects", project, "ArtDepot")
+    cache_path = get_audit_cache_path(project)
+    cached = load_data(cache_path).get("files", {}) if use_cache and os.path.exists(cache_path) else {}
+
+    files = find_maya_files(art_depot)
+    references = {}
+    stale = []
+    for path, (mtime, size) in files.items():
+        rel = os.path.relpath(path, art_depot)
+        entry = cached.get(rel)
+        if entry and entry["mtime"] == mtime and entry["size"] == size:
+            references[path] = entry["references"]
+        else:
+            stale.append(path)
+
+    for path, refs in zip(stale, _read_all(stale, max_workers)):
+        references[path] = [list(ref) for ref in refs]
+
+    if stale or len(cached) != len(files):
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        save_data({"files": {
+            os.path.relpath(path, art_depot): {"mtime": mtime, "size": size, "references": references[path]}
+            for path, (mtime, size) in files.items()
+        }}, cache_path)
+
+    broken = []
+    exists = {}
+    for path in sorted(references):
+        for namespace, ref_path in references[path]:
+            resolved = resolve_reference(path, ref_path)
+            if resolved not in exists:
+                exists[resolved] = os.path.exists(resolved)
+            if not exists[resolved]:
+                broken.append(BrokenReference(path, namespace, ref_path, resolved))
+    return AuditResult(len(files), len(stale), broken)
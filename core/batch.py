@@ -0,0 +1,138 @@
+import os
+import csv
+import json
+import shutil
+import argparse
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from core.asset_scan import get_asset_dir
+from core.project_generation import create_project_structure, create_asset_structure
+from core.reference_index import record_asset_references
+from data.project_data import ProjectStore
+from utils.file_utils import BATCH_WORKERS, is_valid_name
+
+"""
+Batch asset creation from a CSV or JSON manifest.
+
+Usage: python -m core.batch manifest.csv
+"""
+
+# Categories that can only be created with a reference to another asset
+REFERENCE_CATEGORIES = ("Rigs", "Animations")
+
+# Outcome of one manifest item; error is None when the item succeeded
+BatchResult = namedtuple("BatchResult", ["item", "error"])
+
+def load_manifest(path):
+    """
+    Load manifest items from a CSV file with project,type,name[,reference]
+    columns, or from a JSON list of objects with the same keys.
+    """
+    if path.lower().endswith(".json"):
+        with open(path, 'r') as f:
+            items = json.load(f)
+        if isinstance(items, dict):
+            items = items.get("assets", [])
+    else:
+        with open(path, 'r', newline='') as f:
+            items = list(csv.DictReader(f))
+    return [{
+        "project": (item.get("project") or "").strip(),
+        "type": (item.get("type") or "").strip(),
+        "name": (item.get("name") or "").strip(),
+        "reference": (item.get("reference") or "").strip() or None,
+    } for item in items]
+
+def validate_item(item):
+    """
+    Return an error message for an invalid manifest item, or None.
+    """
+    if not is_valid_name(item["project"]):
+        return f"Invalid project name '{item['project']}'."
+    if not is_valid_name(item["name"]):
+        return f"Invalid asset name '{item['name']}'."
+    if item["type"].count("/") != 1:
+        return f"Invalid asset type '{item['type']}', expected 'Category/Subtype'."
+    if item["type"].split("/")[0] in REFERENCE_CATEGORIES and not item["reference"]:
+        return "Rigs and Animations require a reference object."
+    return None
+
+def _scaffold(item):
+    try:
+        create_asset_structure(item["project"], item["type"], item["name"], item["reference"])
+    except BaseException:
+        # The folder did not exist before; leave nothing behind so a re-run can retry the item
+        shutil.rmtree(get_asset_dir(item["project"], item["type"], item["name"]), ignore_errors=True)
+        raise
+
+def create_assets_batch(store, items, max_workers=BATCH_WORKERS):
+    """
+    Create many assets at once.
+
+    Missing projects are created first. Asset folders and stub files are
+    then created in parallel on a thread pool, and every asset that was
+    scaffolded successfully is registered in a single store transaction.
+    Assets that already exist, in the store or on disk, are left alone and
+    reported as failed, so a manifest can be re-run after fixing some items.
+    A failing item never aborts the batch; returns one BatchResult per item.
+    """
+    errors = [validate_item(item) for item in items]
+
+    existing = set(store.get_projects())
+    for project in sorted({item["project"] for item, error in zip(items, errors) if error is None}):
+        if project not in existing:
+            create_project_structure(project)
+            store.add_project(project)
+
+    names = {}  # Project -> asset names in the store or earlier in the manifest
+    for i, item in enumerate(items):
+        if errors[i] is not None:
+            continue
+        project_names = names.setdefault(item["project"], {a["name"] for a in store.get_assets(item["project"])})
+        if item["name"] in project_names or os.path.exists(get_asset_dir(item["project"], item["type"], item["name"])):
+            errors[i] = f"Asset '{item['name']}' already exists in project '{item['project']}'."
+        else:
+            project_names.add(item["name"])
+
+    pending = [i for i, error in enumerate(errors) if error is None]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {i: pool.submit(_scaffold, items[i]) for i in pending}
+        for i, future in futures.items():
+            try:
+                future.result()
+            except Exception as e:
+                errors[i] = str(e)
+
+    with store.transaction():
+        for i in pending:
+            if errors[i] is None:
+                item = items[i]
+                store.add_asset(item["project"], item["name"], item["type"])
+
+    # One index load and save per project rather than per asset
+    created = {}
+    for i in pending:
+        if errors[i] is None:
+            item = items[i]
+            created.setdefault(item["project"], []).append((item["type"], item["name"], item["reference"]))
+    for project, assets in created.items():
+        record_asset_references(project, assets)
+
+    return [BatchResult(item, error) for item, error in zip(items, errors)]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Create assets in bulk from a CSV or JSON manifest.")
+    parser.add_argument("manifest", help="CSV or JSON manifest of project, type, name and reference")
+    parser.add_argument("--workers", type=int, default=BATCH_WORKERS, help="number of scaffolding threads")
+    args = parser.parse_args(argv)
+
+    results = create_assets_batch(ProjectStore(), load_manifest(args.manifest), args.workers)
+    failed = [r for r in results if r.error]
+    for result in failed:
+        print(f"FAILED {result.item['project']}/{result.item['type']}/{result.item['name']}: {result.error}")
+    print(f"Created {len(results) - len(failed)} of {len(results)} assets from {os.path.basename(args.manifest)}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
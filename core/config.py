@@ -0,0 +1,257 @@
+import os
+import sys
+import glob
+import json
+import threading
+from collections import OrderedDict
+
+from utils.file_utils import ROOT_DIR, CONFIG_CACHE_SIZE, save_data
+
+"""
+Layered configuration of the studio, its projects and their assets.
+
+The config of a file is DEFAULT_CONFIG with the Config/config.json of the
+studio root (ROOT_DIR), of its project and of its asset merged on top, in
+that order. Each config.json only holds what differs from what its folder
+inherits, so most projects and assets need none at all.
+
+Merged views are kept in an LRU cache and revalidated with one stat per
+layer, so tools and the DCC launcher can query them on every use.
+
+Usage: python -m core.config show <path> | prune
+"""
+
+# Built-in config every layer starts from
+DEFAULT_CONFIG = {
+    "dccs": {
+        "Maya": {
+            "version": "2024",
+            "path": "C:/Program Files/Autodesk/Maya2024/bin/maya.exe"
+        },
+        "Photoshop": {
+            "version": "2023",
+            "path": "C:/Program Files/Adobe/Adobe Photoshop 2023/Photoshop.exe"
+        }
+    },
+    "engines": {
+        "UnrealEngine": {
+            "version": "5.3",
+            "path": "C:/Program Files/Epic Games/UE_5.3/Engine/Binaries/Win64/UE5Editor.exe"
+        }
+    },
+    "tools": {
+        "CustomExporter": {
+            "version": "1.2.0"
+        },
+        "Validator": {
+            "version": "2.0.1"
+        }
+    }
+}
+
+# Location of a layer's config file inside its folder
+CONFIG_FILE = os.path.join("Config", "config.json")
+
+def merge_config(base, override):
+    """
+    Returns base with override merged in. Nested dictionaries are merged key
+    by key; any other value in override replaces the one in base.
+    """
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_config(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+def diff_config(config, base):
+    """
+    Returns the parts of config that differ from base: the smallest override
+    that merge_config() turns base into config with.
+    """
+    diff = {}
+    for key, value in config.items():
+        if key not in base:
+            diff[key] = value
+        elif isinstance(value, dict) and isinstance(base[key], dict):
+            nested = diff_config(value, base[key])
+            if nested:
+                diff[key] = nested
+        elif value != base[key]:
+            diff[key] = value
+    return diff
+
+def config_scopes(path, root_dir=ROOT_DIR):
+    """
+    Returns the folders whose config applies to a file or folder, from the
+    studio root down: the root, then its project and its asset folder if the
+    path lies inside them.
+    """
+    root = os.path.abspath(root_dir)
+    scopes = [root]
+    try:
+        parts = os.path.relpath(os.path.abspath(path), root).split(os.sep)
+    except ValueError:
+        # On another drive than the studio root
+        return scopes
+    if len(parts) >= 2 and parts[0] == "Projects":
+        scopes.append(os.path.join(root, "Projects", parts[1]))
+        if len(parts) >= 6 and parts[2] == "ArtDepot":
+            scopes.append(os.path.join(root, *parts[:6]))
+    return scopes
+
+def _stamp(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+class ConfigResolver:
+    """
+    Resolves the merged config of folders under a studio root and keeps the
+    most recently used views in memory.
+    """
+
+    def __init__(self, root_dir=ROOT_DIR, cache_size=CONFIG_CACHE_SIZE):
+        """
+        Creates an empty cache for the configs under root_dir.
+        """
+        self.root_dir = root_dir
+        self.cache_size = cache_size
+        self._views = OrderedDict()  # Deepest scope folder -> (stamps of its layers, merged config)
+        self._files = OrderedDict()  # config.json path -> (stamp, contents)
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        """
+        Returns the merged config that applies to a file or folder.
+        The dictionary is shared with the cache and must not be modified.
+        """
+        scopes = config_scopes(path, self.root_dir)
+        layers = [os.path.join(scope, CONFIG_FILE) for scope in scopes]
+        stamps = tuple(_stamp(layer) for layer in layers)
+        key = scopes[-1]
+        with self._lock:
+            entry = self._views.get(key)
+            if entry is not None and entry[0] == stamps:
+                self._views.move_to_end(key)
+                return entry[1]
+        merged = DEFAULT_CONFIG
+        for layer, stamp in zip(layers, stamps):
+            if stamp is not None:
+                merged = merge_config(merged, self._read(layer, stamp))
+        with self._lock:
+            self._put(self._views, key, (stamps, merged))
+        return merged
+
+    def get_value(self, path, *keys, default=None):
+        """
+        Returns one value of the config of a file or folder, e.g.
+        get_value(path, "dccs", "Maya", "path"), or default if it isn't set.
+        """
+        value = self.get(path)
+        for key in keys:
+            if not isinstance(value, dict) or key not in value:
+                return default
+            value = value[key]
+        return value
+
+    def write(self, folder, config):
+        """
+        Makes config the config of a studio, project or asset folder by
+        writing only what differs from what the folder inherits. The folder's
+        config.json is removed when nothing differs. Returns the path written,
+        or None.
+        """
+        scopes = config_scopes(folder, self.root_dir)
+        if os.path.abspath(folder) != scopes[-1]:
+            raise ValueError(f"{folder} is not the studio root, a project or an asset folder.")
+        inherited = self.get(os.path.dirname(scopes[-1])) if len(scopes) > 1 else DEFAULT_CONFIG
+        override = diff_config(config, inherited)
+        path = os.path.join(folder, CONFIG_FILE)
+        if not override:
+            if os.path.exists(path):
+                os.remove(path)
+            return None
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        save_data(override, path)
+        return path
+
+    def prune(self):
+        """
+        Rewrites every config.json under the root as its smallest override,
+        removing those that match what they inherit, such as the full copies
+        of DEFAULT_CONFIG older versions wrote for every project and asset.
+        Returns the number of files (rewritten, removed).
+        """
+        root = os.path.abspath(self.root_dir)
+        patterns = [root, os.path.join(root, "Projects", "*"),
+                    os.path.join(root, "Projects", "*", "ArtDepot", "*", "*", "*")]
+        rewritten = removed = 0
+        for pattern in patterns:
+            for path in glob.glob(os.path.join(pattern, CONFIG_FILE)):
+                folder = os.path.dirname(os.path.dirname(path))
+                if self.write(folder, self.get(folder)) is None:
+                    removed += 1
+                else:
+                    rewritten += 1
+        return rewritten, removed
+
+    def _read(self, path, stamp):
+        with self._lock:
+            entry = self._files.get(path)
+            if entry is not None and entry[0] == stamp:
+                self._files.move_to_end(path)
+                return entry[1]
+        try:
+            with open(path, 'r') as f:
+                contents = json.load(f)
+        except ValueError as e:
+            raise ValueError(f"Invalid config file {path}: {e}") from e
+        with self._lock:
+            self._put(self._files, path, (stamp, contents))
+        return contents
+
+    def _put(self, cache, key, value):
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
+# Resolver shared by the whole process
+RESOLVER = ConfigResolver()
+
+def get_config(path):
+    """
+    Returns the merged config of a file or folder under ROOT_DIR (read-only).
+    """
+    return RESOLVER.get(path)
+
+def get_config_value(path, *keys, default=None):
+    """
+    Returns one value of the merged config of a file or folder under ROOT_DIR.
+    """
+    return RESOLVER.get_value(path, *keys, default=default)
+
+def write_config(folder, config):
+    """
+    Stores the config of a studio, project or asset folder as an override (see ConfigResolver.write).
+    """
+    return RESOLVER.write(folder, config)
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["show"] and len(argv) == 2:
+        print(json.dumps(get_config(argv[1]), indent=4))
+    elif argv == ["prune"]:
+        rewritten, removed = RESOLVER.prune()
+        print(f"Rewrote {rewritten} and removed {removed} config files.")
+    else:
+        print("Usage: python -m core.config show <path> | prune", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,218 @@
+import os
+import hashlib
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from core.asset_scan import ASSET_EXTENSIONS, get_asset_key, get_asset_prefix
+from core.project_generation import LAZY_STUB_SUFFIX, STUB_TEMPLATES, get_stub_suffix
+from core.reference_index import ReferenceIndex
+from core.template_cache import TEMPLATES
+from utils.file_utils import ROOT_DIR, HASH_WORKERS, load_data, save_data
+
+"""
+Content hashes of a project's asset files, and detection of untouched stubs.
+
+The sha256 of every file under the project's ArtDepot is kept with its mtime
+and size in the project's Config/content_index.json, so an update only hashes
+files that are new or whose size or mtime changed. Large files, such as
+PSDs, are hashed on a process pool, or on threads inside the GUI, which must
+not fork or spawn copies of itself; hashlib releases the GIL on large reads,
+so threads still hash in parallel.
+
+An asset's main file is an untouched stub while it still holds exactly what
+create_asset_structure() wrote: its category's template, plus the reference
+line for rigs and animations. Lazy stubs that were never opened count as
+untouched too. Reports, exports and backups can leave such assets out.
+"""
+
+# Bytes read at a time while hashing
+CHUNK_SIZE = 1024 * 1024
+# Files at least this large are hashed on the pool; smaller ones on the calling thread
+POOL_MIN_BYTES = 4 * 1024 * 1024
+
+# An untouched stub: the template it was made from and what was appended to it
+TemplateStub = namedtuple("TemplateStub", ["template", "suffix"])
+
+def hash_file(path):
+    """
+    Returns the sha256 hex digest and the size of a file, read in chunks.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+def _find_files(folder):
+    """
+    Return {path relative to folder: (mtime_ns, size)} for every file under
+    folder, lazy stub markers excluded.
+    """
+    found = {}
+    stack = [folder]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except FileNotFoundError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False) and not entry.name.endswith(LAZY_STUB_SUFFIX):
+                    st = entry.stat()
+                    rel = os.path.relpath(entry.path, folder).replace(os.sep, "/")
+                    found[rel] = (st.st_mtime_ns, st.st_size)
+    return found
+
+def _hash_all(paths, sizes, max_workers, processes=True):
+    large = [i for i, size in enumerate(sizes) if size >= POOL_MIN_BYTES]
+    hashes = [None] * len(paths)
+    if len(large) > 1 and max_workers > 1:
+        executor = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        with executor(max_workers=min(max_workers, len(large))) as pool:
+            for i, (digest, _) in zip(large, pool.map(hash_file, [paths[i] for i in large])):
+                hashes[i] = digest
+    for i, path in enumerate(paths):
+        if hashes[i] is None:
+            hashes[i] = hash_file(path)[0]
+    return hashes
+
+class StubMatcher:
+    """
+    Tells whether asset files of a project are still untouched stubs.
+    """
+
+    def __init__(self, project, references=None):
+        """
+        Prepares matching for a project; references is its ReferenceIndex,
+        which gives the reference line a rig or animation stub was made with.
+        """
+        self.project = project
+        self.art_depot = os.path.join(ROOT_DIR, "Projects", project, "ArtDepot")
+        self.references = references if references is not None else ReferenceIndex(project)
+        self._hashes = {}  # (template, suffix) -> sha256 of the stub it makes
+
+    def stub_hash(self, template, suffix=""):
+        """
+        Returns the sha256 of a stub made from template with suffix appended.
+        """
+        key = (template, suffix)
+        if key not in self._hashes:
+            self._hashes[key] = hashlib.sha256(TEMPLATES.get(template) + suffix.encode()).hexdigest()
+        return self._hashes[key]
+
+    def match(self, rel_path, digest, size):
+        """
+        Returns the TemplateStub of a file under ArtDepot, given as
+        'Category/Subtype/Name/file' with its hash and size, or None if it is
+        not an asset's main file or no longer what its stub was.
+        """
+        parts = rel_path.split("/")
+        if len(parts) != 4 or parts[0] not in STUB_TEMPLATES:
+            return None
+        category, subtype, name, file_name = parts
+        asset_type = f"{category}/{subtype}"
+        template = STUB_TEMPLATES[category]
+        extension = os.path.splitext(template)[1]
+        if file_name != f"{get_asset_prefix(asset_type)}{name}{extension}" or extension not in ASSET_EXTENSIONS:
+            return None
+
+        if size == 0:
+            # A lazy stub that was never opened names its template in a marker
+            marker = os.path.join(self.art_depot, category, subtype, name, f".{file_name}{LAZY_STUB_SUFFIX}")
+            try:
+                with open(marker, 'r') as f:
+                    return TemplateStub(f.read().strip(), "")
+            except FileNotFoundError:
+                return None
+
+        suffixes = [""] + [get_stub_suffix(asset_type, key.rsplit("/", 1)[-1])
+                           for key in self.references.references(get_asset_key(asset_type, name))]
+        for suffix in suffixes:
+            if digest == self.stub_hash(template, suffix):
+                return TemplateStub(template, suffix)
+        return None
+
+class ContentIndex:
+    """
+    Content hashes of one project's asset files, stored in its Config/content_index.json.
+    """
+
+    def __init__(self, project):
+        """
+        Loads the content index of a project.
+        """
+        self.project = project
+        self.art_depot = os.path.join(ROOT_DIR, "Projects", project, "ArtDepot")
+        self.path = os.path.join(ROOT_DIR, "Projects", project, "Config", "content_index.json")
+        self._files = {}  # Path under ArtDepot -> [mtime_ns, size, sha256]
+        self._dirty = False
+        if os.path.exists(self.path):
+            self._files = load_data(self.path).get("files", {})
+
+    def save(self):
+        """
+        Writes the index to disk if it changed.
+        """
+        if not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        save_data({"files": self._files}, self.path)
+        self._dirty = False
+
+    def update(self, max_workers=HASH_WORKERS, processes=True):
+        """
+        Hashes the files that are new or changed since the last update and
+        drops the ones that are gone. Large files are hashed on a process
+        pool, or on threads if processes is False. Returns the number of files hashed.
+        """
+        files = _find_files(self.art_depot)
+        stale = [rel for rel, (mtime, size) in files.items()
+                 if self._files.get(rel, [None, None])[:2] != [mtime, size]]
+        paths = [os.path.join(self.art_depot, *rel.split("/")) for rel in stale]
+        hashes = _hash_all(paths, [files[rel][1] for rel in stale], max_workers, processes)
+
+        if stale or len(self._files) != len(files):
+            self._files = {rel: self._files[rel] for rel in files if rel in self._files}
+            for rel, digest in zip(stale, hashes):
+                self._files[rel] = [files[rel][0], files[rel][1], digest]
+            self._dirty = True
+        return len(stale)
+
+    def get_hash(self, rel_path):
+        """
+        Returns the indexed hash of a file under ArtDepot, or None.
+        """
+        entry = self._files.get(rel_path)
+        return entry[2] if entry else None
+
+    def template_stubs(self, matcher=None):
+        """
+        Returns {path under ArtDepot: TemplateStub} for the indexed files that
+        are untouched stubs.
+        """
+        matcher = matcher or StubMatcher(self.project)
+        stubs = {}
+        for rel, (_, size, digest) in self._files.items():
+            stub = matcher.match(rel, digest, size)
+            if stub is not None:
+                stubs[rel] = stub
+        return stubs
+
+def find_template_stubs(project, max_workers=HASH_WORKERS, processes=True):
+    """
+    Updates and saves a project's content index, then returns the keys of
+    its assets whose main file is still an untouched stub, e.g.
+    {'Models/Props/crate': '<path of SM_crate.ma>'}.
+    """
+    index = ContentIndex(project)
+    index.update(max_workers, processes)
+    index.save()
+    return {rel.rsplit("/", 1)[0]: os.path.join(index.art_depot, *rel.split("/"))
+            for rel in index.template_stubs()}
@@ -1,28 +1,284 @@
+import os
+import sys
+import json
+import time
+import shutil
+import socket
+import tempfile
+import threading
 import subprocess
 
+from core.config import RESOLVER
+from utils.file_utils import DCC_CONNECT_TIMEOUT, DCC_STARTUP_TIMEOUT
+
+"""
+Launches DCC applications for asset files and keeps track of the sessions it started.
+
+Executables come from the "dccs" section of the file's merged config (see
+core.config), so a project or asset can point at its own DCC version. A DCC with a
+command port, such as Maya, is asked to open the file in a session that is
+already running instead of cold-starting a new one. A session this launcher
+started that is still starting up gets its files once its port opens.
+"""
+
+# Launch settings of each DCC. A dccs entry in config.json can override any of
+# them. "args" and "open_command" are formatted with {file} and {port}.
+DCC_PROFILES = {
+    "Maya": {
+        "args": ["-file", "{file}", "-command", 'commandPort -name ":{port}" -sourceType "mel";'],
+        "command_port": 7001,
+        # saveChanges() asks before discarding unsaved work in the running session
+        "open_command": 'saveChanges("file -force -open \\"{file}\\"");\n',
+    },
+    "Photoshop": {
+        # Photoshop passes files on to its running instance by itself
+        "args": ["{file}"],
+    },
+}
+
+# DCC that opens each asset file extension
+DCC_BY_EXTENSION = {".ma": "Maya", ".mb": "Maya", ".psd": "Photoshop"}
+
+if sys.platform == "win32":
+    _DETACH = {"creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    _DETACH = {"start_new_session": True}
+
+def get_dcc_settings(dcc, file_path, resolver=RESOLVER):
+    """
+    Returns the launch settings of a DCC for a file: its profile, overridden
+    by the DCC's entry in the file's merged config.
+    """
+    settings = dict(DCC_PROFILES.get(dcc, {"args": ["{file}"]}))
+    settings.update(resolver.get_value(file_path, "dccs", dcc, default={}))
+    return settings
+
+def resolve_executable(dcc, settings):
+    """
+    Returns the executable of a DCC, given as a full path or a program on PATH.
+    """
+    path = settings.get("path")
+    if path and os.path.isfile(path):
+        return path
+    found = shutil.which(path) if path else None
+    if found:
+        return found
+    raise FileNotFoundError(
+        f"{dcc} executable not found at '{path}'. Please set its path in the 'dccs' section of the project's config.json.")
+
+def send_command(port, command, timeout=DCC_CONNECT_TIMEOUT):
+    """
+    Sends a command to a DCC's command port on this machine.
+    Returns False if nothing is listening there.
+    """
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=timeout) as conn:
+            conn.sendall(command.encode('utf-8'))
+            conn.shutdown(socket.SHUT_WR)
+    except OSError:
+        return False
+    return True
+
+def open_with_default(file_path):
+    """
+    Opens a file with the application the operating system associates with it.
+    """
+    if sys.platform == "win32":
+        os.startfile(file_path)
+        return
+    opener = "open" if sys.platform == "darwin" else "xdg-open"
+    if shutil.which(opener) is None:
+        raise FileNotFoundError(f"No application is associated with {file_path}.")
+    subprocess.Popen([opener, file_path], **_DETACH)
+
+class DccSession:
+    """
+    A DCC process started by the launcher.
+    """
+
+    def __init__(self, dcc, process, port):
+        self.dcc = dcc
+        self.process = process
+        self.port = port
+        self.started = time.time()
+        self._pending = []  # Commands waiting for the command port to open
+        self._lock = threading.Lock()
+        self._waiter = None
+
+    @property
+    def pid(self):
+        return self.process.pid
+
+    def is_running(self):
+        return self.process.poll() is None
+
+    def queue(self, command):
+        """
+        Sends a command as soon as the session's command port opens. Commands
+        are dropped if the process exits or the port doesn't open within
+        DCC_STARTUP_TIMEOUT of the launch.
+        """
+        with self._lock:
+            self._pending.append(command)
+            if self._waiter is None:
+                self._waiter = threading.Thread(target=self._deliver, daemon=True)
+                self._waiter.start()
+
+    def _deliver(self):
+        deadline = self.started + DCC_STARTUP_TIMEOUT
+        while self.is_running() and time.time() < deadline:
+            with self._lock:
+                while self._pending and send_command(self.port, self._pending[0]):
+                    self._pending.pop(0)
+                if not self._pending:
+                    self._waiter = None
+                    return
+            time.sleep(0.25)
+        with self._lock:
+            self._pending = []
+            self._waiter = None
+
+class DccLauncher:
+    """
+    Opens files in DCC applications, reusing running sessions where the DCC
+    has a command port, and tracks the processes it starts.
+    """
+
+    def __init__(self, resolver=RESOLVER):
+        """
+        Creates a launcher that reads DCC settings through a ConfigResolver.
+        """
+        self.resolver = resolver
+        self._sessions = {}  # DCC name -> DccSession
+        self._lock = threading.Lock()
+
+    def sessions(self):
+        """
+        Returns the sessions started by this launcher that are still running.
+        """
+        with self._lock:
+            self._reap()
+            return list(self._sessions.values())
+
+    def open(self, file_path, dcc=None):
+        """
+        Opens a file in a DCC, by default the one its extension belongs to.
+        Returns how: "reused" (sent to a running session), "queued" (sent to
+        a session of this launcher once it has started), "launched" or "default"
+        (handed to the operating system).
+        """
+        if dcc is None:
+            dcc = DCC_BY_EXTENSION.get(os.path.splitext(file_path)[1].lower())
+        if dcc is None:
+            open_with_default(file_path)
+            return "default"
+        settings = get_dcc_settings(dcc, file_path, self.resolver)
+        port = settings.get("command_port")
+        with self._lock:
+            self._reap()
+            session = self._sessions.get(dcc)
+            if port and settings.get("open_command"):
+                # Any session listening on the port will do, including one started elsewhere
+                command = settings["open_command"].format(file=file_path.replace("\\", "/"), port=port)
+                if send_command(port, command):
+                    return "reused"
+                if session is not None and session.port == port:
+                    session.queue(command)
+                    return "queued"
+            executable = resolve_executable(dcc, settings)
+            args = [arg.format(file=file_path, port=port) for arg in settings.get("args", ["{file}"])]
+            process = subprocess.Popen([executable] + args, **_DETACH)
+            self._sessions[dcc] = DccSession(dcc, process, port)
+        return "launched"
+
+    def _reap(self):
+        for dcc, session in list(self._sessions.items()):
+            if not session.is_running():
+                del self._sessions[dcc]
+
+_launcher = None
+
+def get_launcher():
+    """
+    Returns the launcher shared by the whole process.
+    """
+    global _launcher
+    if _launcher is None:
+        _launcher = DccLauncher()
+    return _launcher
+
 def open_in_maya(file_path):
     """
     Opens the specified file in Autodesk Maya.
     """
-    try:
-        subprocess.Popen(file_path, shell=True)
-    except:
-        raise FileNotFoundError("Maya executable not found. Please ensure Maya is installed and configured correctly.")
+    return get_launcher().open(file_path, "Maya")
 
 def open_in_photoshop(file_path):
     """
     Opens the specified file in Adobe Photoshop.
     """
-    try:
-        subprocess.Popen(file_path, shell=True)
-    except:
-        raise FileNotFoundError("Photoshop executable not found. Please ensure Photoshop is installed and configured correctly.")
+    return get_launcher().open(file_path, "Photoshop")
 
 def open_in_txt_editor(file_path):
     """
     Opens the specified file in a text editor.
     """
-    try:
-        subprocess.Popen(file_path, shell=True)
-    except:
-        raise FileNotFoundError("Text editor executable not found. Please ensure a text editor is installed and configured correctly.")
+    open_with_default(file_path)
+    return "default"
+
+def selftest():
+    """
+    Opens files through a launcher whose Maya is utils/stub_dcc.py and
+    checks that only one session is started: files opened while it starts
+    up are queued, later ones reuse it, also from a second launcher standing
+    in for another process. Returns a summary dictionary.
+    """
+    stub = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "utils", "stub_dcc.py")
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        from core.config import ConfigResolver
+        log_path = os.path.join(tmp, "stub.log")
+        # A throwaway studio root whose config points Maya at the stub
+        resolver = ConfigResolver(tmp)
+        resolver.write(tmp, {"dccs": {"Maya": {
+            "path": sys.executable,
+            "args": [stub, "--port", "{port}", "--log", log_path, "--startup-delay", "1", "{file}"],
+            "command_port": port,
+        }}})
+        asset_dir = os.path.join(tmp, "Projects", "Stub", "ArtDepot", "Models", "Props", "Scene")
+        files = [os.path.join(asset_dir, f"SM_Scene{i}.ma") for i in range(4)]
+
+        launcher = DccLauncher(resolver)
+        outcomes = [launcher.open(files[0]), launcher.open(files[1])]
+        deadline = time.time() + 10
+        while time.time() < deadline and not send_command(port, ""):
+            time.sleep(0.1)
+        outcomes.append(launcher.open(files[2]))
+        outcomes.append(DccLauncher(resolver).open(files[3]))
+        sessions = launcher.sessions()
+
+        time.sleep(0.5)
+        send_command(port, "quit")
+        for session in sessions:
+            session.process.wait(timeout=10)
+        with open(log_path) as f:
+            events = [json.loads(line) for line in f]
+
+    opened = [e["value"] for e in events if e["event"] == "start"]
+    opened += [f for e in events if e["event"] == "command" for f in files if f.replace("\\", "/") in e["value"]]
+    problems = []
+    if outcomes != ["launched", "queued", "reused", "reused"]:
+        problems.append(f"unexpected outcomes {outcomes}")
+    if len({e["pid"] for e in events}) != 1:
+        problems.append("more than one DCC process was started")
+    if sorted(opened) != sorted(files):
+        problems.append(f"files opened {opened}, expected {files}")
+    return {"outcomes": outcomes, "processes": len({e["pid"] for e in events}), "problems": problems}
+
+if __name__ == "__main__":
+    summary = selftest()
+    print(json.dumps(summary, indent=2))
+    sys.exit(1 if summary["problems"] else 0)
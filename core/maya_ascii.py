@@ -0,0 +1,103 @@
+import re
+import mmap
+
+"""
+Minimal Maya ASCII (.ma) reader for file reference commands.
+
+Only 'file -r ...' commands are parsed; the rest of the scene is skipped.
+Files are memory-mapped and scanned with mmap.find for lines starting with
+'file ', so only those commands are ever decoded and parsed; the node data
+that makes up the bulk of a scene is never turned into Python objects.
+"""
+
+# A double-quoted MEL string or a bare word
+TOKEN_RE = re.compile(r'"((?:[^"\\]|\\.)*)"|([^\s";]+)')
+# A 'file' command up to its terminating semicolon
+FILE_COMMAND_RE = re.compile(rb'file [^;"]*(?:"(?:[^"\\]|\\.)*"[^;"]*)*;')
+# A double-quoted MEL string within a command
+QUOTED_RE = re.compile(rb'"((?:[^"\\]|\\.)*)"')
+
+def parse_reference_command(command, flags=("-r",)):
+    """
+    Parse a 'file' MEL command. Returns (namespace, path) if it is a file
+    reference command ('file -r ...'), otherwise None. Pass flags to also
+    accept other reference commands, such as the '-rdi' reference definitions.
+    """
+    tokens = []
+    quoted = []
+    for match in TOKEN_RE.finditer(command):
+        if match.group(2) is not None:
+            tokens.append(match.group(2))
+            quoted.append(False)
+        else:
+            tokens.append(match.group(1))
+            quoted.append(True)
+    if len(tokens) < 2 or tokens[0] != "file" or not any(f in tokens for f in flags) or not quoted[-1]:
+        return None
+
+    namespace = None
+    for i, token in enumerate(tokens[:-1]):
+        if token in ("-namespace", "-ns"):
+            namespace = tokens[i + 1]
+    return namespace, tokens[-1]
+
+def iter_references(path):
+    """
+    Yield (namespace, path) for each file reference in a .ma file.
+    Commands that Maya wraps over several lines are matched whole.
+    """
+    with open(path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file
+            return
+    with mm:
+        # Maya writes its file commands in the header, but reference lines
+        # appended by the stub generator sit at the end, so search it all
+        pos = 0 if mm[:5] == b"file " else _next_command(mm, 0)
+        while pos != -1:
+            match = FILE_COMMAND_RE.match(mm, pos)
+            if match:
+                reference = parse_reference_command(match.group().decode('utf-8', 'replace'))
+                if reference:
+                    yield reference
+            pos = _next_command(mm, pos)
+
+def _next_command(mm, start):
+    # Offset of the next line starting with 'file ', or -1
+    pos = mm.find(b"\nfile ", start)
+    return pos if pos == -1 else pos + 1
+
+def read_references(path):
+    """
+    Return the list of (namespace, path) file references of a .ma file.
+    """
+    return list(iter_references(path))
+
+def rewrite_references(data, replace_path):
+    """
+    Rewrite the paths of the file references in the contents of a .ma file.
+    replace_path(path) returns the new path of a reference, or None to keep it.
+    Both reference commands and their '-rdi' definitions are rewritten.
+    Returns the new contents, or None if no reference changed.
+    """
+    parts = []
+    last = 0
+    pos = 0 if data[:5] == b"file " else _next_command(data, 0)
+    while pos != -1:
+        match = FILE_COMMAND_RE.match(data, pos)
+        reference = match and parse_reference_command(match.group().decode('utf-8', 'replace'), ("-r", "-rdi"))
+        if reference:
+            new_path = replace_path(reference[1])
+            if new_path is not None and new_path != reference[1]:
+                # The path is the command's last quoted string
+                quoted = list(QUOTED_RE.finditer(data, match.start(), match.end()))[-1]
+                parts.append(data[last:quoted.start(1)])
+                parts.append(new_path.encode('utf-8'))
+                last = quoted.end(1)
+        pos = _next_command(data, pos)
+    if not parts:
+        return None
+    parts.append(data[last:])
+    return b"".join(parts)
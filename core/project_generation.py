@@ -1,55 +1,27 @@
-import os, json
-import shutil
-from utils.file_utils import ensure_dir, ROOT_DIR
-
-def create_project_structure(project="NewProject"):
+import os
+from core.asset_scan import get_asset_prefix
+from core.audit import resolve_reference
+from core.maya_ascii import iter_references
+# DEFAULT_CONFIG moved to core.config and is still importable from here
+from core.config import DEFAULT_CONFIG, write_config
+from core.project_tree import load_tree_plans, run_plan
+from core.template_cache import TEMPLATES
+from utils.file_utils import ensure_dir, clone_file, ROOT_DIR, TEMPLATE_DIR, DEFAULT_PROJECT_TREE, STUB_COPY_MODE
+
+def create_project_structure(project="NewProject", template=DEFAULT_PROJECT_TREE):
     """
     Create the directory structure for a new project under a branch.
 
-    This sets up global Tools and Config folders, then creates a set of
-    predefined subfolders under the specified project directory inside the Projects folder.
+    This sets up global Tools and Config folders, then creates the folders
+    of the given project tree template under the specified project
+    directory inside the Projects folder.
     """
+    studio_plan, project_plan = load_tree_plans(template)
     # Create global Tools and Config directories
-    ensure_dir(os.path.join(ROOT_DIR, "Tools"))
-    ensure_dir(os.path.join(ROOT_DIR, "Config"))
+    run_plan(ROOT_DIR, studio_plan)
 
     base = os.path.join(ROOT_DIR, "Projects", project)
-    # List of subfolders to create within the project
-    subfolders = [
-        "Tools",
-        "Config",
-        "ArtDepot/Models/Characters/Tools",
-        "ArtDepot/Models/Characters/Config",
-        "ArtDepot/Models/Props/Tools",
-        "ArtDepot/Models/Props/Config",
-        "ArtDepot/Models/Environments/Tools",
-        "ArtDepot/Models/Environments/Config",
-        "ArtDepot/Rigs/Characters/Tools",
-        "ArtDepot/Rigs/Characters/Config",
-        "ArtDepot/Rigs/Props/Tools",
-        "ArtDepot/Rigs/Props/Config",
-        "ArtDepot/Animations/Characters/Tools",
-        "ArtDepot/Animations/Characters/Config",
-        "ArtDepot/Animations/Props/Tools",
-        "ArtDepot/Animations/Props/Config",
-        "ArtDepot/Textures/Characters/Tools",
-        "ArtDepot/Textures/Characters/Config",
-        "ArtDepot/Textures/Environments/Tools",
-        "ArtDepot/Textures/Environments/Config",
-        "ArtDepot/Textures/Props/Tools",
-        "ArtDepot/Textures/Props/Config",
-        "ArtDepot/VFX/Tools",
-        "ArtDepot/VFX/Config",
-        "IntermediateDepot/Characters",
-        "IntermediateDepot/Props",
-        "IntermediateDepot/Environments",
-        "IntermediateDepot/Animations",
-        "IntermediateDepot/VFX",
-        "IntermediateDepot/Rigs",
-    ]
-    # Create each subfolder
-    for folder in subfolders:
-        ensure_dir(os.path.join(base, folder))
+    run_plan(base, project_plan)
     inject_config_stub(base)
     return base
 
@@ -90,96 +62,146 @@ def create_asset_structure(project, asset_type, asset_name, reference=None):
 
     return asset_root
 
+# Category that rig and animation stubs reference
+REFERENCE_CATEGORIES = {"Rigs": "Models", "Animations": "Rigs"}
+# Maya reference command added to rig and animation stubs
+REFERENCE_LINE = '\nfile -r -type "mayaAscii" -namespace "{namespace}" "{path}";\n'
+# File template each asset category's stub is made from
+STUB_TEMPLATES = {
+    "Models": "model_template.ma",
+    "Rigs": "rig_template.ma",
+    "Animations": "anim_template.ma",
+    "Textures": "tex_template.psd",
+    "VFX": "vfx_template.txt",
+}
+# Suffix of the hidden marker left next to a lazy stub until it is first opened
+LAZY_STUB_SUFFIX = ".pmtstub"
+
+def _lazy_marker(path):
+    folder, name = os.path.split(path)
+    return os.path.join(folder, f".{name}{LAZY_STUB_SUFFIX}")
+
+def instantiate_template(template_name, to_path, suffix=""):
+    """
+    Create to_path from a file template according to STUB_COPY_MODE.
+
+    "auto" shares blocks with the template where the filesystem supports it,
+    "copy" writes the cached template in one write, and "lazy" leaves an
+    empty placeholder that materialize_stub fills in on first open.
+    Stubs with a suffix (e.g. a reference line) are always written from the
+    cache, template and suffix together in a single write.
+    """
+    if suffix:
+        TEMPLATES.write_stub(template_name, to_path, suffix.encode())
+    elif STUB_COPY_MODE == "lazy":
+        open(to_path, 'w').close()
+        with open(_lazy_marker(to_path), 'w') as f:
+            f.write(template_name)
+    elif STUB_COPY_MODE == "copy":
+        TEMPLATES.write_stub(template_name, to_path)
+    else:
+        clone_file(os.path.join(TEMPLATE_DIR, template_name), to_path)
+
+def materialize_stub(path):
+    """
+    Fill in a lazy stub from its template, and the lazy stubs of the Maya
+    files it references, directly or through other references, so Maya
+    never loads an empty placeholder as a reference. Returns True if the
+    file itself was a lazy stub.
+    """
+    was_stub = _materialize(path)
+    if not path.endswith(".ma"):
+        return was_stub
+    seen = {os.path.normpath(path)}
+    pending = [path]
+    while pending:
+        source = pending.pop()
+        try:
+            references = list(iter_references(source))
+        except OSError:
+            continue
+        for _, reference in references:
+            target = resolve_reference(source, reference)
+            if target in seen or not target.endswith(".ma"):
+                continue
+            seen.add(target)
+            _materialize(target)
+            pending.append(target)
+    return was_stub
+
+def _materialize(path):
+    marker = _lazy_marker(path)
+    try:
+        with open(marker, 'r') as f:
+            template_name = f.read().strip()
+    except FileNotFoundError:
+        return False
+    # Only fill the placeholder if nothing has written to it in the meantime
+    if os.path.getsize(path) == 0:
+        clone_file(os.path.join(TEMPLATE_DIR, template_name), path)
+    os.remove(marker)
+    return True
+
+def get_reference_key(asset_type, reference):
+    """
+    Return the key of the asset a new rig or animation references, or None.
+    """
+    category, _, subtype = asset_type.partition("/")
+    target = REFERENCE_CATEGORIES.get(category)
+    if not target or not reference:
+        return None
+    return f"{target}/{subtype}/{reference}"
+
+def get_stub_suffix(asset_type, reference):
+    """
+    Return what a new rig or animation stub adds to its template: a Maya
+    file reference command to the referenced asset, or "" without one.
+    """
+    category, _, subtype = asset_type.partition("/")
+    target = REFERENCE_CATEGORIES.get(category)
+    if not target or not reference:
+        return ""
+    relative_ref_path = f"../../../{target}/{subtype}/{reference}/{get_asset_prefix(target)}{reference}.ma"
+    return REFERENCE_LINE.format(namespace=reference, path=relative_ref_path)
+
 def create_model_stub(art_depot_path, asset_name):
     """
     Create a Maya ASCII model file from a template in the specified directory.
     """
-    from_path = os.path.join(os.path.dirname(__file__), "..", "file_templates", "model_template.ma")
-    to_path = os.path.join(art_depot_path, f"{asset_name}.ma")
-    shutil.copyfile(from_path, to_path)
+    instantiate_template(STUB_TEMPLATES["Models"], os.path.join(art_depot_path, f"{asset_name}.ma"))
 
 def create_rig_stub(art_depot_path, asset_name, subtype, reference):
     """
     Create a Maya ASCII rig file from a template and optionally reference a model.
     """
-    from_path = os.path.join(os.path.dirname(__file__), "..", "file_templates", "rig_template.ma")
-    from_path = os.path.abspath(from_path)
-    to_path = os.path.join(art_depot_path, f"{asset_name}.ma")
-    shutil.copyfile(from_path, to_path)
-
-    # If a reference is provided, append a Maya file reference command
-    if reference:
-        relative_ref_path = f"../../../Models/{subtype}/{reference}/SM_{reference}.ma"
-        with open(to_path, 'a') as f:
-            f.write(f'\nfile -r -type "mayaAscii" -namespace "{reference}" "{relative_ref_path}";\n')
+    suffix = get_stub_suffix(f"Rigs/{subtype}", reference)
+    instantiate_template(STUB_TEMPLATES["Rigs"], os.path.join(art_depot_path, f"{asset_name}.ma"), suffix)
 
 def create_animation_stub(art_depot_path, asset_name, subtype, reference):
     """
     Create a Maya ASCII animation file from a template and optionally reference a rig.
     """
-    from_path = os.path.join(os.path.dirname(__file__), "..", "file_templates", "anim_template.ma")
-    from_path = os.path.abspath(from_path)
-    to_path = os.path.join(art_depot_path, f"{asset_name}.ma")
-    shutil.copyfile(from_path, to_path)
-
-    # If a reference is provided, append a Maya file reference command
-    if reference:
-        relative_ref_path = f"../../../Rigs/{subtype}/{reference}/RIG_{reference}.ma"
-        with open(to_path, 'a') as f:
-            f.write(f'\nfile -r -type "mayaAscii" -namespace "{reference}" "{relative_ref_path}";\n')
+    suffix = get_stub_suffix(f"Animations/{subtype}", reference)
+    instantiate_template(STUB_TEMPLATES["Animations"], os.path.join(art_depot_path, f"{asset_name}.ma"), suffix)
 
 def create_texture_stub(art_depot_path, asset_name):
     """
     Create a Photoshop texture file from a template in the specified directory.
     """
-    from_path = os.path.join(os.path.dirname(__file__), "..", "file_templates", "tex_template.psd")
-    to_path = os.path.join(art_depot_path, f"{asset_name}.psd")
-    shutil.copyfile(from_path, to_path)
+    instantiate_template(STUB_TEMPLATES["Textures"], os.path.join(art_depot_path, f"{asset_name}.psd"))
 
 def create_vfx_stub(art_depot_path, asset_name):
     """
     Create a VFX stub file in the specified directory.
     """
-    from_path = os.path.join(os.path.dirname(__file__), "..", "file_templates", "vfx_template.txt")
-    to_path = os.path.join(art_depot_path, f"{asset_name}.txt")
-    shutil.copyfile(from_path, to_path)
-
-DEFAULT_CONFIG = {
-    "dccs": {
-        "Maya": {
-            "version": "2024",
-            "path": "C:/Program Files/Autodesk/Maya2024/bin/maya.exe"
-        },
-        "Photoshop": {
-            "version": "2023",
-            "path": "C:/Program Files/Adobe/Adobe Photoshop 2023/Photoshop.exe"
-        }
-    },
-    "engines": {
-        "UnrealEngine": {
-            "version": "5.3",
-            "path": "C:/Program Files/Epic Games/UE_5.3/Engine/Binaries/Win64/UE5Editor.exe"
-        }
-    },
-    "tools": {
-        "CustomExporter": {
-            "version": "1.2.0"
-        },
-        "Validator": {
-            "version": "2.0.1"
-        }
-    }
-}
-
-def inject_config_stub(base_path):
-    config_path = os.path.join(base_path, "Config")
-    os.makedirs(config_path, exist_ok=True)
+    instantiate_template(STUB_TEMPLATES["VFX"], os.path.join(art_depot_path, f"{asset_name}.txt"))
 
-    config_file = os.path.join(config_path, "config.json")
-    if not os.path.exists(config_file):
-        with open(config_file, 'w') as f:
-            json.dump(DEFAULT_CONFIG, f, indent=4)
-        #print(f"Default config written to {config_file}")
-    else:
-        #print(f"Config already exists at {config_file}")
-        return
+def inject_config_stub(base_path, config=None):
+    """
+    Give a project or asset folder its Config folder. A config.json is only
+    written if config differs from what the folder inherits (see core.config),
+    so new projects and assets normally get none.
+    """
+    os.makedirs(os.path.join(base_path, "Config"), exist_ok=True)
+    if config is not None:
+        write_config(base_path, config)
@@ -0,0 +1,103 @@
+import os
+import json
+import errno
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from utils.file_utils import ROOT_DIR, TREE_WORKERS
+
+"""
+Declarative project folder trees.
+
+A tree template is a JSON file with a "studio" tree (created under ROOT_DIR)
+and a "project" tree (created under Projects/<name>). A tree node is either
+an object mapping folder names to child nodes, or a list of leaf folder names.
+Templates are compiled once into a plan: deduplicated folders grouped by
+depth, so every parent is created before its children and each folder costs
+a single mkdir.
+"""
+
+# Built-in templates shipped with the tool
+BUILTIN_TREE_DIR = os.path.join(os.path.dirname(__file__), "..", "file_templates", "project_trees")
+# Studio-defined templates; these take precedence over built-in ones with the same name
+STUDIO_TREE_DIR = os.path.join(ROOT_DIR, "Config", "project_trees")
+
+def list_tree_templates():
+    """
+    Return the names of all available tree templates.
+    """
+    names = set()
+    for folder in (BUILTIN_TREE_DIR, STUDIO_TREE_DIR):
+        if os.path.isdir(folder):
+            names.update(os.path.splitext(f)[0] for f in os.listdir(folder) if f.endswith(".json"))
+    return sorted(names)
+
+def find_tree_template(name):
+    """
+    Return the path of a tree template file, preferring studio templates.
+    """
+    for folder in (STUDIO_TREE_DIR, BUILTIN_TREE_DIR):
+        path = os.path.join(folder, f"{name}.json")
+        if os.path.isfile(path):
+            return os.path.abspath(path)
+    raise FileNotFoundError(f"Project tree template '{name}' not found.")
+
+def compile_tree(tree):
+    """
+    Compile a tree node into a plan: a tuple of levels, each a tuple of
+    relative folder paths, ordered so parents always come before children.
+    """
+    levels = []
+    seen = set()
+
+    def walk(node, parent, depth):
+        children = node.items() if isinstance(node, dict) else ((name, None) for name in node)
+        for name, child in children:
+            path = os.path.join(parent, name)
+            if path not in seen:
+                seen.add(path)
+                while len(levels) <= depth:
+                    levels.append([])
+                levels[depth].append(path)
+            if child:
+                walk(child, path, depth + 1)
+
+    walk(tree or {}, "", 0)
+    return tuple(tuple(level) for level in levels)
+
+@lru_cache(maxsize=None)
+def _load_plans(path, mtime):
+    with open(path, 'r') as f:
+        template = json.load(f)
+    return compile_tree(template.get("studio")), compile_tree(template.get("project"))
+
+def load_tree_plans(name="default"):
+    """
+    Return the compiled (studio plan, project plan) of a tree template.
+    Plans are cached until the template file changes.
+    """
+    path = find_tree_template(name)
+    return _load_plans(path, os.path.getmtime(path))
+
+def _mkdir(path):
+    try:
+        os.mkdir(path)
+    except OSError as e:
+        if e.errno == errno.EEXIST:
+            return
+        if e.errno != errno.ENOENT:
+            raise
+        # The parent vanished or was never created; fall back to the slow path
+        os.makedirs(path, exist_ok=True)
+
+def run_plan(base, plan, max_workers=TREE_WORKERS):
+    """
+    Create every folder of a compiled plan under base.
+    Folders of the same depth are created in parallel on a small thread pool.
+    """
+    os.makedirs(base, exist_ok=True)
+    if not plan:
+        return
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for level in plan:
+            # list() waits for the whole level, so children never race their parents
+            list(pool.map(_mkdir, [os.path.join(base, rel) for rel in level]))
@@ -0,0 +1,173 @@
+import os
+from collections import deque
+
+from core.asset_scan import get_asset_key, get_asset_key_for_path
+from core.maya_ascii import iter_references
+from core.project_generation import get_reference_key
+from utils.file_utils import ROOT_DIR, load_data, save_data
+
+class ReferenceIndex:
+    """
+    Persistent graph of file references between the assets of a project.
+
+    Assets are keyed as 'Category/Subtype/Name' (see get_asset_key). The
+    forward edges (asset -> assets it references) are stored in the
+    project's Config/references.json; reverse edges are rebuilt in memory
+    on load so dependent lookups never touch the disk.
+    """
+
+    def __init__(self, project):
+        """
+        Loads the reference index of a project.
+        """
+        self.project = project
+        self.path = os.path.join(ROOT_DIR, "Projects", project, "Config", "references.json")
+        self._references = {}  # Asset key -> set of keys it references
+        self._dependents = {}  # Asset key -> set of keys that reference it
+        self._mtime = None
+        self.load()
+
+    def load(self):
+        """
+        Reads the index from disk, replacing the in-memory graph.
+        """
+        self._references = {}
+        self._dependents = {}
+        self._mtime = self._file_mtime()
+        data = load_data(self.path) if self._mtime is not None else {}
+        for source, targets in data.get("references", {}).items():
+            for target in targets:
+                self.add_reference(source, target)
+
+    def save(self):
+        """
+        Writes the index to disk.
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        save_data({"references": {k: sorted(v) for k, v in self._references.items() if v}}, self.path)
+        self._mtime = self._file_mtime()
+
+    def is_stale(self):
+        """
+        Returns True if another process saved the index since it was loaded.
+        """
+        return self._file_mtime() != self._mtime
+
+    def _file_mtime(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def add_reference(self, source, target):
+        """
+        Records that asset source references asset target.
+        """
+        self._references.setdefault(source, set()).add(target)
+        self._dependents.setdefault(target, set()).add(source)
+
+    def set_references(self, source, targets):
+        """
+        Replaces everything asset source references.
+        """
+        for target in self._references.pop(source, set()):
+            self._dependents.get(target, set()).discard(source)
+        for target in targets:
+            self.add_reference(source, target)
+
+    def remove_asset(self, key):
+        """
+        Forgets what a deleted asset referenced. References to it are kept,
+        since the dependents' files still point at it.
+        """
+        self.set_references(key, [])
+
+    def rename_asset(self, old_key, new_key):
+        """
+        Moves all edges of an asset to its new key.
+        """
+        references = self._references.pop(old_key, set())
+        dependents = self._dependents.pop(old_key, set())
+        for target in references:
+            self._dependents[target].discard(old_key)
+            self.add_reference(new_key, target)
+        for source in dependents:
+            self._references[source].discard(old_key)
+            self.add_reference(source, new_key)
+
+    def references(self, key):
+        """
+        Returns the assets that asset key references directly.
+        """
+        return sorted(self._references.get(key, ()))
+
+    def dependents(self, key):
+        """
+        Returns the assets that reference asset key directly.
+        """
+        return sorted(self._dependents.get(key, ()))
+
+    def all_dependents(self, key):
+        """
+        Returns every asset that depends on asset key, directly or through
+        other assets (e.g. model -> rigs -> animations).
+        """
+        return self._closure(key, self._dependents)
+
+    def all_references(self, key):
+        """
+        Returns every asset that asset key depends on, directly or indirectly.
+        """
+        return self._closure(key, self._references)
+
+    @staticmethod
+    def _closure(key, edges):
+        seen = set()
+        queue = deque(edges.get(key, ()))
+        while queue:
+            node = queue.popleft()
+            if node in seen or node == key:
+                continue
+            seen.add(node)
+            queue.extend(edges.get(node, ()))
+        return sorted(seen)
+
+    def rebuild(self):
+        """
+        Rebuilds the index by reading the references of every .ma file in
+        the project's ArtDepot. Returns the number of files read.
+        """
+        self._references = {}
+        self._dependents = {}
+        art_depot = os.path.join(ROOT_DIR, "Projects", self.project, "ArtDepot")
+        count = 0
+        for folder, _, files in os.walk(art_depot):
+            for name in files:
+                if not name.endswith(".ma"):
+                    continue
+                path = os.path.join(folder, name)
+                source = get_asset_key_for_path(self.project, path)
+                if source is None:
+                    continue
+                count += 1
+                for _, ref_path in iter_references(path):
+                    target = get_asset_key_for_path(self.project, os.path.join(folder, ref_path))
+                    if target and target != source:
+                        self.add_reference(source, target)
+        return count
+
+def record_asset_references(project, assets):
+    """
+    Add the references of newly created assets to a project's index and save it once.
+    assets is an iterable of (asset_type, asset_name, reference) tuples.
+    """
+    index = ReferenceIndex(project)
+    changed = False
+    for asset_type, asset_name, reference in assets:
+        target = get_reference_key(asset_type, reference)
+        if target:
+            index.add_reference(get_asset_key(asset_type, asset_name), target)
+            changed = True
+    if changed:
+        index.save()
+    return index
@@ -0,0 +1,146 @@
+import os
+import time
+import threading
+
+from core.asset_scan import AssetRecord, get_asset_dir, get_category_dir, scan_assets
+from utils.file_utils import ROOT_DIR, SCAN_WORKERS, load_data, save_data
+
+"""
+Persistent per-project cache of asset file stats.
+
+For every asset the cache keeps the name, size and mtime of its main file.
+The entries of an asset type are trusted for as long as the type's category
+folder keeps the mtime it had when they were scanned, so a refresh of an
+unchanged project costs one stat per category instead of several per asset.
+
+A category folder's mtime changes when asset folders are added, removed or
+renamed in it, but not when an asset's file is edited; those edits are picked
+up by the GUI's file watcher (which updates the cache) or by a full rescan.
+"""
+
+# Category folders modified this recently are not trusted yet: a change made
+# within the same mtime tick as the scan would otherwise go unnoticed
+RACY_WINDOW_NS = 2 * 10**9
+
+class StatCache:
+    """
+    Stat cache of one project, stored in its Config/stat_cache.json.
+    """
+
+    def __init__(self, project):
+        """
+        Loads the stat cache of a project.
+        """
+        self.project = project
+        self.path = os.path.join(ROOT_DIR, "Projects", project, "Config", "stat_cache.json")
+        self._lock = threading.Lock()
+        self._categories = {}  # Asset type -> category folder mtime_ns its entries were scanned at
+        self._entries = {}     # Asset type -> {asset name: [file name, size, mtime] or None}
+        self._dirty = False
+        if os.path.exists(self.path):
+            data = load_data(self.path)
+            self._categories = data.get("categories", {})
+            self._entries = data.get("assets", {})
+
+    def save(self):
+        """
+        Writes the cache to disk if it changed since it was loaded or last saved.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {"categories": dict(self._categories),
+                    "assets": {t: dict(e) for t, e in self._entries.items()}}
+            self._dirty = False
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        save_data(data, self.path)
+
+    def invalidate(self):
+        """
+        Distrusts every entry so the next scan re-stats all asset files.
+        """
+        with self._lock:
+            self._categories = {}
+            self._dirty = True
+
+    def update(self, record):
+        """
+        Stores a freshly scanned AssetRecord.
+        """
+        with self._lock:
+            self._entries.setdefault(record.type, {})[record.name] = [
+                os.path.basename(record.path), record.size, record.mtime]
+            self._dirty = True
+
+    def forget(self, asset_type, asset_name):
+        """
+        Records that an asset has no file on disk.
+        """
+        with self._lock:
+            self._entries.setdefault(asset_type, {})[asset_name] = None
+            self._dirty = True
+
+    def _record(self, asset_type, asset_name, entry):
+        fname, size, mtime = entry
+        path = os.path.join(get_asset_dir(self.project, asset_type, asset_name), fname)
+        return AssetRecord(asset_name, asset_type, path, mtime, size)
+
+    def scan(self, assets, batch_size=200, cancelled=None, max_workers=SCAN_WORKERS):
+        """
+        Yield AssetRecords for a project's store entries in batches, like
+        scan_assets, serving assets of unchanged categories from the cache
+        and scanning the rest. The cache is updated but not saved.
+        """
+        by_type = {}
+        for asset in assets:
+            by_type.setdefault(asset.get("type", "Unknown"), []).append(asset)
+
+        now = time.time_ns()
+        cached = []
+        stale = []
+        checked = {}
+        for asset_type, entries in by_type.items():
+            try:
+                mtime = os.stat(get_category_dir(self.project, asset_type)).st_mtime_ns
+            except OSError:
+                mtime = None
+            known = self._entries.get(asset_type, {})
+            trusted = mtime is not None and self._categories.get(asset_type) == mtime
+            for asset in entries:
+                name = asset.get("name")
+                if trusted and name in known:
+                    if known[name] is not None:
+                        cached.append(self._record(asset_type, name, known[name]))
+                else:
+                    stale.append(asset)
+            checked[asset_type] = mtime if mtime is not None and now - mtime > RACY_WINDOW_NS else None
+
+        for i in range(0, len(cached), batch_size):
+            yield cached[i:i + batch_size]
+
+        found = set()
+        for batch in scan_assets(self.project, stale, batch_size, cancelled, max_workers):
+            for record in batch:
+                self.update(record)
+                found.add((record.type, record.name))
+            yield batch
+        if cancelled and cancelled():
+            return
+
+        with self._lock:
+            for asset in stale:
+                key = (asset.get("type", "Unknown"), asset.get("name"))
+                if key not in found:
+                    self._entries.setdefault(key[0], {})[key[1]] = None
+            # Drop assets that left the store
+            for asset_type in list(self._entries):
+                names = {asset.get("name") for asset in by_type.get(asset_type, ())}
+                if set(self._entries[asset_type]) - names:
+                    self._entries[asset_type] = {n: e for n, e in self._entries[asset_type].items() if n in names}
+                    self._dirty = True
+            for asset_type, mtime in checked.items():
+                if self._categories.get(asset_type) != mtime:
+                    self._categories[asset_type] = mtime
+                    self._dirty = True
+            if stale:
+                self._dirty = True
@@ -0,0 +1,49 @@
+import os
+import threading
+from utils.file_utils import TEMPLATE_DIR
+
+class TemplateCache:
+    """
+    Keeps the contents of file templates in memory.
+    A template is read from disk once and re-read only when its mtime changes.
+    """
+
+    def __init__(self, template_dir=TEMPLATE_DIR):
+        """
+        Initialize an empty cache for the templates in template_dir.
+        """
+        self.template_dir = template_dir
+        self._entries = {}  # Template name -> (mtime_ns, contents)
+        self._lock = threading.Lock()
+
+    def get(self, template_name):
+        """
+        Return the contents of a template as bytes.
+        """
+        path = os.path.join(self.template_dir, template_name)
+        mtime = os.stat(path).st_mtime_ns
+        entry = self._entries.get(template_name)
+        if entry is None or entry[0] != mtime:
+            with open(path, 'rb') as f:
+                contents = f.read()
+            entry = (mtime, contents)
+            with self._lock:
+                self._entries[template_name] = entry
+        return entry[1]
+
+    def write_stub(self, template_name, to_path, suffix=b""):
+        """
+        Write a template followed by suffix to to_path in a single write.
+        """
+        with open(to_path, 'wb') as f:
+            f.write(self.get(template_name) + suffix)
+
+    def clear(self):
+        """
+        Drop all cached templates.
+        """
+        with self._lock:
+            self._entries = {}
+
+# Shared cache used for stub generation
+TEMPLATES = TemplateCache()
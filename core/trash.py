@@ -0,0 +1,266 @@
+import os
+import stat
+import time
+import uuid
+from collections import namedtuple
+
+from core.asset_scan import get_asset_dir, get_asset_key
+from core.reference_index import ReferenceIndex
+from utils.file_utils import ROOT_DIR, TRASH_DIR, load_data, save_data
+
+"""
+Two-step deletion of projects and assets through a trash folder.
+
+Deleting renames the folder into TRASH_DIR, which lives on the same volume,
+so it is instant however large the folder is, and removes it from the store.
+A manifest next to it records what is needed to restore it. The files are
+removed later by purge(), which reports progress and collects errors rather
+than ignoring them.
+
+Restoring and purging each claim an entry by renaming its manifest, so an
+entry is either restored or purged, never both. Once a purge has started,
+the entry can no longer be restored.
+"""
+
+# Suffixes a manifest is renamed to while its entry is purged or restored
+PURGING_SUFFIX = ".purging"
+RESTORING_SUFFIX = ".restoring"
+
+# A deleted project or asset; purging is True once a purge has started on it
+TrashEntry = namedtuple("TrashEntry", ["id", "kind", "project", "type", "name", "path", "deleted_at", "purging"])
+
+# Outcome of a purge: ids of the entries removed and (path, message) pairs of what could not be
+PurgeResult = namedtuple("PurgeResult", ["purged", "errors"])
+
+def _manifest_path(entry_id):
+    return os.path.join(TRASH_DIR, f"{entry_id}.json")
+
+def _trashed_path(entry_id):
+    return os.path.join(TRASH_DIR, entry_id)
+
+def _move_to_trash(manifest, source):
+    """
+    Writes the manifest of a new entry and renames source into the trash.
+    Returns the manifest, or None if source no longer exists.
+    """
+    entry_id = f"{int(time.time())}-{uuid.uuid4().hex[:8]}"
+    manifest = dict(manifest, id=entry_id, path=source, deleted_at=time.time())
+    os.makedirs(TRASH_DIR, exist_ok=True)
+    save_data(manifest, _manifest_path(entry_id))
+    try:
+        os.rename(source, _trashed_path(entry_id))
+    except FileNotFoundError:
+        os.remove(_manifest_path(entry_id))
+        if os.path.lexists(source):
+            raise
+        return None
+    except OSError:
+        os.remove(_manifest_path(entry_id))
+        raise
+    return manifest
+
+def _entry(manifest, purging=False):
+    return TrashEntry(manifest["id"], manifest["kind"], manifest["project"], manifest.get("type"),
+                      manifest.get("name"), manifest["path"], manifest["deleted_at"], purging)
+
+def trash_project(store, project):
+    """
+    Moves a project's folder to the trash and removes it from the store.
+    Returns its TrashEntry, or None if the folder was already gone, in which
+    case only the store entry is removed.
+    """
+    manifest = _move_to_trash(
+        {"kind": "project", "project": project, "assets": store.get_assets(project)},
+        os.path.join(ROOT_DIR, "Projects", project))
+    if manifest is None:
+        store.delete_project(project)
+        return None
+    try:
+        store.delete_project(project)
+    except BaseException:
+        os.rename(_trashed_path(manifest["id"]), manifest["path"])
+        os.remove(_manifest_path(manifest["id"]))
+        raise
+    return _entry(manifest)
+
+def trash_asset(store, project, asset_type, asset_name, index=None):
+    """
+    Moves an asset's folder to the trash, removes it from the store and
+    forgets its references in the project's reference index.
+    Returns its TrashEntry, or None if the folder was already gone, in which
+    case only the store and reference index entries are removed.
+    """
+    if index is None:
+        index = ReferenceIndex(project)
+    key = get_asset_key(asset_type, asset_name)
+    manifest = _move_to_trash(
+        {"kind": "asset", "project": project, "type": asset_type, "name": asset_name,
+         "references": index.references(key)},
+        get_asset_dir(project, asset_type, asset_name))
+    try:
+        store.delete_asset(project, asset_name)
+    except BaseException:
+        if manifest is not None:
+            os.rename(_trashed_path(manifest["id"]), manifest["path"])
+            os.remove(_manifest_path(manifest["id"]))
+        raise
+    index.remove_asset(key)
+    index.save()
+    return _entry(manifest) if manifest is not None else None
+
+def list_trash():
+    """
+    Returns the entries in the trash, oldest first.
+    """
+    try:
+        names = os.listdir(TRASH_DIR)
+    except FileNotFoundError:
+        return []
+    entries = []
+    for name in names:
+        if name.endswith(".json"):
+            purging = False
+        elif name.endswith(".json" + PURGING_SUFFIX):
+            purging = True
+        else:
+            continue
+        try:
+            entries.append(_entry(load_data(os.path.join(TRASH_DIR, name)), purging))
+        except (OSError, ValueError, KeyError):
+            # Claimed or written by another process in the meantime
+            continue
+    return sorted(entries, key=lambda e: e.deleted_at)
+
+def restore(store, entry_id, index=None):
+    """
+    Moves an entry back to where it was deleted from and re-registers it in
+    the store (and, for an asset, its references in the reference index).
+    Returns the restored folder.
+    """
+    manifest_path = _manifest_path(entry_id)
+    try:
+        manifest = load_data(manifest_path) if os.path.exists(manifest_path) else None
+    except ValueError:
+        manifest = None
+    if manifest is None:
+        raise ValueError("This item is no longer in the trash or is being purged.")
+    if os.path.exists(manifest["path"]):
+        raise FileExistsError(f"Cannot restore over {manifest['path']}, which exists again.")
+    project = manifest["project"]
+    if manifest["kind"] == "asset" and project not in store.get_projects():
+        raise ValueError(f"Restore the project '{project}' first.")
+
+    claimed = manifest_path + RESTORING_SUFFIX
+    os.rename(manifest_path, claimed)
+    try:
+        os.makedirs(os.path.dirname(manifest["path"]), exist_ok=True)
+        os.rename(_trashed_path(entry_id), manifest["path"])
+    except BaseException:
+        os.rename(claimed, manifest_path)
+        raise
+
+    if manifest["kind"] == "project":
+        with store.transaction():
+            store.add_project(project)
+            for asset in manifest["assets"]:
+                store.add_asset(project, asset["name"], asset["type"])
+    else:
+        store.add_asset(project, manifest["name"], manifest["type"])
+        if manifest["references"]:
+            if index is None:
+                index = ReferenceIndex(project)
+            index.set_references(get_asset_key(manifest["type"], manifest["name"]), manifest["references"])
+            index.save()
+    os.remove(claimed)
+    return manifest["path"]
+
+def _remove_tree(path, on_file, errors, cancelled):
+    """
+    Deletes a folder bottom-up, calling on_file() after each file. Failures
+    are appended to errors as (path, message) instead of stopping the purge.
+    """
+    def remove(func, target):
+        try:
+            func(target)
+        except PermissionError:
+            # Read-only files can't be deleted on Windows until made writable
+            try:
+                os.chmod(target, stat.S_IWRITE)
+                func(target)
+            except OSError as e:
+                errors.append((target, str(e)))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            errors.append((target, str(e)))
+
+    def remove_dir(target):
+        # A folder that kept a file is reported through that file
+        if not any(p.startswith(target + os.sep) for p, _ in errors):
+            remove(os.rmdir, target)
+
+    for folder, dirs, files in os.walk(path, topdown=False):
+        for name in files:
+            if cancelled and cancelled():
+                return
+            remove(os.remove, os.path.join(folder, name))
+            on_file()
+        for name in dirs:
+            target = os.path.join(folder, name)
+            if os.path.islink(target):
+                # Symlinks to folders are listed as folders but removed like files
+                remove(os.remove, target)
+            else:
+                remove_dir(target)
+    remove_dir(path)
+
+def purge(entry_ids=None, older_than=None, progress=None, cancelled=None):
+    """
+    Deletes trashed entries for good: the given ids, or every entry, or only
+    those deleted more than older_than seconds ago. progress(done, total) is
+    called as files are removed. An entry that fails or is cancelled half way
+    stays claimed and is finished by the next purge. Returns a PurgeResult.
+    """
+    now = time.time()
+    claimed = []
+    for entry in list_trash():
+        if entry_ids is not None and entry.id not in entry_ids:
+            continue
+        if older_than is not None and now - entry.deleted_at < older_than:
+            continue
+        manifest_path = _manifest_path(entry.id)
+        if not entry.purging:
+            try:
+                os.rename(manifest_path, manifest_path + PURGING_SUFFIX)
+            except FileNotFoundError:
+                # Restored or claimed by another purge
+                continue
+        claimed.append(entry.id)
+
+    total = 0
+    for entry_id in claimed:
+        for _, _, files in os.walk(_trashed_path(entry_id)):
+            total += len(files)
+    done = 0
+
+    def on_file():
+        nonlocal done
+        done += 1
+        if progress is not None:
+            progress(done, total)
+
+    purged = []
+    errors = []
+    for entry_id in claimed:
+        if cancelled and cancelled():
+            break
+        entry_errors = []
+        if os.path.lexists(_trashed_path(entry_id)):
+            _remove_tree(_trashed_path(entry_id), on_file, entry_errors, cancelled)
+        errors.extend(entry_errors)
+        if not entry_errors and not os.path.lexists(_trashed_path(entry_id)):
+            os.remove(_manifest_path(entry_id) + PURGING_SUFFIX)
+            purged.append(entry_id)
+    if progress is not None and not (cancelled and cancelled()):
+        progress(total, total)
+    return PurgeResult(purged, errors)
@@ -0,0 +1,400 @@
+import os
+import copy
+import json
+import tempfile
+import threading
+from contextlib import contextmanager
+from utils.file_utils import JOURNAL_COMPACT_OPS, load_data, file_lock, match_file_mode
+
+# Times load() retries when a concurrent compaction swaps the files under it
+LOAD_RETRIES = 5
+
+class Journal:
+    """
+    Write-ahead log of store operations kept next to a JSON snapshot.
+
+    Every operation is appended as one JSON line and fsynced before the call
+    returns. Loading replays the lines newer than the snapshot, and
+    compaction folds them back into the snapshot and trims the log.
+
+    Several processes may share the files. Each entry's sequence number is
+    the store version it creates; writers take the advisory lock (see lock())
+    only while they catch up and append, and readers never lock. A reader
+    notices commits from other processes by stat'ing the two files and
+    replays just the new tail of the journal.
+    """
+
+    def __init__(self, snapshot_path, journal_path):
+        """
+        Initializes the journal for a snapshot file and its log file.
+        """
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path
+        self.lock_path = journal_path + ".lock"
+        self.seq = 0  # Sequence number of the last operation written or replayed
+        self.snapshot_seq = 0  # Sequence number folded into the snapshot
+        self._offset = 0  # Bytes of the journal file already read
+        self._journal_id = None  # (device, inode) of the journal file that was read
+        self._snapshot_stamp = None  # Identity of the snapshot file that was read
+
+    def lock(self):
+        """
+        Returns a context manager holding the writers' advisory lock.
+        """
+        return file_lock(self.lock_path)
+
+    def load(self, apply, repair=False):
+        """
+        Loads the snapshot and replays newer journal entries through
+        apply(data, op, args). Returns the resulting data. With repair, a
+        torn tail left by a crash is cut off; only do that under lock().
+        """
+        for _ in range(LOAD_RETRIES):
+            stamp = self._stat_snapshot()
+            data = load_data(self.snapshot_path)
+            snapshot_seq = data.pop("seq", 0)
+            journal_id, entries, offset = self._read_entries(0, repair)
+            newer = [e for e in entries if e["seq"] > snapshot_seq]
+            # A compaction that replaced the snapshot and then trimmed the journal
+            # between the two reads leaves a gap; read both again
+            if stamp == self._stat_snapshot() and (not newer or newer[0]["seq"] == snapshot_seq + 1):
+                break
+        self.snapshot_seq = self.seq = snapshot_seq
+        for entry in newer:
+            apply(data, entry["op"], entry["args"])
+            self.seq = entry["seq"]
+        self._snapshot_stamp = stamp
+        self._journal_id = journal_id
+        self._offset = offset
+        return data
+
+    def changed(self):
+        """
+        Cheaply checks whether another process committed since the last read.
+        Returns None if nothing changed, "tail" if new entries were appended
+        to the journal, or "reload" if the files were replaced by a compaction.
+        """
+        if self._stat_snapshot() != self._snapshot_stamp:
+            return "reload"
+        try:
+            st = os.stat(self.journal_path)
+        except FileNotFoundError:
+            return None if self._journal_id is None else "reload"
+        if (st.st_dev, st.st_ino) != self._journal_id:
+            return "reload"
+        if st.st_size != self._offset:
+            return "tail"
+        return None
+
+    def read_tail(self, data, apply):
+        """
+        Replays entries appended since the last read into data.
+        Returns the number of entries applied.
+        """
+        journal_id, entries, offset = self._read_entries(self._offset)
+        if journal_id != self._journal_id:
+            return 0
+        applied = 0
+        for entry in entries:
+            if entry["seq"] <= self.seq:
+                continue
+            apply(data, entry["op"], entry["args"])
+            self.seq = entry["seq"]
+            applied += 1
+        self._offset = offset
+        return applied
+
+    @property
+    def pending(self):
+        """
+        Number of operations not yet folded into the snapshot.
+        """
+        return self.seq - self.snapshot_seq
+
+    def append(self, ops):
+        """
+        Appends (op, args) pairs to the journal and fsyncs them as one write.
+        Call under lock() once caught up, so sequence numbers stay unique.
+        An incomplete last line is cut off first: under the lock it can only
+        be left by a writer that crashed mid-append, and entries written after
+        it would otherwise be glued onto it and lost on the next load.
+        """
+        lines = []
+        for op, args in ops:
+            self.seq += 1
+            lines.append(json.dumps({"seq": self.seq, "op": op, "args": list(args)}))
+        if not lines:
+            return
+        payload = ("\n".join(lines) + "\n").encode('utf-8')
+        with open(self.journal_path, 'a+b') as f:
+            self._cut_torn_tail(f)
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+            st = os.fstat(f.fileno())
+        self._journal_id = (st.st_dev, st.st_ino)
+        self._offset = st.st_size
+
+    @staticmethod
+    def _cut_torn_tail(f):
+        """
+        Truncates an open journal after its last complete line.
+        """
+        end = pos = f.seek(0, os.SEEK_END)
+        while pos > 0:
+            step = min(4096, pos)
+            f.seek(pos - step)
+            newline = f.read(step).rfind(b"\n")
+            if newline >= 0:
+                pos += newline + 1 - step
+                break
+            pos -= step
+        if pos != end:
+            f.truncate(pos)
+        f.seek(0, os.SEEK_END)
+
+    def write_snapshot(self, data, seq):
+        """
+        Writes a snapshot of data that includes every operation up to seq to
+        a new temporary file next to the snapshot, and returns its path.
+        Install it with swap_snapshot(); no lock is needed for this part.
+        """
+        folder = os.path.dirname(self.snapshot_path) or "."
+        fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(self.snapshot_path) + ".", suffix=".tmp", dir=folder)
+        snapshot = dict(data)
+        snapshot["seq"] = seq
+        try:
+            with os.fdopen(fd, 'w') as f:
+                match_file_mode(f.fileno(), self.snapshot_path)
+                json.dump(snapshot, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        return temp_path
+
+    def swap_snapshot(self, temp_path, seq):
+        """
+        Installs a snapshot written by write_snapshot() and trims the journal
+        up to seq. If another process replaced the snapshot since it was last
+        read, or the snapshot on disk is already as new, the other compaction
+        wins and this one is dropped. Returns True if the snapshot was installed.
+        """
+        try:
+            with self.lock():
+                if self._stat_snapshot() != self._snapshot_stamp or seq <= self.snapshot_seq:
+                    return False
+                os.replace(temp_path, self.snapshot_path)
+                self._snapshot_stamp = self._stat_snapshot()
+                self.trim(seq)
+            return True
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def trim(self, seq):
+        """
+        Drops journal entries up to seq, once they are safely in the snapshot.
+        Call under lock().
+        """
+        _, entries, _ = self._read_entries(0, repair=True)
+        remaining = [e for e in entries if e["seq"] > seq]
+        temp_path = self.journal_path + ".tmp"
+        read_offset = 0
+        with open(temp_path, 'wb') as f:
+            for entry in remaining:
+                line = (json.dumps(entry) + "\n").encode('utf-8')
+                f.write(line)
+                if entry["seq"] <= self.seq:
+                    # Already replayed here; later entries are read as the new tail
+                    read_offset += len(line)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.journal_path)
+        st = os.stat(self.journal_path)
+        self.snapshot_seq = seq
+        self._journal_id = (st.st_dev, st.st_ino)
+        self._offset = read_offset
+
+    def _stat_snapshot(self):
+        try:
+            st = os.stat(self.snapshot_path)
+        except FileNotFoundError:
+            return None
+        return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def _read_entries(self, offset=0, repair=False):
+        """
+        Reads the complete journal entries from offset on. Returns the
+        journal's (device, inode), the entries and the offset after them.
+        An incomplete last line may still be being written by another
+        process; with repair (under lock()) it is a crash leftover and is cut
+        off so later appends start on a clean line.
+        """
+        try:
+            f = open(self.journal_path, 'rb+' if repair else 'rb')
+        except FileNotFoundError:
+            return None, [], 0
+        entries = []
+        with f:
+            st = os.fstat(f.fileno())
+            f.seek(offset)
+            good_offset = offset
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("incomplete journal line")
+                    entries.append(json.loads(line))
+                except ValueError:
+                    if repair:
+                        f.truncate(good_offset)
+                    break
+                good_offset += len(line)
+        return (st.st_dev, st.st_ino), entries, good_offset
+
+class JournaledDocument:
+    """
+    A JSON document kept in memory and persisted through a Journal.
+
+    Mutations are operations applied by apply(data, op, args). Before an
+    operation is written, check(data, op, args) validates it against the
+    latest committed state: it raises if the operation no longer applies and
+    returns False if it is already reflected there. The journal is folded
+    back into the snapshot in the background once it grows past
+    JOURNAL_COMPACT_OPS entries.
+
+    Writes are optimistic: a commit takes the journal's advisory lock, catches
+    up with operations other processes committed, re-checks its own
+    operations, appends them and releases the lock. Reads never lock;
+    refresh() picks up other processes' commits.
+    """
+
+    def __init__(self, snapshot_path, journal_path, apply, check, defaults):
+        """
+        Loads the snapshot and replays the journal. defaults holds the
+        top-level keys a new document starts with.
+        """
+        self._apply = apply
+        self._check = check
+        self._defaults = defaults
+        self._lock = threading.RLock()
+        self._compactor = None
+        self._depth = 0
+        self._pending_ops = []  # Operations applied inside an open transaction
+        self.journal = Journal(snapshot_path, journal_path)
+        self._reload()
+
+    def _load(self):
+        data = self.journal.load(self._apply)
+        for key, value in self._defaults.items():
+            data.setdefault(key, copy.deepcopy(value))
+        return data
+
+    def _reload(self):
+        self.data = self._load()
+
+    def refresh(self):
+        """
+        Catches up with operations committed by other processes.
+        Costs two stats when nothing changed. Returns True if the data changed.
+        """
+        with self._lock:
+            if self._depth:
+                return False
+            change = self.journal.changed()
+            if change == "tail":
+                return self.journal.read_tail(self.data, self._apply) > 0
+            if change == "reload":
+                self._reload()
+                return True
+            return False
+
+    @contextmanager
+    def transaction(self):
+        """
+        Groups several mutations into one journal write and fsync.
+        If the block fails, the in-memory state is reloaded from disk so
+        none of its mutations are kept. Nested use joins the outer transaction.
+        If another process committed in the meantime, the transaction's
+        operations are re-checked against the new state and nothing is
+        written if one no longer applies.
+        """
+        with self._lock:
+            self._depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._pending_ops = []
+                    self._reload()
+                raise
+            self._depth -= 1
+            if self._depth == 0:
+                ops, self._pending_ops = self._pending_ops, []
+                if ops:
+                    try:
+                        with self.journal.lock():
+                            if self.journal.changed():
+                                # Replay this transaction on top of the other processes' commits
+                                data = self._load()
+                                ops = [(op, args) for op, args in ops if self._check(data, op, args)]
+                                for op, args in ops:
+                                    self._apply(data, op, args)
+                                self.data = data
+                            self.journal.append(ops)
+                    except BaseException:
+                        self._reload()
+                        raise
+        self._maybe_compact()
+
+    def commit(self, op, *args):
+        """
+        Applies an operation in memory and appends it to the journal.
+        Outside a transaction the operation is checked and written under the
+        journal lock, after catching up with other processes' commits.
+        """
+        with self._lock:
+            if self._depth:
+                if self._check(self.data, op, args):
+                    self._apply(self.data, op, args)
+                    self._pending_ops.append((op, args))
+                return
+            with self.journal.lock():
+                self.refresh()
+                if not self._check(self.data, op, args):
+                    return
+                self._apply(self.data, op, args)
+                self.journal.append([(op, args)])
+        self._maybe_compact()
+
+    def save(self):
+        """
+        Folds the journal into the snapshot right away.
+        """
+        with self._lock:
+            self.refresh()
+            temp_path = self.journal.write_snapshot(self.data, self.journal.seq)
+            self.journal.swap_snapshot(temp_path, self.journal.seq)
+
+    def _maybe_compact(self):
+        """
+        Starts a background compaction once enough operations have been journaled.
+        """
+        if self.journal.pending < JOURNAL_COMPACT_OPS:
+            return
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        with self._lock:
+            snapshot = copy.deepcopy(self.data)
+            seq = self.journal.seq
+        # Not a daemon: exiting mid-compaction would leave its temporary snapshot behind
+        self._compactor = threading.Thread(target=self._compact, args=(snapshot, seq))
+        self._compactor.start()
+
+    def _compact(self, snapshot, seq):
+        # The snapshot is written without any lock; only the swap is locked
+        temp_path = self.journal.write_snapshot(snapshot, seq)
+        with self._lock:
+            self.journal.swap_snapshot(temp_path, seq)
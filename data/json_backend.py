@@ -0,0 +1,148 @@
+from data.journal import JournaledDocument
+from data.project_data import StoreConflictError
+from utils.file_utils import DATA_FILE, JOURNAL_FILE
+
+class JsonBackend:
+    """
+    Storage backend keeping all projects in one JSON snapshot plus a write-ahead journal.
+
+    The document, its journal, compaction and the optimistic locking shared
+    with other processes are handled by JournaledDocument; this class maps
+    the store API onto journaled operations.
+    """
+
+    def __init__(self, data_file=DATA_FILE, journal_file=JOURNAL_FILE):
+        """
+        Loads existing data and replays the journal.
+        """
+        self.doc = JournaledDocument(data_file, journal_file, self._apply, self._check, {"projects": {}})
+
+    @property
+    def data(self):
+        return self.doc.data
+
+    @property
+    def journal(self):
+        return self.doc.journal
+
+    def refresh(self):
+        """
+        Catches up with operations committed by other processes.
+        Returns True if the data changed.
+        """
+        return self.doc.refresh()
+
+    def transaction(self):
+        """
+        Groups several mutations into one journal write and fsync.
+        Raises StoreConflictError (and writes nothing) if another process
+        committed a change that one of them no longer applies to.
+        """
+        return self.doc.transaction()
+
+    def save(self):
+        """
+        Folds the journal into the data file right away.
+        """
+        self.doc.save()
+
+    def get_projects(self):
+        return list(self.data["projects"].keys())
+
+    def has_project(self, project):
+        return project in self.data["projects"]
+
+    def get_assets(self, project):
+        return self.data["projects"].get(project, {}).get("assets", [])
+
+    def has_asset(self, project, asset_name, asset_type):
+        return any(a for a in self.get_assets(project) if a["name"] == asset_name and a["type"] == asset_type)
+
+    def add_project(self, project):
+        self._commit("add_project", project)
+
+    def add_asset(self, project, asset_name, asset_type):
+        self._commit("add_asset", project, asset_name, asset_type)
+
+    def rename_project(self, old_name, new_name):
+        self._commit("rename_project", old_name, new_name)
+
+    def delete_project(self, name):
+        self._commit("delete_project", name)
+
+    def rename_asset(self, project, old_name, new_name):
+        self._commit("rename_asset", project, old_name, new_name)
+
+    def delete_asset(self, project, asset_name):
+        self._commit("delete_asset", project, asset_name)
+
+    def _commit(self, op, *args):
+        self.doc.commit(op, *args)
+
+    @staticmethod
+    def _check(data, op, args):
+        """
+        Raises StoreConflictError if an operation no longer applies to data,
+        typically because another process changed the same project first.
+        Returns False if the operation is already reflected in data (another
+        process added the same project or asset), True if it should be applied.
+        """
+        projects = data.get("projects", {})
+        if op == "add_project":
+            return args[0] not in projects
+        if op == "add_asset":
+            project, asset_name, asset_type = args
+            if project not in projects:
+                raise StoreConflictError(f"Project '{project}' no longer exists.")
+            return not any(a["name"] == asset_name and a["type"] == asset_type
+                           for a in projects[project].get("assets", []))
+        elif op == "rename_project":
+            old_name, new_name = args
+            if old_name not in projects:
+                raise StoreConflictError(f"Project '{old_name}' no longer exists.")
+            if new_name in projects:
+                raise StoreConflictError(f"Project '{new_name}' already exists.")
+        elif op == "rename_asset":
+            project, old_name, new_name = args
+            names = {a["name"] for a in projects.get(project, {}).get("assets", [])}
+            if old_name not in names:
+                raise StoreConflictError(f"Asset '{old_name}' no longer exists in project '{project}'.")
+            if new_name in names:
+                raise StoreConflictError(f"Asset '{new_name}' already exists in project '{project}'.")
+        return True
+
+    @staticmethod
+    def _apply(data, op, args):
+        """
+        Applies one journaled operation to a data dictionary.
+        """
+        projects = data.setdefault("projects", {})
+        if op == "add_project":
+            project, = args
+            projects.setdefault(project, {"assets": []})
+        elif op == "add_asset":
+            project, asset_name, asset_type = args
+            projects.setdefault(project, {}).setdefault("assets", []).append({
+                "name": asset_name,
+                "type": asset_type
+            })
+        elif op == "rename_project":
+            old_name, new_name = args
+            if old_name in projects:
+                projects[new_name] = projects.pop(old_name)
+        elif op == "delete_project":
+            name, = args
+            projects.pop(name, None)
+        elif op == "rename_asset":
+            project, old_name, new_name = args
+            for asset in projects.get(project, {}).get("assets", []):
+                if asset["name"] == old_name:
+                    asset["name"] = new_name
+                    break
+        elif op == "delete_asset":
+            project, asset_name = args
+            if project in projects:
+                projects[project]["assets"] = [
+                    a for a in projects[project].get("assets", []) if a["name"] != asset_name]
+        else:
+            raise ValueError(f"Unknown store operation '{op}'.")
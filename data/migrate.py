@@ -0,0 +1,62 @@
+import argparse
+from data.json_backend import JsonBackend
+from data.sqlite_backend import SqliteBackend
+from data.sharded_backend import ShardedBackend
+from utils.file_utils import DATA_FILE, SQLITE_FILE, SHARD_DIR
+
+"""
+Imports an existing project_data.json (and its journal) into the SQLite or sharded store.
+
+Usage: python -m data.migrate [--json PATH] [--to sqlite|sharded] [--db PATH] [--shards DIR]
+"""
+
+def import_json(json_file=DATA_FILE, db_file=SQLITE_FILE):
+    """
+    Copies every project and asset from a JSON data file into a SQLite database.
+    Existing rows are kept, so the import can be re-run safely.
+    Returns the number of projects and assets imported.
+    """
+    return copy_store(JsonBackend(json_file, json_file + ".journal"), SqliteBackend(db_file))
+
+def import_json_to_shards(json_file=DATA_FILE, shard_dir=SHARD_DIR):
+    """
+    Copies every project and asset from a JSON data file into a sharded store.
+    Returns the number of projects and assets imported.
+    """
+    return copy_store(JsonBackend(json_file, json_file + ".journal"), ShardedBackend(shard_dir))
+
+def copy_store(source, target):
+    """
+    Copies every project and asset from one backend into another, skipping
+    what the target already has. Returns the number of projects and assets copied.
+    """
+    project_count = asset_count = 0
+    with target.transaction():
+        for project in source.get_projects():
+            if not target.has_project(project):
+                target.add_project(project)
+            project_count += 1
+            for asset in source.get_assets(project):
+                if not target.has_asset(project, asset["name"], asset["type"]):
+                    target.add_asset(project, asset["name"], asset["type"])
+                asset_count += 1
+    return project_count, asset_count
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import project_data.json into the SQLite or sharded project store.")
+    parser.add_argument("--json", default=DATA_FILE, help="JSON data file to import")
+    parser.add_argument("--to", choices=("sqlite", "sharded"), default="sqlite", help="store to import into")
+    parser.add_argument("--db", default=SQLITE_FILE, help="SQLite database to create or update")
+    parser.add_argument("--shards", default=SHARD_DIR, help="shard folder to create or update")
+    args = parser.parse_args(argv)
+
+    if args.to == "sharded":
+        projects, assets = import_json_to_shards(args.json, args.shards)
+        target = args.shards
+    else:
+        projects, assets = import_json(args.json, args.db)
+        target = args.db
+    print(f"Imported {projects} projects and {assets} assets into {target}")
+
+if __name__ == "__main__":
+    main()
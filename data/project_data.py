@@ -1,89 +1,118 @@
-from utils.file_utils import load_data, save_data
+from utils.file_utils import STORE_BACKEND, SERVICE_MODE
+
+class StoreConflictError(ValueError):
+    """
+    Raised when a change no longer applies because another process changed
+    the same data first, e.g. renaming a project someone else just deleted.
+    """
+
+def create_backend(name=STORE_BACKEND):
+    """
+    Creates the storage backend registered under the given name.
+    """
+    if name == "json":
+        from data.json_backend import JsonBackend
+        return JsonBackend()
+    if name == "sqlite":
+        from data.sqlite_backend import SqliteBackend
+        return SqliteBackend()
+    if name == "sharded":
+        from data.sharded_backend import ShardedBackend
+        return ShardedBackend()
+    raise ValueError(f"Unknown store backend '{name}'.")
 
 class ProjectStore:
     """
     Handles storage and management of project and asset data.
+
+    The data itself lives in a pluggable backend (see create_backend); this
+    class keeps the validation rules so every backend behaves the same.
     """
 
-    def __init__(self):
+    def __init__(self, backend=None):
+        """
+        Initializes the ProjectStore with the given backend, or the configured default.
+        """
+        self.backend = backend if backend is not None else create_backend()
+
+    def transaction(self):
         """
-        Initializes the ProjectStore by loading existing data.
+        Returns a context manager that commits all mutations made inside it at once.
         """
-        self.data = load_data()
-        self.data.setdefault("projects", {})  # Ensure 'projects' key exists
+        return self.backend.transaction()
+
+    def refresh(self):
+        """
+        Picks up changes other processes committed to the shared store.
+        Cheap when nothing changed; returns True if the data changed.
+        """
+        return self.backend.refresh()
 
     def save(self):
         """
         Persists the current state of data to storage.
         """
-        save_data(self.data)
+        self.backend.save()
 
     def get_projects(self):
         """
         Retrieves a list of all project names.
         """
-        return list(self.data.get("projects", {}).keys())
+        return self.backend.get_projects()
 
     def get_assets(self, project):
         """
         Retrieves the list of assets for a given project.
         """
-        return self.data["projects"].get(project, {}).get("assets", [])
+        return self.backend.get_assets(project)
 
     def add_project(self, project):
         """
         Adds a new project if it does not already exist.
         """
-        self.data.setdefault("projects", {})  # Ensure 'projects' key exists
-        self.data["projects"].setdefault(project, {"assets": []})  # Add project if missing
-        self.save()
+        if not self.backend.has_project(project):
+            self.backend.add_project(project)
 
     def add_asset(self, project, asset_name, asset_type):
         """
-        Adds a new asset to a project, avoiding duplicates.
+        Adds a new asset to a project, avoiding duplicates. Raises
+        StoreConflictError if the project is not in the store.
         """
-        self.data["projects"].setdefault(project, {})  # Ensure project exists
-        self.data["projects"][project].setdefault("assets", [])  # Ensure 'assets' list exists
-
-        asset_entry = {
-            "name": asset_name,
-            "type": asset_type
-        }
-
-        # Only add asset if it doesn't already exist in the project
-        if not any(a for a in self.data["projects"][project]["assets"] if a["name"] == asset_name and a["type"] == asset_type):
-            self.data["projects"][project]["assets"].append(asset_entry)
-            self.save()
+        if not self.backend.has_asset(project, asset_name, asset_type):
+            self.backend.add_asset(project, asset_name, asset_type)
 
     def rename_project(self, old_name, new_name):
-        if new_name in self.data["projects"]:
+        if self.backend.has_project(new_name):
             raise ValueError(f"Project '{new_name}' already exists.")
-        self.data["projects"][new_name] = self.data["projects"].pop(old_name)
-        self.save()
+        self.backend.rename_project(old_name, new_name)
 
     def delete_project(self, name):
         """
         Deletes a project and all its associated assets.
         """
-        if name in self.data["projects"]:
-            del self.data["projects"][name]
-            self.save()
+        if self.backend.has_project(name):
+            self.backend.delete_project(name)
 
     def rename_asset(self, project, old_name, new_name):
         """
         Renames an asset within a project.
         """
-        for asset in self.data["projects"].get(project, {}).get("assets", []):
-            if asset["name"] == old_name:
-                asset["name"] = new_name
-                break
-        self.save()
+        self.backend.rename_asset(project, old_name, new_name)
 
     def delete_asset(self, project, asset_name):
         """
         Deletes an asset from a project.
         """
-        self.data["projects"][project]["assets"] = [
-            a for a in self.data["projects"][project]["assets"] if a["name"] != asset_name]
-        self.save()
-                
\ No newline at end of file
+        self.backend.delete_asset(project, asset_name)
+
+def open_store():
+    """
+    Returns a ProjectStore served by the project service when it is running
+    (see pmt_service.py), otherwise one that uses the store files directly.
+    """
+    if SERVICE_MODE != "off":
+        from data.remote_backend import RemoteBackend, ServiceClient
+        client = ServiceClient.connect()
+        if client is not None:
+            return ProjectStore(RemoteBackend(client))
+    return ProjectStore()
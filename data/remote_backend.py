@@ -0,0 +1,268 @@
+import os
+import json
+import socket
+import itertools
+import threading
+from contextlib import contextmanager
+from data.project_data import StoreConflictError
+from utils.file_utils import SERVICE_SOCKET, SERVICE_CONNECT_TIMEOUT, SERVICE_CALL_TIMEOUT
+
+"""
+Client side of the project service (see pmt_service.py).
+
+The service owns the project store and speaks newline-delimited JSON over a
+Unix socket. A request is {"id": n, "method": name, "params": [...]} and is
+answered by {"id": n, "result": value} or {"id": n, "error": {"type", "message"}}.
+Messages without an id are events pushed to every client, such as
+{"event": "changed"} after any change to the store.
+"""
+
+class ServiceError(OSError):
+    """
+    Raised when the project service can't be reached or fails unexpectedly.
+    """
+
+# Exceptions that cross the socket by name and are raised again as the same type
+ERROR_TYPES = {cls.__name__: cls for cls in (
+    StoreConflictError, ValueError, FileExistsError, FileNotFoundError, PermissionError, OSError, ServiceError)}
+
+def encode_message(message):
+    """
+    Returns a protocol message as one line of UTF-8 JSON.
+    """
+    return (json.dumps(message) + "\n").encode('utf-8')
+
+def error_type(error):
+    """
+    Returns the name an exception is sent under: the closest type in ERROR_TYPES.
+    """
+    for cls in type(error).__mro__:
+        if cls.__name__ in ERROR_TYPES:
+            return cls.__name__
+    return ServiceError.__name__
+
+class ServiceClient:
+    """
+    Connection to the project service. Calls may come from any thread; a
+    reader thread matches responses to their requests and hands events to
+    the listeners, on the reader thread.
+    """
+
+    def __init__(self, sock):
+        """
+        Starts reading from a connected socket.
+        """
+        self._sock = sock
+        self._ids = itertools.count(1)
+        self._send_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._pending = {}  # Request id -> [threading.Event, response]
+        self._listeners = []
+        self.closed = False
+        self._reader = threading.Thread(target=self._read, daemon=True)
+        self._reader.start()
+
+    @classmethod
+    def connect(cls, path=SERVICE_SOCKET, timeout=SERVICE_CONNECT_TIMEOUT):
+        """
+        Connects to the service listening on path. Returns None if it isn't running.
+        """
+        if not hasattr(socket, "AF_UNIX") or not os.path.exists(path):
+            return None
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        try:
+            sock.connect(path)
+        except OSError:
+            sock.close()
+            return None
+        sock.settimeout(None)
+        return cls(sock)
+
+    def add_listener(self, callback):
+        """
+        Calls callback(message) for every event the service pushes. When the
+        connection drops, callback receives {"event": "closed"}.
+        """
+        self._listeners.append(callback)
+
+    def call(self, method, *params, timeout=SERVICE_CALL_TIMEOUT):
+        """
+        Sends a request and waits for its result. Errors raised in the service
+        are raised here with the same type where possible. If the service
+        doesn't answer within timeout seconds, for instance because it is busy
+        with another client's slow operation, the connection is closed and
+        ServiceError is raised, so the caller can use the store files instead.
+        """
+        request_id = next(self._ids)
+        slot = [threading.Event(), None]
+        with self._pending_lock:
+            if self.closed:
+                raise ServiceError("The connection to the project service is closed.")
+            self._pending[request_id] = slot
+        try:
+            with self._send_lock:
+                self._sock.sendall(encode_message({"id": request_id, "method": method, "params": list(params)}))
+        except OSError as e:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+            raise ServiceError(f"Could not reach the project service: {e}") from e
+        if not slot[0].wait(timeout):
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+            self.close()
+            raise ServiceError(f"The project service did not answer '{method}' within {timeout:g} seconds.")
+        response = slot[1]
+        if "error" in response:
+            error = response["error"]
+            raise ERROR_TYPES.get(error["type"], ServiceError)(error["message"])
+        return response.get("result")
+
+    def close(self):
+        """
+        Closes the connection; pending calls fail with ServiceError.
+        """
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+        self._reader.join()
+
+    def _read(self):
+        try:
+            with self._sock.makefile('rb') as f:
+                for line in f:
+                    message = json.loads(line)
+                    if "id" in message:
+                        with self._pending_lock:
+                            slot = self._pending.pop(message["id"], None)
+                        if slot is not None:
+                            slot[1] = message
+                            slot[0].set()
+                    else:
+                        self._notify(message)
+        except (OSError, ValueError):
+            pass
+        with self._pending_lock:
+            self.closed = True
+            pending, self._pending = self._pending, {}
+        for slot in pending.values():
+            slot[1] = {"error": {"type": ServiceError.__name__,
+                                 "message": "The project service closed the connection."}}
+            slot[0].set()
+        self._notify({"event": "closed"})
+
+    def _notify(self, message):
+        for callback in list(self._listeners):
+            callback(message)
+
+class RemoteBackend:
+    """
+    Storage backend that forwards every call to the project service.
+
+    refresh() never touches the disk: the service pushes an event after each
+    change, from any client or from processes using the files directly, and
+    refresh() reports whether one arrived since the last call. Mutations made
+    inside a transaction are sent together when it ends and committed in one
+    service-side transaction; reads inside it don't see them yet.
+    """
+
+    # Lets operations that the service runs itself (see core.asset_ops) delegate to it
+    remote = True
+
+    def __init__(self, client):
+        """
+        Wraps a connected ServiceClient.
+        """
+        self.client = client
+        self._changed = threading.Event()
+        self._depth = 0
+        self._batch = None  # [method, params] pairs of the open transaction
+        client.add_listener(self._on_event)
+
+    def _on_event(self, message):
+        if message.get("event") in ("changed", "closed"):
+            self._changed.set()
+
+    def add_listener(self, callback):
+        """
+        Calls callback(message) on a background thread for every pushed event.
+        """
+        self.client.add_listener(callback)
+
+    def call(self, method, *params):
+        """
+        Runs one of the service's methods.
+        """
+        return self.client.call(method, *params)
+
+    @contextmanager
+    def transaction(self):
+        """
+        Sends the mutations made inside the block as one batch. If the block
+        fails nothing is sent. Nested use joins the outer transaction.
+        """
+        self._depth += 1
+        if self._depth == 1:
+            self._batch = []
+        try:
+            yield self
+        except BaseException:
+            self._depth -= 1
+            if self._depth == 0:
+                self._batch = None
+            raise
+        self._depth -= 1
+        if self._depth == 0:
+            batch, self._batch = self._batch, None
+            if batch:
+                self.client.call("batch", batch)
+
+    def refresh(self):
+        """
+        Returns True if the service reported a change since the last call.
+        """
+        if self._changed.is_set():
+            self._changed.clear()
+            return True
+        return False
+
+    def save(self):
+        self.client.call("save")
+
+    def get_projects(self):
+        return self.client.call("get_projects")
+
+    def has_project(self, project):
+        return self.client.call("has_project", project)
+
+    def get_assets(self, project):
+        return self.client.call("get_assets", project)
+
+    def has_asset(self, project, asset_name, asset_type):
+        return self.client.call("has_asset", project, asset_name, asset_type)
+
+    def add_project(self, project):
+        self._commit("add_project", project)
+
+    def add_asset(self, project, asset_name, asset_type):
+        self._commit("add_asset", project, asset_name, asset_type)
+
+    def rename_project(self, old_name, new_name):
+        self._commit("rename_project", old_name, new_name)
+
+    def delete_project(self, name):
+        self._commit("delete_project", name)
+
+    def rename_asset(self, project, old_name, new_name):
+        self._commit("rename_asset", project, old_name, new_name)
+
+    def delete_asset(self, project, asset_name):
+        self._commit("delete_asset", project, asset_name)
+
+    def _commit(self, method, *params):
+        if self._batch is not None:
+            self._batch.append([method, list(params)])
+        else:
+            self.client.call(method, *params)
@@ -0,0 +1,271 @@
+import os
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager, ExitStack
+from data.journal import JournaledDocument
+from data.project_data import StoreConflictError
+from utils.file_utils import SHARD_DIR, SHARD_CACHE_SIZE, save_data
+
+class ShardedBackend:
+    """
+    Storage backend keeping one small journaled JSON shard per project.
+
+    A catalog document maps project names to shard ids; a project's shard
+    holds its assets and is only read when the project is first used, so
+    startup cost and memory don't grow with the number of projects. Asset
+    writes only touch their project's shard, and renaming a project only
+    touches the catalog. At most SHARD_CACHE_SIZE shards stay loaded.
+
+    Each document is a JournaledDocument, so shards get the same journaling,
+    compaction and optimistic locking as the single-file JSON backend.
+    """
+
+    def __init__(self, shard_dir=SHARD_DIR):
+        """
+        Loads the project catalog; shards are loaded on demand.
+        """
+        self.shard_dir = shard_dir
+        os.makedirs(os.path.join(shard_dir, "projects"), exist_ok=True)
+        catalog_file = os.path.join(shard_dir, "catalog.json")
+        self.catalog = JournaledDocument(
+            catalog_file, catalog_file + ".journal", self._apply_catalog, self._check_catalog, {"projects": {}})
+        self._shards = OrderedDict()  # Shard id -> JournaledDocument, least recently used first
+        self._depth = 0
+        self._stack = None  # Open shard transactions while a transaction is active
+        self._in_transaction = set()
+        self._removed_shards = []
+        self._created_shards = []  # Shards written for projects added in the open transaction
+
+    def _shard_file(self, shard_id):
+        return os.path.join(self.shard_dir, "projects", f"{shard_id}.json")
+
+    def _shard(self, project):
+        """
+        Returns the loaded shard of a project, or None if the project doesn't exist.
+        Inside a transaction the shard joins it.
+        """
+        if not self._depth:
+            self.catalog.refresh()
+        shard_id = self.catalog.data["projects"].get(project)
+        if shard_id is None:
+            return None
+        doc = self._shards.get(shard_id)
+        if doc is None:
+            shard_file = self._shard_file(shard_id)
+            doc = JournaledDocument(
+                shard_file, shard_file + ".journal", self._apply_shard, self._check_shard, {"assets": []})
+            self._shards[shard_id] = doc
+        self._shards.move_to_end(shard_id)
+        if self._stack is not None and shard_id not in self._in_transaction:
+            self._stack.enter_context(doc.transaction())
+            self._in_transaction.add(shard_id)
+        self._evict()
+        return doc
+
+    def _evict(self):
+        for shard_id in list(self._shards):
+            if len(self._shards) <= SHARD_CACHE_SIZE:
+                break
+            if shard_id not in self._in_transaction:
+                del self._shards[shard_id]
+
+    def _remove_shard_files(self, shard_id):
+        self._shards.pop(shard_id, None)
+        shard_file = self._shard_file(shard_id)
+        for path in (shard_file, shard_file + ".journal", shard_file + ".journal.lock"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    @contextmanager
+    def transaction(self):
+        """
+        Groups mutations into one journal write per touched document.
+        The catalog commits first and the shards after it, so assets are
+        never written to a shard the catalog doesn't point at; a transaction
+        spanning several projects is still not atomic as a whole. If another
+        process added a project of the same name first, StoreConflictError
+        is raised and none of the shards commit. Nested use joins the outer
+        transaction.
+        """
+        if self._depth:
+            self._depth += 1
+            try:
+                yield self
+            finally:
+                self._depth -= 1
+            return
+        self._depth = 1
+        self._removed_shards = []
+        self._created_shards = []
+        committed = False
+        try:
+            with ExitStack() as stack:
+                # Shard transactions join the stack as they are used and commit when it closes
+                self._stack = stack
+                with self.catalog.transaction():
+                    yield self
+                shard_ids = set(self.catalog.data["projects"].values())
+                lost = [shard_id for shard_id in self._created_shards
+                        if shard_id not in shard_ids and shard_id not in self._removed_shards]
+                if lost:
+                    raise StoreConflictError("A project added in this transaction was added by someone else first.")
+            committed = True
+        finally:
+            self._depth = 0
+            self._stack = None
+            self._in_transaction = set()
+            removed, self._removed_shards = self._removed_shards, []
+            created, self._created_shards = self._created_shards, []
+            self._evict()
+            if not committed:
+                # Shards created for projects the catalog never recorded
+                shard_ids = set(self.catalog.data["projects"].values())
+                for shard_id in created:
+                    if shard_id not in shard_ids:
+                        self._remove_shard_files(shard_id)
+        for shard_id in removed:
+            self._remove_shard_files(shard_id)
+
+    def refresh(self):
+        """
+        Catches up the catalog and the loaded shards with other processes'
+        commits. Returns True if anything changed.
+        """
+        changed = self.catalog.refresh()
+        for doc in list(self._shards.values()):
+            changed = doc.refresh() or changed
+        return changed
+
+    def save(self):
+        """
+        Folds the journals of the catalog and the loaded shards into their snapshots.
+        """
+        self.catalog.save()
+        for doc in list(self._shards.values()):
+            doc.save()
+
+    def get_projects(self):
+        return list(self.catalog.data["projects"].keys())
+
+    def has_project(self, project):
+        return project in self.catalog.data["projects"]
+
+    def get_assets(self, project):
+        doc = self._shard(project)
+        return doc.data["assets"] if doc is not None else []
+
+    def has_asset(self, project, asset_name, asset_type):
+        return any(a for a in self.get_assets(project) if a["name"] == asset_name and a["type"] == asset_type)
+
+    def add_project(self, project):
+        shard_id = uuid.uuid4().hex[:16]
+        self.catalog.commit("add_project", project, shard_id)
+        if self.catalog.data["projects"].get(project) == shard_id:
+            save_data({"assets": [], "seq": 0}, self._shard_file(shard_id))
+            if self._depth:
+                self._created_shards.append(shard_id)
+
+    def add_asset(self, project, asset_name, asset_type):
+        self._require_shard(project).commit("add_asset", asset_name, asset_type)
+
+    def rename_project(self, old_name, new_name):
+        self.catalog.commit("rename_project", old_name, new_name)
+
+    def delete_project(self, name):
+        shard_id = self.catalog.data["projects"].get(name)
+        self.catalog.commit("delete_project", name)
+        if shard_id is None:
+            return
+        if self._depth:
+            # Keep the files until the catalog no longer points at them
+            self._removed_shards.append(shard_id)
+        else:
+            self._remove_shard_files(shard_id)
+
+    def rename_asset(self, project, old_name, new_name):
+        self._require_shard(project).commit("rename_asset", old_name, new_name)
+
+    def delete_asset(self, project, asset_name):
+        doc = self._shard(project)
+        if doc is not None:
+            doc.commit("delete_asset", asset_name)
+
+    def _require_shard(self, project):
+        doc = self._shard(project)
+        if doc is None:
+            raise StoreConflictError(f"Project '{project}' no longer exists.")
+        return doc
+
+    @staticmethod
+    def _check_catalog(data, op, args):
+        """
+        Validates a catalog operation against the latest catalog (see JournaledDocument).
+        """
+        projects = data["projects"]
+        if op == "add_project":
+            return args[0] not in projects
+        if op == "rename_project":
+            old_name, new_name = args
+            if old_name not in projects:
+                raise StoreConflictError(f"Project '{old_name}' no longer exists.")
+            if new_name in projects:
+                raise StoreConflictError(f"Project '{new_name}' already exists.")
+        return True
+
+    @staticmethod
+    def _apply_catalog(data, op, args):
+        """
+        Applies one journaled catalog operation.
+        """
+        projects = data.setdefault("projects", {})
+        if op == "add_project":
+            project, shard_id = args
+            projects.setdefault(project, shard_id)
+        elif op == "rename_project":
+            old_name, new_name = args
+            if old_name in projects:
+                projects[new_name] = projects.pop(old_name)
+        elif op == "delete_project":
+            name, = args
+            projects.pop(name, None)
+        else:
+            raise ValueError(f"Unknown catalog operation '{op}'.")
+
+    @staticmethod
+    def _check_shard(data, op, args):
+        """
+        Validates a shard operation against the latest shard (see JournaledDocument).
+        """
+        assets = data["assets"]
+        if op == "add_asset":
+            asset_name, asset_type = args
+            return not any(a["name"] == asset_name and a["type"] == asset_type for a in assets)
+        if op == "rename_asset":
+            old_name, new_name = args
+            names = {a["name"] for a in assets}
+            if old_name not in names:
+                raise StoreConflictError(f"Asset '{old_name}' no longer exists.")
+            if new_name in names:
+                raise StoreConflictError(f"Asset '{new_name}' already exists.")
+        return True
+
+    @staticmethod
+    def _apply_shard(data, op, args):
+        """
+        Applies one journaled shard operation.
+        """
+        assets = data.setdefault("assets", [])
+        if op == "add_asset":
+            asset_name, asset_type = args
+            assets.append({"name": asset_name, "type": asset_type})
+        elif op == "rename_asset":
+            old_name, new_name = args
+            for asset in assets:
+                if asset["name"] == old_name:
+                    asset["name"] = new_name
+                    break
+        elif op == "delete_asset":
+            asset_name, = args
+            assets[:] = [a for a in assets if a["name"] != asset_name]
+        else:
+            raise ValueError(f"Unknown shard operation '{op}'.")
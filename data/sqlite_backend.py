@@ -0,0 +1,171 @@
+import sqlite3
+from contextlib import contextmanager
+from data.project_data import StoreConflictError
+from utils.file_utils import SQLITE_FILE
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS assets (
+    id INTEGER PRIMARY KEY,
+    project_id INTEGER NOT NULL REFERENCES projects(id),
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    UNIQUE (project_id, name, type)
+);
+"""
+
+class SqliteBackend:
+    """
+    Storage backend keeping projects and assets in an indexed SQLite database.
+
+    The unique (project, name, type) index makes duplicate checks, lookups,
+    renames and deletes B-tree operations instead of list scans.
+    """
+
+    def __init__(self, db_file=SQLITE_FILE):
+        """
+        Opens (and if needed creates) the database.
+        """
+        self.conn = sqlite3.connect(db_file)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._depth = 0
+        self._data_version = self._read_data_version()
+
+    def _read_data_version(self):
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def refresh(self):
+        """
+        Returns True if another connection committed since the last call.
+        Queries always read committed data, so there is nothing to reload.
+        """
+        version = self._read_data_version()
+        changed = version != self._data_version
+        self._data_version = version
+        return changed
+
+    @contextmanager
+    def transaction(self):
+        """
+        Groups several mutations into one commit. Nested use joins the outer transaction.
+        """
+        self._depth += 1
+        try:
+            yield self
+        except sqlite3.IntegrityError as e:
+            self._depth -= 1
+            if self._depth == 0:
+                self.conn.rollback()
+            raise StoreConflictError(str(e)) from e
+        except BaseException:
+            self._depth -= 1
+            if self._depth == 0:
+                self.conn.rollback()
+            raise
+        self._depth -= 1
+        if self._depth == 0:
+            self.conn.commit()
+
+    def _commit(self):
+        if self._depth == 0:
+            self.conn.commit()
+
+    def _begin(self):
+        # Take the write lock up front so a check and the write that follows it are atomic
+        if not self.conn.in_transaction:
+            self.conn.execute("BEGIN IMMEDIATE")
+
+    def _rollback(self):
+        # A failed mutation outside a transaction leaves nothing behind;
+        # inside one, the exception rolls the whole transaction back
+        if self._depth == 0:
+            self.conn.rollback()
+
+    def save(self):
+        """
+        Every mutation is already committed; nothing to do.
+        """
+
+    def get_projects(self):
+        return [row[0] for row in self.conn.execute("SELECT name FROM projects ORDER BY id")]
+
+    def has_project(self, project):
+        return self._project_id(project) is not None
+
+    def get_assets(self, project):
+        rows = self.conn.execute(
+            "SELECT a.name, a.type FROM assets a JOIN projects p ON p.id = a.project_id "
+            "WHERE p.name = ? ORDER BY a.id", (project,))
+        return [{"name": name, "type": type_} for name, type_ in rows]
+
+    def has_asset(self, project, asset_name, asset_type):
+        row = self.conn.execute(
+            "SELECT 1 FROM assets a JOIN projects p ON p.id = a.project_id "
+            "WHERE p.name = ? AND a.name = ? AND a.type = ?", (project, asset_name, asset_type)).fetchone()
+        return row is not None
+
+    def add_project(self, project):
+        self.conn.execute("INSERT OR IGNORE INTO projects (name) VALUES (?)", (project,))
+        self._commit()
+
+    def add_asset(self, project, asset_name, asset_type):
+        # Matches the JSON and sharded backends: a project that is gone is not created again
+        self._begin()
+        project_id = self._project_id(project)
+        if project_id is None:
+            self._rollback()
+            raise StoreConflictError(f"Project '{project}' no longer exists.")
+        self.conn.execute(
+            "INSERT OR IGNORE INTO assets (project_id, name, type) VALUES (?, ?, ?)",
+            (project_id, asset_name, asset_type))
+        self._commit()
+
+    def rename_project(self, old_name, new_name):
+        try:
+            cursor = self.conn.execute("UPDATE projects SET name = ? WHERE name = ?", (new_name, old_name))
+        except sqlite3.IntegrityError:
+            self._rollback()
+            raise StoreConflictError(f"Project '{new_name}' already exists.")
+        if cursor.rowcount == 0:
+            self._rollback()
+            raise StoreConflictError(f"Project '{old_name}' no longer exists.")
+        self._commit()
+
+    def delete_project(self, name):
+        project_id = self._project_id(name)
+        if project_id is None:
+            return
+        self.conn.execute("DELETE FROM assets WHERE project_id = ?", (project_id,))
+        self.conn.execute("DELETE FROM projects WHERE id = ?", (project_id,))
+        self._commit()
+
+    def rename_asset(self, project, old_name, new_name):
+        # Matches the JSON backend: only the first asset with that name is renamed
+        self._begin()
+        if self.conn.execute(
+                "SELECT 1 FROM assets WHERE project_id = ? AND name = ?",
+                (self._project_id(project), new_name)).fetchone():
+            self._rollback()
+            raise StoreConflictError(f"Asset '{new_name}' already exists in project '{project}'.")
+        cursor = self.conn.execute(
+            "UPDATE assets SET name = ? WHERE id = ("
+            "SELECT id FROM assets WHERE project_id = ? AND name = ? ORDER BY id LIMIT 1)",
+            (new_name, self._project_id(project), old_name))
+        if cursor.rowcount == 0:
+            self._rollback()
+            raise StoreConflictError(f"Asset '{old_name}' no longer exists in project '{project}'.")
+        self._commit()
+
+    def delete_asset(self, project, asset_name):
+        self.conn.execute(
+            "DELETE FROM assets WHERE project_id = ? AND name = ?", (self._project_id(project), asset_name))
+        self._commit()
+
+    def _project_id(self, project):
+        row = self.conn.execute("SELECT id FROM projects WHERE name = ?", (project,)).fetchone()
+        return row[0] if row else None
@@ -0,0 +1,167 @@
+import os
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+from PyQt5.QtGui import QBrush
+
+from core.asset_scan import format_mtime
+
+class AssetTableModel(QAbstractTableModel):
+    """
+    Table model over a flat list of AssetRecord tuples.
+    Cells are only formatted when the view asks for them, so the cost of a
+    project is the size of the record list, not the number of Qt items.
+    """
+    HEADERS = ["Asset Name", "Asset Category", "Asset Subtype", "Last Modified"]
+    # Role holding the asset file path
+    PathRole = Qt.UserRole
+    # Role holding raw, sortable values (e.g. the mtime as a number)
+    SortRole = Qt.UserRole + 1
+
+    def __init__(self, parent=None):
+        """
+        Initialize an empty model.
+        """
+        super(AssetTableModel, self).__init__(parent)
+        self._records = []
+        self._rows = {}  # Asset folder -> row index into self._records
+        self._stubs = {}  # Path of an untouched stub -> (mtime, size) it was found with
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._records)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        record = self._records[index.row()]
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == 3:
+                return format_mtime(record.mtime)
+            return self._column_value(record, column)
+        if role == self.SortRole:
+            if column == 3:
+                return record.mtime if record.mtime is not None else -1.0
+            return self._column_value(record, column)
+        if role == self.PathRole:
+            return record.path
+        if role in (Qt.ForegroundRole, Qt.ToolTipRole) and self.is_template_stub(record):
+            return QBrush(Qt.gray) if role == Qt.ForegroundRole else "Untouched template stub"
+        return None
+
+    def _column_value(self, record, column):
+        if column == 0:
+            return record.name
+        category, _, subtype = record.type.partition("/")
+        return category if column == 1 else subtype
+
+    def set_records(self, records):
+        """
+        Replace all rows with the given records.
+        """
+        self.beginResetModel()
+        self._records = list(records)
+        self._reindex()
+        self.endResetModel()
+
+    def append_records(self, records):
+        """
+        Append a batch of records, replacing rows that already exist for the same asset folder.
+        """
+        new_records = []
+        for record in records:
+            row = self._rows.get(os.path.dirname(record.path))
+            if row is None:
+                new_records.append(record)
+            else:
+                self.update_record(record, row)
+        if not new_records:
+            return
+        first = len(self._records)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_records) - 1)
+        for offset, record in enumerate(new_records):
+            self._records.append(record)
+            self._rows[os.path.dirname(record.path)] = first + offset
+        self.endInsertRows()
+
+    def update_record(self, record, row=None):
+        """
+        Replace the row of an existing asset with a fresh record.
+        """
+        if row is None:
+            row = self._rows.get(os.path.dirname(record.path))
+            if row is None:
+                return
+        self._records[row] = record
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def remove_asset(self, asset_dir):
+        """
+        Remove the row of an asset folder, if present.
+        """
+        row = self._rows.get(asset_dir)
+        if row is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._records[row]
+        self._reindex()
+        self.endRemoveRows()
+
+    def record_for(self, asset_dir):
+        """
+        Return the record of an asset folder, or None.
+        """
+        row = self._rows.get(asset_dir)
+        return None if row is None else self._records[row]
+
+    def set_template_stubs(self, paths):
+        """
+        Flag the rows whose file is one of the given untouched stubs, until the file changes.
+        """
+        paths = set(paths)
+        self._stubs = {r.path: (r.mtime, r.size) for r in self._records if r.path in paths}
+        if self._records:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._records) - 1, len(self.HEADERS) - 1),
+                                  [Qt.ForegroundRole, Qt.ToolTipRole])
+
+    def is_template_stub(self, record):
+        """
+        Return True if a record's file is still the untouched stub it was created as.
+        """
+        return self._stubs.get(record.path) == (record.mtime, record.size)
+
+    def record_at(self, row):
+        """
+        Return the record at a source row.
+        """
+        return self._records[row]
+
+    def asset_dirs(self):
+        """
+        Return the asset folders currently shown.
+        """
+        return list(self._rows)
+
+    def _reindex(self):
+        self._rows = {os.path.dirname(r.path): i for i, r in enumerate(self._records)}
+
+class AssetFilterProxy(QSortFilterProxyModel):
+    """
+    Sorts assets on raw values and filters them by name.
+    """
+    def __init__(self, parent=None):
+        """
+        Configure case-insensitive name filtering and raw-value sorting.
+        """
+        super(AssetFilterProxy, self).__init__(parent)
+        self.setSortRole(AssetTableModel.SortRole)
+        self.setFilterKeyColumn(0)
+        self.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.setSortCaseSensitivity(Qt.CaseInsensitive)
@@ -0,0 +1,125 @@
+import os
+
+from PyQt5.QtCore import QObject, QFileSystemWatcher, QTimer, pyqtSignal
+
+# Paths handed to the watcher per event loop turn, so watching a large project doesn't freeze the GUI
+WATCH_CHUNK = 500
+
+class AssetWatcher(QObject):
+    """
+    Watches the ArtDepot folders of the current project and reports which
+    asset or category folder changed, so the asset table only updates the
+    affected rows instead of rebuilding itself.
+    """
+    # Emitted with an asset folder whose main file was modified, added or removed
+    assetChanged = pyqtSignal(str)
+    # Emitted with a category folder (e.g. ArtDepot/Models/Props) whose asset folders changed
+    categoryChanged = pyqtSignal(str)
+    # Emitted when the filesystem refuses the watches, so the caller can fall back to polling
+    unavailable = pyqtSignal()
+
+    def __init__(self, parent=None):
+        """
+        Initialize the watcher with nothing being watched.
+        """
+        super(AssetWatcher, self).__init__(parent)
+        self._watcher = None
+        self._category_dirs = set()
+        self._asset_files = {}  # Watched asset folder -> its main file
+        self._file_dirs = {}  # Watched asset file path -> asset folder
+        self._pending = []  # Paths still to be handed to the watcher
+        self._add_timer = QTimer(self)
+        self._add_timer.setInterval(0)
+        self._add_timer.timeout.connect(self._add_pending)
+
+    def watch(self, category_dirs, asset_files):
+        """
+        Bring the watched set in line with the given category folders and
+        asset files, where asset_files maps asset folder -> main file path.
+        Only what changed since the last call is watched or unwatched, so a
+        rescan that found the same assets costs nothing; new watches are
+        installed a chunk at a time. Emits unavailable if the filesystem
+        refuses them.
+        """
+        if self._watcher is None:
+            self._watcher = QFileSystemWatcher(self)
+            self._watcher.directoryChanged.connect(self._on_directory_changed)
+            self._watcher.fileChanged.connect(self._on_file_changed)
+
+        category_dirs = set(category_dirs)
+        removed = list(self._category_dirs - category_dirs)
+        added = list(category_dirs - self._category_dirs)
+        for asset_dir, path in list(self._asset_files.items()):
+            if asset_files.get(asset_dir) != path:
+                removed += [asset_dir, path]
+                del self._asset_files[asset_dir]
+                del self._file_dirs[path]
+        for asset_dir, path in asset_files.items():
+            if asset_dir not in self._asset_files:
+                added += [asset_dir, path]
+                self._asset_files[asset_dir] = path
+                self._file_dirs[path] = asset_dir
+        self._category_dirs = category_dirs
+
+        if removed:
+            removed = set(removed)
+            self._pending = [p for p in self._pending if p not in removed]
+            self._watcher.removePaths(list(removed))
+        if added:
+            self._pending.extend(added)
+            self._add_timer.start()
+
+    def watch_asset(self, asset_dir, path):
+        """
+        Start watching a single asset folder and its main file, e.g. after
+        it was created or its file was replaced by a save.
+        """
+        if self._watcher is None:
+            return
+        old_path = self._asset_files.get(asset_dir)
+        if old_path is not None and old_path != path:
+            self._file_dirs.pop(old_path, None)
+            self._watcher.removePath(old_path)
+        self._asset_files[asset_dir] = path
+        self._file_dirs[path] = asset_dir
+        # Paths that are still watched are refused again, which is harmless here
+        self._watcher.addPaths([asset_dir, path])
+
+    def clear(self):
+        """
+        Stop watching everything.
+        """
+        self._add_timer.stop()
+        self._pending = []
+        if self._watcher is not None:
+            self._watcher.deleteLater()
+            self._watcher = None
+        self._category_dirs = set()
+        self._asset_files = {}
+        self._file_dirs = {}
+
+    def _add_pending(self):
+        chunk, self._pending = self._pending[:WATCH_CHUNK], self._pending[WATCH_CHUNK:]
+        if not self._pending:
+            self._add_timer.stop()
+        if self._watcher is None or not chunk:
+            return
+        failed = self._watcher.addPaths(chunk)
+        if failed:
+            # Paths deleted since the scan, or already watched through watch_asset(), fail too
+            watched = set(self._watcher.directories()) | set(self._watcher.files())
+            failed = [p for p in failed if p not in watched and os.path.exists(p)]
+        if failed:
+            self.clear()
+            self.unavailable.emit()
+
+    def _on_directory_changed(self, path):
+        if path in self._category_dirs:
+            self.categoryChanged.emit(path)
+        else:
+            self.assetChanged.emit(path)
+
+    def _on_file_changed(self, path):
+        asset_dir = self._file_dirs.get(path)
+        if asset_dir:
+            self.assetChanged.emit(asset_dir)
@@ -0,0 +1,64 @@
+import io
+import os
+import argparse
+from PyQt5 import uic
+
+from gui.ui_loader import UI_DIR, ui_source_hash
+
+"""
+Compiles the Qt Designer .ui files in gui/ into PyQt5 *_ui.py modules.
+
+Run after editing a .ui file: python -m gui.build_ui
+Modules whose recorded source hash already matches their .ui file are skipped.
+"""
+
+def compiled_hash(module_path):
+    """
+    Return the UI_SOURCE_HASH recorded in a compiled module, or None.
+    """
+    try:
+        with open(module_path, 'r') as f:
+            for line in f:
+                if line.startswith("UI_SOURCE_HASH = "):
+                    return line.split("=", 1)[1].strip().strip('"')
+    except FileNotFoundError:
+        pass
+    return None
+
+def build(force=False):
+    """
+    Compile every out-of-date .ui file. Returns the list of modules written.
+    """
+    written = []
+    for name in sorted(os.listdir(UI_DIR)):
+        if not name.endswith(".ui"):
+            continue
+        ui_path = os.path.join(UI_DIR, name)
+        module_path = os.path.join(UI_DIR, name[:-3] + "_ui.py")
+        source_hash = ui_source_hash(ui_path)
+        if not force and compiled_hash(module_path) == source_hash:
+            continue
+
+        code = io.StringIO()
+        # Compile from inside UI_DIR so the generated header names the file, not its absolute path
+        cwd = os.getcwd()
+        os.chdir(UI_DIR)
+        try:
+            uic.compileUi(name, code)
+        finally:
+            os.chdir(cwd)
+        with open(module_path, 'w', newline='\n') as f:
+            f.write(code.getvalue())
+            f.write(f'\n\nUI_SOURCE_HASH = "{source_hash}"\n')
+        written.append(module_path)
+    return written
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile gui/*.ui into PyQt5 modules.")
+    parser.add_argument("--force", action="store_true", help="recompile even if up to date")
+    args = parser.parse_args(argv)
+    for module_path in build(args.force):
+        print(f"Compiled {os.path.basename(module_path)}")
+
+if __name__ == "__main__":
+    main()
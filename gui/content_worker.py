@@ -0,0 +1,32 @@
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from core.content_index import find_template_stubs
+
+class ContentSignals(QObject):
+    """
+    Signals posted from a TemplateStubWorker back to the GUI thread.
+    """
+    # project, main file paths of its assets that are untouched stubs (None if the update failed)
+    finished = pyqtSignal(str, object)
+
+class TemplateStubWorker(QRunnable):
+    """
+    Updates a project's content index off the GUI thread and reports which
+    assets are still untouched template stubs.
+    """
+    def __init__(self, project):
+        """
+        Prepare an index update of a project.
+        """
+        super(TemplateStubWorker, self).__init__()
+        self.project = project
+        self.signals = ContentSignals()
+
+    def run(self):
+        try:
+            # Threads, not processes: the GUI process must not be forked or re-launched
+            paths = list(find_template_stubs(self.project, processes=False).values())
+        except (OSError, ValueError):
+            # The project changed under the index; the next selection tries again
+            paths = None
+        self.signals.finished.emit(self.project, paths)
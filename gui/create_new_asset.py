@@ -1,24 +1,59 @@
-from PyQt5 import uic
-from PyQt5.QtWidgets import QDialog
-from utils.file_utils import ROOT_DIR
-import os
+from PyQt5.QtWidgets import QDialog, QComboBox, QCompleter
+from PyQt5.QtCore import Qt, QStringListModel
+from gui.ui_loader import load_ui
+from core.asset_index import AssetIndex
+from core.project_generation import REFERENCE_CATEGORIES
 
 class CreateAssetDialog(QDialog):
     """
     Dialog for creating a new asset in the project management tool.
     Handles UI setup, asset type/subtype selection, and reference population.
     """
-    def __init__(self, parent=None, projectName=None):
+    def __init__(self, parent=None, projectName=None, assetIndex=None):
         """
         Initialize the dialog, load UI, and set up controls.
+        assetIndex is the AssetIndex that reference names are read from.
         """
         super(CreateAssetDialog, self).__init__(parent)
-        uiFilePath = os.path.join(os.path.dirname(__file__), "newAssetDialog.ui")
-        uic.loadUi(uiFilePath, self)
+        load_ui(self, "newAssetDialog")
         self.projectName = str(projectName)
+        if assetIndex is None:
+            from data.project_data import ProjectStore
+            assetIndex = AssetIndex(ProjectStore())
+        self.assetIndex = assetIndex
+        self._referenceKey = None
+        self.setupReferencePicker()
         self.fillAssetTypeCombo()
         self.bindAssetChoices()
 
+    def reset(self, projectName):
+        """
+        Clear the previous input and switch to a project so the dialog can be reused.
+        """
+        self.projectName = str(projectName)
+        self.assetName.clear()
+        self.assetTypeCombo.setCurrentIndex(0)
+        self.updateAssetSubtypeOptions()
+        self.charButton.setChecked(True)
+        # The project's assets may have changed since the dialog was last shown
+        self._referenceKey = None
+        self.populateReferenceCombo()
+        self.assetName.setFocus()
+
+    def setupReferencePicker(self):
+        """
+        Make the reference combo editable with type-ahead matching anywhere in the name.
+        """
+        self.referenceModel = QStringListModel(self)
+        self.referenceCombo.setModel(self.referenceModel)
+        self.referenceCombo.setEditable(True)
+        self.referenceCombo.setInsertPolicy(QComboBox.NoInsert)
+        completer = QCompleter(self.referenceModel, self)
+        completer.setCaseSensitivity(Qt.CaseInsensitive)
+        completer.setFilterMode(Qt.MatchContains)
+        completer.setCompletionMode(QCompleter.PopupCompletion)
+        self.referenceCombo.setCompleter(completer)
+
     def bindAssetChoices(self):
         """
         Connect UI signals to their respective slots for asset type/subtype changes.
@@ -57,22 +92,14 @@ class CreateAssetDialog(QDialog):
         Handle toggling of the Characters button.
         Populate reference combo if appropriate.
         """
-        checked = self.charButton.isChecked()
-        if (checked and self.assetTypeCombo.currentText() == "Rigs") or (checked and self.assetTypeCombo.currentText() == "Animations"):
-            self.populateReferenceCombo("Characters")
-        else:
-            self.referenceCombo.clear()
+        self.populateReferenceCombo()
 
     def on_props_selected(self, checked):
         """
         Handle toggling of the Props button.
         Populate reference combo if appropriate.
         """
-        checked = self.propButton.isChecked()
-        if (checked and self.assetTypeCombo.currentText() == "Rigs") or (checked and self.assetTypeCombo.currentText() == "Animations"):
-            self.populateReferenceCombo("Props")
-        else:
-            self.referenceCombo.clear()
+        self.populateReferenceCombo()
 
     def fillAssetTypeCombo(self):
         """
@@ -114,12 +141,8 @@ class CreateAssetDialog(QDialog):
     def populateReferenceCombo(self, subtype=None):
         """
         Populate the reference combo box with available assets for the selected type/subtype.
+        Names come from the in-memory asset index, so switching types never touches the disk.
         """
-        self.referenceCombo.clear()
-
-        if not self.projectName:
-            return
-        
         if isinstance(subtype, int):
             subtype = None
         # Determine subtype if not provided
@@ -128,39 +151,21 @@ class CreateAssetDialog(QDialog):
                 subtype = "Characters"
             elif self.propButton.isChecked():
                 subtype = "Props"
-            else:
-                return
-            
-        #print(self.projectName)
-        #print(subtype)
-
-        # Set reference directory based on asset type and subtype
-        if self.assetTypeCombo.currentText() =="Rigs":
-            ref_dir = os.path.join(
-            ROOT_DIR, "Projects", self.projectName, "ArtDepot", "Models", subtype
-            )
-            
-        elif self.assetTypeCombo.currentText() == "Animations":
-            ref_dir = os.path.join(
-            ROOT_DIR, "Projects", self.projectName, "ArtDepot", "Rigs", subtype
-            )
 
-        else:
-            return
-
-        if not os.path.exists(ref_dir):
+        # Rigs reference models and animations reference rigs
+        category = REFERENCE_CATEGORIES.get(self.assetTypeCombo.currentText())
+        key = (self.projectName, category, subtype) if self.projectName and category and subtype else None
+        if key == self._referenceKey:
+            # The type and subtype handlers fire several times per click
             return
-
-        # Add directories as reference options, skipping tools/config
-        for name in os.listdir(ref_dir):
-            if name.lower() in {"tools", "config"}:
-                continue
-            asset_path = os.path.join(ref_dir, name)
-            if os.path.isdir(asset_path):
-                self.referenceCombo.addItem(name)
+        self._referenceKey = key
+        self.referenceModel.setStringList(self.assetIndex.names(*key) if key else [])
+        self.referenceCombo.setCurrentIndex(0 if key else -1)
 
     def get_reference_target(self):
         """
         Get the currently selected reference target from the combo box.
+        Typed text only counts if it names an existing asset.
         """
-        return self.referenceCombo.currentText().strip()
\ No newline at end of file
+        target = self.referenceCombo.currentText().strip()
+        return target if target in self.referenceModel.stringList() else ""
\ No newline at end of file
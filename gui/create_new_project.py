@@ -1,21 +1,24 @@
-from PyQt5 import uic
 from PyQt5.QtWidgets import QDialog
-import os
+from gui.ui_loader import load_ui
 
 class CreateProjectDialog(QDialog):
     """
     Dialog window for creating a new project.
-    Loads the UI from a .ui file and provides a method to get the entered project name.
+    Builds the UI from the compiled newProjDialog form and provides a method to get the entered project name.
     """
     def __init__(self, parent=None):
         """
-        Initialize the dialog and load the UI file.
+        Initialize the dialog and build its UI.
         """
         super(CreateProjectDialog, self).__init__(parent)
-        # Construct the path to the .ui file located in the same directory as this script
-        uiFilePath = os.path.join(os.path.dirname(__file__), "newProjDialog.ui")
-        # Load the UI layout from the .ui file
-        uic.loadUi(uiFilePath, self)
+        load_ui(self, "newProjDialog")
+
+    def reset(self):
+        """
+        Clear the previous input so the dialog can be reused.
+        """
+        self.projectName.clear()
+        self.projectName.setFocus()
 
     def get_project_name(self):
         """
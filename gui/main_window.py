@@ -1,14 +1,21 @@
-import os, re, datetime, shutil
-from PyQt5 import uic
-from PyQt5.QtWidgets import QWidget, QTableWidgetItem, QAbstractItemView, QMessageBox, QHeaderView, QInputDialog
-from PyQt5.QtCore import QFile, Qt, QTimer
-
-from core.project_generation import create_project_structure, create_asset_structure
-from core.dcc_launcher import open_in_maya, open_in_photoshop, open_in_txt_editor
-from gui.create_new_project import CreateProjectDialog
-from gui.create_new_asset import CreateAssetDialog
-from data.project_data import ProjectStore
-from utils.file_utils import ROOT_DIR, is_valid_name
+import os, re, time
+from PyQt5.QtWidgets import QWidget, QAbstractItemView, QMessageBox, QHeaderView, QInputDialog, QMenu, QProgressBar
+from PyQt5.QtCore import Qt, QTimer, QThreadPool, pyqtSignal
+
+from core.asset_scan import get_asset_dir, get_asset_key, scan_asset
+from gui.asset_watcher import AssetWatcher
+from gui.asset_model import AssetTableModel, AssetFilterProxy
+from gui.scan_worker import AssetScanWorker
+from gui.ui_loader import load_ui
+from data.project_data import ProjectStore, open_store
+from data.remote_backend import ServiceError
+from core.stat_cache import StatCache
+from core.asset_index import AssetIndex
+from utils.file_utils import REFRESH_MODE, POLL_INTERVAL_MS, POLL_FULL_RESCAN_TICKS, STORE_REFRESH_MS, TRASH_DIR, TRASH_PURGE_DELAY_S, is_valid_name
+from utils import startup_timer
+
+# Modules not needed for the first frame (dialogs, project generation, DCC
+# launching, trash) are imported where they are used to keep startup fast.
 
 """
 Main application window for the Project Management Tool.
@@ -20,39 +27,108 @@ class MainWindow(QWidget):
     Main window class for the Project Management Tool.
     Manages UI initialization, project and asset creation, and asset launching.
     """
+    # Emitted when the project service reports a change to the store
+    storeChanged = pyqtSignal()
+    # Wait before retrying a purge that failed, doubled after each failure up to the maximum
+    PURGE_RETRY_MS = 60 * 1000
+    PURGE_RETRY_MAX_MS = 60 * 60 * 1000
+    # Longest interval QTimer accepts; a purge due later is re-armed when the timer fires
+    MAX_TIMER_MS = 2**31 - 1
+
     def __init__(self):
         """
-        Initializes the main window, sets up UI, binds buttons, and starts the asset refresh timer.
+        Initializes the main window, sets up UI, binds buttons, and starts watching for asset changes.
         """
         super(MainWindow, self).__init__()
         self.setWindowFlags(Qt.Window)
-        self.store = ProjectStore()
+        self.store = open_store()
+        self.asset_index = AssetIndex(self.store)
+        startup_timer.mark("load project store")
+        self._painted = False
+        self._project_dialog = None
+        self._asset_dialog = None
+        self._reference_index = None
+        self._stat_cache = None
+        self._poll_ticks = 0
+        self._scan_worker = None
+        self._scan_generation = 0
+        self._scan_project = None
+        self._scan_seen = set()
+        self._purge_worker = None
+        self._purge_retry_ms = 0  # Current retry delay while purges keep failing
+        self._stub_worker = None
+        self._stubs_project = None  # Project whose template stubs are still to be looked up
         self.initUI()
         self.bindButtons()
-        self.populate_project_combo()
+        startup_timer.mark("build main window UI")
+
+        # Filesystem notifications update single rows; the timer is the polling fallback
+        self.watcher = AssetWatcher(self)
+        self.watcher.assetChanged.connect(self.refresh_asset)
+        self.watcher.categoryChanged.connect(self.refresh_category)
+        self.watcher.unavailable.connect(self.start_polling)
         self.timer = QTimer(self)
-        self.timer.timeout.connect(self.populate_asset_list)
-        self.timer.start(5000)  # Refresh asset list every 5 seconds
+        self.timer.timeout.connect(self.poll_assets)
+        # Watcher updates to the stat cache are written in one go after a burst of changes
+        self._cache_save_timer = QTimer(self)
+        self._cache_save_timer.setSingleShot(True)
+        self._cache_save_timer.setInterval(2000)
+        self._cache_save_timer.timeout.connect(self.save_stat_cache)
+        # Other artists' commits to the shared store are picked up with a cheap check,
+        # or pushed right away when the project service serves the store
+        self._store_timer = QTimer(self)
+        self._store_timer.timeout.connect(self.refresh_store)
+        self.storeChanged.connect(self.refresh_store)
+        if getattr(self.store.backend, "remote", False):
+            # Events arrive on the connection's reader thread; the signal queues them to the GUI thread
+            self.store.backend.add_listener(lambda message: self.storeChanged.emit())
+        else:
+            self._store_timer.start(STORE_REFRESH_MS)
+        if REFRESH_MODE == "poll":
+            self.start_polling()
+        # Deleted projects and assets are purged from the trash in the background once they are due
+        self._purge_timer = QTimer(self)
+        self._purge_timer.setSingleShot(True)
+        self._purge_timer.timeout.connect(self.purge_trash)
+        self.schedule_purge()
 
-    def initUI(self):
+        self.populate_project_combo()
+        startup_timer.mark("populate projects, start asset scan")
+
+    def paintEvent(self, event):
+        super(MainWindow, self).paintEvent(event)
+        if not self._painted:
+            self._painted = True
+            self._startup_milestone("first paint")
+
+    def _startup_milestone(self, phase):
         """
-        Loads the UI from the .ui file and sets the window title.
+        Records a startup phase; the timing report is printed once the window
+        has painted and the first asset scan has finished.
         """
-        uiFilePath = os.path.join(os.path.dirname(__file__), "projManager.ui")
-        uiFile = QFile(uiFilePath)
-
-        if not uiFile.exists():
-            raise FileNotFoundError(f"UI File not found: {uiFilePath}")
+        if self._painted and self._scan_worker is None:
+            startup_timer.finish(phase)
+        else:
+            startup_timer.mark(phase)
 
-        if not uiFile.open(QFile.ReadOnly):
-            raise IOError(f"Unable to open UI file: {uiFilePath}")
+    def initUI(self):
+        """
+        Builds the UI from the compiled projManager form and sets the window title.
+        """
+        load_ui(self, "projManager")
+        self.setWindowTitle("Project Management Tool")
 
-        try:
-            uic.loadUi(uiFile, self)
-        finally:
-            uiFile.close()
+        # The view only ever sees the proxy, which sorts and filters the flat asset model
+        self.assetModel = AssetTableModel(self)
+        self.assetProxy = AssetFilterProxy(self)
+        self.assetProxy.setSourceModel(self.assetModel)
+        self.assetTable.setModel(self.assetProxy)
 
-        self.setWindowTitle("Project Management Tool")
+        # Shown while the trash is purged in the background
+        self.purgeProgress = QProgressBar(self)
+        self.purgeProgress.setFormat("Purging deleted files... %p%")
+        self.purgeProgress.hide()
+        self.verticalLayout.addWidget(self.purgeProgress)
 
     def bindButtons(self):
         """
@@ -66,13 +142,21 @@ class MainWindow(QWidget):
         self.deleteProj.clicked.connect(self.delete_project)
         self.renameAsset.clicked.connect(self.rename_asset)
         self.deleteAsset.clicked.connect(self.delete_asset)
+        self.assetFilter.textChanged.connect(self.assetProxy.setFilterFixedString)
+        self.assetTable.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.assetTable.customContextMenuRequested.connect(self.show_asset_menu)
 
     def create_project(self):
         """
         Handles the creation of a new project via a dialog.
         Validates input and updates the project list.
         """
-        dialog = CreateProjectDialog(self)
+        # The dialog is built once and reset for every use
+        if self._project_dialog is None:
+            from gui.create_new_project import CreateProjectDialog
+            self._project_dialog = CreateProjectDialog(self)
+        dialog = self._project_dialog
+        dialog.reset()
         if dialog.exec_():
             raw_name = dialog.get_project_name()
             if not raw_name:
@@ -83,8 +167,12 @@ class MainWindow(QWidget):
                 return
             project_name = raw_name
             if project_name:
-                self.store.add_project(project_name)
-                create_project_structure(project_name)
+                from core.asset_ops import create_project
+                try:
+                    create_project(self.store, project_name)
+                except (OSError, ValueError) as e:
+                    self.report_write_error("Create Failed", "The project was not created", e)
+                    return
                 self.populate_project_combo()
 
     def populate_project_combo(self):
@@ -92,7 +180,7 @@ class MainWindow(QWidget):
         Populates the project combo box with available projects and updates asset controls.
         """
         self.projectCombo.clear()
-        self.projectCombo.addItems(self.store.get_projects())
+        self.projectCombo.addItems(self.read_store("get_projects"))
         if self.projectCombo.count() > 0:
             self.assetCreate.setEnabled(True)
             self.openAssetButton.setEnabled(True)
@@ -109,13 +197,76 @@ class MainWindow(QWidget):
             self.deleteAsset.setEnabled(False)
         self.createTable()
 
+    def refresh_store(self):
+        """
+        Reloads the project list and asset table if another process changed the store,
+        keeping the current project selected. If the project service stops,
+        switches to reading the store files directly.
+        """
+        backend = self.store.backend
+        if getattr(backend, "remote", False) and backend.client.closed:
+            self.use_store_files()
+        elif not self.store.refresh():
+            return
+        current = self.projectCombo.currentText()
+        shown = [self.projectCombo.itemText(i) for i in range(self.projectCombo.count())]
+        if self.read_store("get_projects") != shown:
+            self.populate_project_combo()
+            index = self.projectCombo.findText(current)
+            if index >= 0:
+                self.projectCombo.setCurrentIndex(index)
+        self.populate_asset_list()
+
+    def use_store_files(self):
+        """
+        Switches from the project service to reading and writing the store files directly.
+        """
+        self.store = ProjectStore()
+        self.asset_index.store = self.store
+        self._store_timer.start(STORE_REFRESH_MS)
+
+    def read_store(self, method, *args):
+        """
+        Calls one of the store's read methods. If the project service stops
+        answering, switches to the store files and reads from them instead.
+        """
+        try:
+            return getattr(self.store, method)(*args)
+        except ServiceError:
+            if not getattr(self.store.backend, "remote", False):
+                raise
+            self.use_store_files()
+            return getattr(self.store, method)(*args)
+
+    def report_write_error(self, title, message, error):
+        """
+        Tells the user a change failed. If the project service stopped
+        answering, the change may or may not have been applied, so this says
+        so and switches to the store files.
+        """
+        if isinstance(error, ServiceError) and getattr(self.store.backend, "remote", False):
+            # Drop the connection; refresh_store() then switches to the files and shows what they hold
+            self.store.backend.client.close()
+            self.refresh_store()
+            QMessageBox.warning(
+                self, title,
+                f"The project service stopped answering ({error}), so the change may or may not have been applied. "
+                "The store files are used from now on; check the result before trying again.")
+            return
+        QMessageBox.warning(self, title, f"{message}: {error}")
+
     def create_asset(self):
         """
         Handles the creation of a new asset for the selected project.
         Validates input and updates the asset list.
         """
         project = self.projectCombo.currentText()
-        assetDialog = CreateAssetDialog(self, project)
+        # The dialog is built once and reset for every use
+        if self._asset_dialog is None:
+            from gui.create_new_asset import CreateAssetDialog
+            self._asset_dialog = CreateAssetDialog(self, project, self.asset_index)
+        assetDialog = self._asset_dialog
+        assetDialog.reset(project)
         if assetDialog.exec_():
             raw_name = assetDialog.get_asset_name()
             if not raw_name:
@@ -141,93 +292,265 @@ class MainWindow(QWidget):
                     QMessageBox.warning(self, "Reference Required", "Rigs and Animations require a reference object.")
                     return
             if project and asset_name and asset_type:
-                create_asset_structure(project, asset_type, asset_name, reference)
-                self.store.add_asset(project, asset_name, asset_type)
+                from core.asset_ops import create_asset
+                try:
+                    create_asset(self.store, project, asset_type, asset_name, reference, self.reference_index())
+                except (OSError, ValueError) as e:
+                    self.report_write_error("Create Failed", "The asset was not created", e)
+                    return
                 self.populate_asset_list()
 
     def populate_asset_list(self):
         """
-        Populates the asset table with assets for the selected project.
+        Starts a background scan of the selected project's assets.
+        Any scan still running for a previous request is cancelled and its results dropped.
         """
-        self.assetTable.setRowCount(0)
+        if self._scan_worker is not None:
+            self._scan_worker.cancel()
+            self._scan_worker = None
+        self._scan_generation += 1
+        # Every change to the store's assets ends in a refresh; the index reloads on next use
+        self.asset_index.invalidate()
 
         project = self.projectCombo.currentText()
+        if project != self._scan_project:
+            # Switching projects starts from an empty table; rescans of the same project update in place
+            self.assetModel.set_records([])
+            self.watcher.clear()
+            self.save_stat_cache()
+            self._stat_cache = StatCache(project) if project else None
+            self._scan_project = project
+            self._stubs_project = project or None
         if not project:
             return
 
-        assets = self.store.get_assets(project)
+        self._scan_seen = set()
+        worker = AssetScanWorker(self._scan_generation, project, self.read_store("get_assets", project), self._stat_cache)
+        worker.signals.batchReady.connect(self.on_scan_batch)
+        worker.signals.finished.connect(self.on_scan_finished)
+        self._scan_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def on_scan_batch(self, generation, records):
+        """
+        Adds or updates a batch of scanned assets, unless it belongs to an outdated scan.
+        """
+        if generation != self._scan_generation:
+            return
+        self._scan_seen.update(os.path.dirname(r.path) for r in records)
+        self.assetModel.append_records(records)
+
+    def on_scan_finished(self, generation, category_dirs):
+        """
+        Drops rows the scan no longer found and, unless polling, brings the
+        watcher in line with the project's category folders and asset files;
+        only assets that appeared or disappeared change its watches.
+        """
+        if generation != self._scan_generation:
+            return
+        self._scan_worker = None
+        self._startup_milestone("first asset scan")
+        for asset_dir in self.assetModel.asset_dirs():
+            if asset_dir not in self._scan_seen:
+                self.assetModel.remove_asset(asset_dir)
+
+        if not self.timer.isActive():
+            asset_files = {d: self.assetModel.record_for(d).path for d in self.assetModel.asset_dirs()}
+            self.watcher.watch(category_dirs, asset_files)
 
-        for asset in assets:
+        self.find_template_stubs()
+
+    def find_template_stubs(self):
+        """
+        Looks up the untouched template stubs of a newly selected project in
+        the background, once its first scan has finished. The index stats
+        every file under ArtDepot, so it is not rerun on every scan; rows
+        lose the flag by themselves when their file changes.
+        """
+        if self._stub_worker is not None or self._stubs_project is None:
+            return
+        from gui.content_worker import TemplateStubWorker
+        worker = self._stub_worker = TemplateStubWorker(self._stubs_project)
+        self._stubs_project = None
+        worker.signals.finished.connect(self.on_template_stubs)
+        QThreadPool.globalInstance().start(worker)
+
+    def on_template_stubs(self, project, paths):
+        """
+        Greys out the assets that are still untouched template stubs, unless
+        another project was selected in the meantime.
+        """
+        self._stub_worker = None
+        if paths is not None and project == self._scan_project:
+            self.assetModel.set_template_stubs(paths)
+        if self._scan_worker is None:
+            # A project selected while this one was being indexed
+            self.find_template_stubs()
+
+    def refresh_asset(self, asset_dir):
+        """
+        Re-stats a single asset folder and updates or removes its row.
+        """
+        old = self.assetModel.record_for(asset_dir)
+        if old is None:
+            return
+        record = scan_asset(self.projectCombo.currentText(), old.name, old.type)
+        if record is None:
+            self._stat_cache.forget(old.type, old.name)
+            self._cache_save_timer.start()
+            self.assetModel.remove_asset(asset_dir)
+            return
+        self._stat_cache.update(record)
+        self._cache_save_timer.start()
+        self.assetModel.update_record(record)
+        # Saves that replace the file drop the watch on it, so re-arm it
+        self.watcher.watch_asset(asset_dir, record.path)
+
+    def refresh_category(self, category_dir):
+        """
+        Adds or removes rows for assets whose folders appeared in or
+        disappeared from a category folder.
+        """
+        project = self.projectCombo.currentText()
+        if not project:
+            return
+        try:
+            present = set(os.listdir(category_dir))
+        except OSError:
+            present = set()
+
+        for asset in self.read_store("get_assets", project):
             asset_name = asset.get("name")
             asset_type = asset.get("type", "Unknown")
+            asset_dir = get_asset_dir(project, asset_type, asset_name)
+            if os.path.dirname(asset_dir) != category_dir:
+                continue
+            known = self.assetModel.record_for(asset_dir) is not None
+            if asset_name in present and not known:
+                record = scan_asset(project, asset_name, asset_type)
+                if record:
+                    self._stat_cache.update(record)
+                    self._cache_save_timer.start()
+                    self.assetModel.append_records([record])
+                    self.watcher.watch_asset(asset_dir, record.path)
+            elif known and asset_name not in present:
+                self.assetModel.remove_asset(asset_dir)
+
+    def poll_assets(self):
+        """
+        Refreshes the asset table on a polling tick. Most ticks trust the stat
+        cache; every POLL_FULL_RESCAN_TICKS-th tick re-stats every file, since
+        edits inside asset folders don't change the category folder mtimes.
+        """
+        self._poll_ticks += 1
+        if self._stat_cache is not None and self._poll_ticks % POLL_FULL_RESCAN_TICKS == 0:
+            self._stat_cache.invalidate()
+        self.populate_asset_list()
 
-            # Build asset directory path
-            asset_dir = os.path.join(
-                ROOT_DIR, "Projects", project, "ArtDepot",
-                *asset_type.split("/"),
-                asset_name
-            )
+    def rescan_asset_files(self):
+        """
+        Re-stats every asset file of the current project, bypassing the stat cache.
+        """
+        if self._stat_cache is not None:
+            self._stat_cache.invalidate()
+        self.populate_asset_list()
 
-            if not os.path.exists(asset_dir):
-                continue
+    def save_stat_cache(self):
+        """
+        Writes pending stat cache changes to disk.
+        """
+        self._cache_save_timer.stop()
+        if self._stat_cache is not None:
+            self._stat_cache.save()
 
-            # Determine file prefix based on asset type
-            prefix = ""
-            if "Models" in asset_type:
-                prefix = "SM_"
-            elif "Rigs" in asset_type:
-                prefix = "RIG_"
-            elif "Animations" in asset_type:
-                prefix = "A_"
-            elif "Textures" in asset_type:
-                prefix = "T_"
-            elif "VFX" in asset_type:
-                prefix = "VFX_"
-
-            # Look for asset files with the correct prefix and extension
-            for fname in os.listdir(asset_dir):
-                if (fname.endswith(".ma") or fname.endswith(".psd") or fname.endswith(".txt")) and fname.startswith(prefix):
-                    full_path = os.path.join(asset_dir, fname)
-                    self.add_asset_to_table(asset_name, asset_type, full_path)
-                    break
-
-    def add_asset_to_table(self, name, type_, path):
-        """
-        Adds an asset entry to the asset table.
-        """
-        # Split asset type into category and subtype
-        category, subtype = type_.split("/") if "/" in type_ else (type_, "")
-        row = self.assetTable.rowCount()
-        self.assetTable.insertRow(row)
-        self.assetTable.setItem(row, 0, QTableWidgetItem(str(name)))
-        self.assetTable.setItem(row, 1, QTableWidgetItem(str(category)))
-        self.assetTable.setItem(row, 2, QTableWidgetItem(str(subtype)))
-
-        # Get last modified time or mark as missing
-        if os.path.exists(path):
-            last_modified = os.path.getmtime(path)
-            modified_str = datetime.datetime.fromtimestamp(last_modified).strftime('%Y-%m-%d %H:%M')
+    def closeEvent(self, event):
+        self.save_stat_cache()
+        if self._purge_worker is not None:
+            self._purge_worker.cancel()
+        super(MainWindow, self).closeEvent(event)
+
+    def start_polling(self):
+        """
+        Falls back to rebuilding the asset table on a timer, for filesystems
+        that don't deliver change notifications.
+        """
+        self.watcher.clear()
+        if not self.timer.isActive():
+            self.timer.start(POLL_INTERVAL_MS)
+
+    def selected_record(self):
+        """
+        Returns the AssetRecord of the selected row, or None.
+        """
+        index = self.assetTable.selectionModel().currentIndex()
+        if not index.isValid():
+            return None
+        return self.assetModel.record_at(self.assetProxy.mapToSource(index).row())
+
+    def reference_index(self):
+        """
+        Returns the reference index of the current project, reloading it only
+        when the project changed or the index was saved by another process.
+        """
+        project = self.projectCombo.currentText()
+        index = self._reference_index
+        if index is None or index.project != project or index.is_stale():
+            from core.reference_index import ReferenceIndex
+            index = self._reference_index = ReferenceIndex(project)
+        return index
+
+    def show_asset_menu(self, pos):
+        """
+        Shows the dependency context menu for the asset under the cursor.
+        """
+        if not self.assetTable.indexAt(pos).isValid():
+            return
+        record = self.selected_record()
+        if not record:
+            return
+        menu = QMenu(self)
+        menu.addAction("Show Dependents", lambda: self.show_dependents(record, False))
+        menu.addAction("Show All Downstream", lambda: self.show_dependents(record, True))
+        menu.addSeparator()
+        menu.addAction("Rebuild Reference Index", self.rebuild_reference_index)
+        menu.addAction("Rescan All Files", self.rescan_asset_files)
+        menu.addSeparator()
+        menu.addAction("Restore Deleted...", self.restore_deleted)
+        menu.exec_(self.assetTable.viewport().mapToGlobal(pos))
+
+    def show_dependents(self, record, transitive):
+        """
+        Lists the assets that reference the given asset, directly or transitively.
+        """
+        index = self.reference_index()
+        key = get_asset_key(record.type, record.name)
+        dependents = index.all_dependents(key) if transitive else index.dependents(key)
+        title = "All Downstream Assets" if transitive else "Dependent Assets"
+        if dependents:
+            QMessageBox.information(self, title, f"Assets depending on '{key}':\n\n" + "\n".join(dependents))
         else:
-            modified_str = "File Missing"
+            QMessageBox.information(self, title, f"No assets depend on '{key}'.")
 
-        last_item = QTableWidgetItem(modified_str)
-        last_item.setData(Qt.UserRole, path)
-        self.assetTable.setItem(row, 3, last_item)
+    def rebuild_reference_index(self):
+        """
+        Rebuilds the current project's reference index from its Maya files.
+        """
+        index = self.reference_index()
+        count = index.rebuild()
+        index.save()
+        QMessageBox.information(self, "Reference Index", f"Rebuilt the reference index from {count} Maya files.")
 
     def createTable(self):
         """
-        Sets up the asset table columns, headers, and selection behavior.
+        Sets up the asset table selection behavior and header sizing.
         """
-        self.assetTable.setColumnCount(4)
-        self.assetTable.setHorizontalHeaderLabels(["Asset Name", "Asset Category", "Asset Subtype", "Last Modified"])
         self.assetTable.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.assetTable.setSelectionMode(QAbstractItemView.SingleSelection)
         self.assetTable.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.assetTable.setSortingEnabled(True)
 
-        self.assetTable.resizeColumnsToContents()
-        self.assetTable.resizeRowsToContents()
-
+        # Fixed row heights let the view lay out only the visible rows
+        self.assetTable.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         header = self.assetTable.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Stretch)
 
@@ -237,34 +560,42 @@ class MainWindow(QWidget):
         """
         Opens the selected asset in the appropriate application based on file type.
         """
-        selected_asset = self.assetTable.currentItem()
-        if not selected_asset:
+        record = self.selected_record()
+        if not record:
             QMessageBox.warning(self, "No Selection", "Please select an asset to open.")
             return
 
-        row = selected_asset.row()
-        path_item = self.assetTable.item(row, 3)
-        asset_path = path_item.data(Qt.UserRole)
+        asset_path = record.path
 
         if not os.path.exists(asset_path):
             QMessageBox.warning(self, "File Not Found", f"The asset file does not exist: {asset_path}")
             return
+        from core.project_generation import materialize_stub
+        from core.dcc_launcher import open_in_maya, open_in_photoshop, open_in_txt_editor
+        # Lazily created stubs get their template contents just before the first open
+        materialize_stub(asset_path)
 
-        # Launch the asset in the correct application
-        if asset_path.endswith(".ma"):
-            open_in_maya(asset_path)
-        elif asset_path.endswith(".psd"):
-            open_in_photoshop(asset_path)
-        elif asset_path.endswith(".txt"):
-            open_in_txt_editor(asset_path)
+        # Launch the asset in the correct application, reusing a running session where possible
+        try:
+            if asset_path.endswith(".ma"):
+                open_in_maya(asset_path)
+            elif asset_path.endswith(".psd"):
+                open_in_photoshop(asset_path)
+            elif asset_path.endswith(".txt"):
+                open_in_txt_editor(asset_path)
+        except OSError as e:
+            QMessageBox.warning(self, "Application Not Found", str(e))
 
     def rename_project(self):
         old_name = self.projectCombo.currentText()
         new_name, ok = QInputDialog.getText(self, "Rename Project", "Enter new project name:")
         if ok and is_valid_name(new_name):
-            os.rename(os.path.join(ROOT_DIR, "Projects", old_name), 
-                      os.path.join(ROOT_DIR, "Projects", new_name))
-            self.store.rename_project(old_name, new_name)
+            from core.asset_ops import rename_project
+            try:
+                rename_project(self.store, old_name, new_name)
+            except (OSError, ValueError) as e:
+                self.report_write_error("Rename Failed", "The project was not renamed", e)
+                return
             self.populate_project_combo()
 
     def delete_project(self):
@@ -272,48 +603,132 @@ class MainWindow(QWidget):
         confirm = QMessageBox.question(
             self,
             "Delete Project",
-            f"Are you sure you want to delete the project '{name}'? This action cannot be undone.",
+            f"Are you sure you want to delete the project '{name}'? It can be restored until the trash is purged.",
             QMessageBox.Yes | QMessageBox.No,
         )
         if confirm == QMessageBox.Yes:
-            shutil.rmtree(os.path.join(ROOT_DIR, "Projects", name), ignore_errors=True)
-            self.store.delete_project(name)
+            from core.trash import trash_project
+            try:
+                trash_project(self.store, name)
+            except (OSError, ValueError) as e:
+                self.report_write_error("Delete Failed", "The project was not deleted", e)
+                return
             self.populate_project_combo()
+            self.schedule_purge()
 
     def rename_asset(self):
-        row = self.assetTable.currentRow()
-        if row < 0:
+        record = self.selected_record()
+        if not record:
             QMessageBox.warning(self, "No Selection", "Please select an asset to rename.")
             return
-        old_name = self.assetTable.item(row, 0).text()
+        old_name = record.name
         new_name, ok = QInputDialog.getText(self, "Rename Asset", "Enter new asset name:")
         if ok and is_valid_name(new_name):
             project = self.projectCombo.currentText()
-            self.store.rename_asset(project, old_name, new_name)
-            asset_type = self.assetTable.item(row, 1).text()
-            asset_subtype = self.assetTable.item(row, 2).text()
-            asset_path = os.path.join(ROOT_DIR, "Projects", project, "ArtDepot", asset_type, asset_subtype, old_name)
-            new_asset_path = os.path.join(ROOT_DIR, "Projects", project, "ArtDepot", asset_type, asset_subtype, new_name)
-            os.rename(asset_path, new_asset_path)
+            from core.asset_ops import rename_asset
+            try:
+                rename_asset(self.store, project, record.type, old_name, new_name, self.reference_index())
+            except (OSError, ValueError) as e:
+                self.report_write_error("Rename Failed", "The asset was not renamed", e)
             self.populate_asset_list()
 
     def delete_asset(self):
-        row = self.assetTable.currentRow()
-        if row < 0:
+        record = self.selected_record()
+        if not record:
             QMessageBox.warning(self, "No Selection", "Please select an asset to delete.")
             return
-        asset_name = self.assetTable.item(row, 0).text()
+        asset_name = record.name
         project = self.projectCombo.currentText()
         confirm = QMessageBox.question(
             self,
             "Delete Asset",
-            f"Are you sure you want to delete the asset '{asset_name}'? This action cannot be undone.",
+            f"Are you sure you want to delete the asset '{asset_name}'? It can be restored until the trash is purged.",
             QMessageBox.Yes | QMessageBox.No,
         )
         if confirm == QMessageBox.Yes:
-            self.store.delete_asset(project, asset_name)
-            asset_type = self.assetTable.item(row, 1).text()
-            asset_subtype = self.assetTable.item(row, 2).text()
-            asset_path = os.path.join(ROOT_DIR, "Projects", project, "ArtDepot", asset_type, asset_subtype, asset_name)
-            shutil.rmtree(asset_path, ignore_errors=True)
-            self.populate_asset_list()
\ No newline at end of file
+            from core.trash import trash_asset
+            try:
+                trash_asset(self.store, project, record.type, asset_name, self.reference_index())
+            except (OSError, ValueError) as e:
+                self.report_write_error("Delete Failed", "The asset was not deleted", e)
+                return
+            self.populate_asset_list()
+            self.schedule_purge()
+
+    def restore_deleted(self):
+        """
+        Lets the user pick a deleted project or asset that hasn't been purged yet and restores it.
+        """
+        from core.trash import list_trash, restore
+        entries = [e for e in reversed(list_trash()) if not e.purging]
+        if not entries:
+            QMessageBox.information(self, "Restore Deleted", "There is nothing to restore.")
+            return
+        labels = []
+        for entry in entries:
+            deleted = time.strftime("%H:%M", time.localtime(entry.deleted_at))
+            if entry.kind == "project":
+                labels.append(f"{deleted}  project '{entry.project}'")
+            else:
+                labels.append(f"{deleted}  asset '{entry.type}/{entry.name}' of '{entry.project}'")
+        label, ok = QInputDialog.getItem(self, "Restore Deleted", "Deleted items, newest first:", labels, 0, False)
+        if not ok:
+            return
+        entry = entries[labels.index(label)]
+        try:
+            restore(self.store, entry.id)
+        except (OSError, ValueError) as e:
+            self.report_write_error("Restore Failed", "The item was not restored", e)
+            return
+        current = self.projectCombo.currentText()
+        self.populate_project_combo()
+        index = self.projectCombo.findText(current)
+        if index >= 0:
+            self.projectCombo.setCurrentIndex(index)
+        self.populate_asset_list()
+
+    def schedule_purge(self):
+        """
+        Arms the purge timer for when the oldest trash entry becomes due.
+        """
+        if self._purge_worker is not None or not os.path.isdir(TRASH_DIR):
+            return
+        from core.trash import list_trash
+        entries = list_trash()
+        if entries:
+            due_in = entries[0].deleted_at + TRASH_PURGE_DELAY_S - time.time()
+            self._purge_timer.start(min(max(0, int(due_in * 1000)), self.MAX_TIMER_MS))
+
+    def purge_trash(self):
+        """
+        Starts purging the due trash entries on the thread pool.
+        """
+        if self._purge_worker is not None:
+            return
+        from gui.purge_worker import TrashPurgeWorker
+        worker = self._purge_worker = TrashPurgeWorker(TRASH_PURGE_DELAY_S)
+        worker.signals.progress.connect(self.on_purge_progress)
+        worker.signals.finished.connect(self.on_purge_finished)
+        QThreadPool.globalInstance().start(worker)
+
+    def on_purge_progress(self, done, total):
+        if total:
+            self.purgeProgress.setMaximum(total)
+            self.purgeProgress.setValue(done)
+            self.purgeProgress.show()
+
+    def on_purge_finished(self, purged, errors):
+        self._purge_worker = None
+        self.purgeProgress.hide()
+        if errors:
+            if not self._purge_retry_ms:
+                # Only the first failure is reported; retries stay quiet until one succeeds
+                details = "\n".join(f"{path}: {message}" for path, message in errors[:10])
+                more = f"\n... and {len(errors) - 10} more" if len(errors) > 10 else ""
+                QMessageBox.warning(self, "Purge Incomplete",
+                                    f"Some deleted files could not be removed and will be retried later:\n\n{details}{more}")
+            self._purge_retry_ms = min(self._purge_retry_ms * 2 or self.PURGE_RETRY_MS, self.PURGE_RETRY_MAX_MS)
+            self._purge_timer.start(self._purge_retry_ms)
+            return
+        self._purge_retry_ms = 0
+        self.schedule_purge()
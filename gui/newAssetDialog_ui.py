@@ -1,124 +1,90 @@
 # -*- coding: utf-8 -*-
 
-################################################################################
-## Form generated from reading UI file 'newAssetDialog.ui'
-##
-## Created by: Qt User Interface Compiler version 6.8.2
-##
-## WARNING! All changes made in this file will be lost when recompiling UI file!
-################################################################################
+# Form implementation generated from reading ui file 'newAssetDialog.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
 
-from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
-    QMetaObject, QObject, QPoint, QRect,
-    QSize, QTime, QUrl, Qt)
-from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
-    QFont, QFontDatabase, QGradient, QIcon,
-    QImage, QKeySequence, QLinearGradient, QPainter,
-    QPalette, QPixmap, QRadialGradient, QTransform)
-from PySide6.QtWidgets import (QAbstractButton, QApplication, QButtonGroup, QComboBox,
-    QDialog, QDialogButtonBox, QGridLayout, QLabel,
-    QLayout, QLineEdit, QRadioButton, QSizePolicy,
-    QSpacerItem, QWidget)
 
 class Ui_Dialog(object):
     def setupUi(self, Dialog):
-        if not Dialog.objectName():
-            Dialog.setObjectName(u"Dialog")
-        Dialog.setWindowModality(Qt.ApplicationModal)
+        Dialog.setObjectName("Dialog")
+        Dialog.setWindowModality(QtCore.Qt.ApplicationModal)
         Dialog.resize(900, 300)
-        sizePolicy = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
         sizePolicy.setHeightForWidth(Dialog.sizePolicy().hasHeightForWidth())
         Dialog.setSizePolicy(sizePolicy)
-        Dialog.setMinimumSize(QSize(900, 300))
-        self.gridLayoutWidget = QWidget(Dialog)
-        self.gridLayoutWidget.setObjectName(u"gridLayoutWidget")
-        self.gridLayoutWidget.setGeometry(QRect(10, 10, 469, 147))
-        self.gridLayout = QGridLayout(self.gridLayoutWidget)
-        self.gridLayout.setObjectName(u"gridLayout")
-        self.gridLayout.setSizeConstraint(QLayout.SetFixedSize)
+        Dialog.setMinimumSize(QtCore.QSize(900, 300))
+        self.gridLayoutWidget = QtWidgets.QWidget(Dialog)
+        self.gridLayoutWidget.setGeometry(QtCore.QRect(10, 10, 469, 147))
+        self.gridLayoutWidget.setObjectName("gridLayoutWidget")
+        self.gridLayout = QtWidgets.QGridLayout(self.gridLayoutWidget)
+        self.gridLayout.setSizeConstraint(QtWidgets.QLayout.SetFixedSize)
         self.gridLayout.setContentsMargins(0, 0, 0, 0)
-        self.label_2 = QLabel(self.gridLayoutWidget)
-        self.label_2.setObjectName(u"label_2")
-
+        self.gridLayout.setObjectName("gridLayout")
+        self.label_2 = QtWidgets.QLabel(self.gridLayoutWidget)
+        self.label_2.setObjectName("label_2")
         self.gridLayout.addWidget(self.label_2, 1, 0, 1, 1)
-
-        self.label_3 = QLabel(self.gridLayoutWidget)
-        self.label_3.setObjectName(u"label_3")
-
+        self.label_3 = QtWidgets.QLabel(self.gridLayoutWidget)
+        self.label_3.setText("")
+        self.label_3.setObjectName("label_3")
         self.gridLayout.addWidget(self.label_3, 4, 0, 1, 1)
-
-        self.assetTypeCombo = QComboBox(self.gridLayoutWidget)
-        self.assetTypeCombo.setObjectName(u"assetTypeCombo")
-
+        self.assetTypeCombo = QtWidgets.QComboBox(self.gridLayoutWidget)
+        self.assetTypeCombo.setObjectName("assetTypeCombo")
         self.gridLayout.addWidget(self.assetTypeCombo, 1, 1, 1, 1)
-
-        self.propButton = QRadioButton(self.gridLayoutWidget)
-        self.buttonGroup = QButtonGroup(Dialog)
-        self.buttonGroup.setObjectName(u"buttonGroup")
+        self.propButton = QtWidgets.QRadioButton(self.gridLayoutWidget)
+        self.propButton.setObjectName("propButton")
+        self.buttonGroup = QtWidgets.QButtonGroup(Dialog)
+        self.buttonGroup.setObjectName("buttonGroup")
         self.buttonGroup.addButton(self.propButton)
-        self.propButton.setObjectName(u"propButton")
-
         self.gridLayout.addWidget(self.propButton, 2, 2, 1, 1)
-
-        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)
-
-        self.gridLayout.addItem(self.verticalSpacer, 4, 1, 1, 1)
-
-        self.label = QLabel(self.gridLayoutWidget)
-        self.label.setObjectName(u"label")
-
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Fixed)
+        self.gridLayout.addItem(spacerItem, 4, 1, 1, 1)
+        self.label = QtWidgets.QLabel(self.gridLayoutWidget)
+        self.label.setObjectName("label")
         self.gridLayout.addWidget(self.label, 0, 0, 1, 1)
-
-        self.enviroButton = QRadioButton(self.gridLayoutWidget)
+        self.enviroButton = QtWidgets.QRadioButton(self.gridLayoutWidget)
+        self.enviroButton.setObjectName("enviroButton")
         self.buttonGroup.addButton(self.enviroButton)
-        self.enviroButton.setObjectName(u"enviroButton")
-
         self.gridLayout.addWidget(self.enviroButton, 2, 1, 1, 1)
-
-        self.charButton = QRadioButton(self.gridLayoutWidget)
+        self.charButton = QtWidgets.QRadioButton(self.gridLayoutWidget)
+        self.charButton.setObjectName("charButton")
         self.buttonGroup.addButton(self.charButton)
-        self.charButton.setObjectName(u"charButton")
-
         self.gridLayout.addWidget(self.charButton, 2, 0, 1, 1)
-
-        self.assetName = QLineEdit(self.gridLayoutWidget)
-        self.assetName.setObjectName(u"assetName")
-
+        self.assetName = QtWidgets.QLineEdit(self.gridLayoutWidget)
+        self.assetName.setObjectName("assetName")
         self.gridLayout.addWidget(self.assetName, 0, 1, 1, 1)
-
-        self.referenceCombo = QComboBox(self.gridLayoutWidget)
-        self.referenceCombo.setObjectName(u"referenceCombo")
-
+        self.referenceCombo = QtWidgets.QComboBox(self.gridLayoutWidget)
+        self.referenceCombo.setObjectName("referenceCombo")
         self.gridLayout.addWidget(self.referenceCombo, 2, 3, 1, 1)
-
-        self.horizontalSpacer = QSpacerItem(138, 20, QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Minimum)
-
-        self.gridLayout.addItem(self.horizontalSpacer, 0, 3, 1, 1)
-
-        self.buttonBox = QDialogButtonBox(self.gridLayoutWidget)
-        self.buttonBox.setObjectName(u"buttonBox")
-        self.buttonBox.setOrientation(Qt.Horizontal)
-        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
-
+        spacerItem1 = QtWidgets.QSpacerItem(138, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout.addItem(spacerItem1, 0, 3, 1, 1)
+        self.buttonBox = QtWidgets.QDialogButtonBox(self.gridLayoutWidget)
+        self.buttonBox.setOrientation(QtCore.Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Cancel|QtWidgets.QDialogButtonBox.Ok)
+        self.buttonBox.setObjectName("buttonBox")
         self.gridLayout.addWidget(self.buttonBox, 4, 3, 1, 1)
 
-
         self.retranslateUi(Dialog)
-        self.buttonBox.accepted.connect(Dialog.accept)
-        self.buttonBox.rejected.connect(Dialog.reject)
-
-        QMetaObject.connectSlotsByName(Dialog)
-    # setupUi
+        self.buttonBox.accepted.connect(Dialog.accept) # type: ignore
+        self.buttonBox.rejected.connect(Dialog.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
 
     def retranslateUi(self, Dialog):
-        Dialog.setWindowTitle(QCoreApplication.translate("Dialog", u"Dialog", None))
-        self.label_2.setText(QCoreApplication.translate("Dialog", u"Asset Type:", None))
-        self.label_3.setText("")
-        self.propButton.setText(QCoreApplication.translate("Dialog", u"Prop", None))
-        self.label.setText(QCoreApplication.translate("Dialog", u"Asset Name:", None))
-        self.enviroButton.setText(QCoreApplication.translate("Dialog", u"Environment", None))
-        self.charButton.setText(QCoreApplication.translate("Dialog", u"Character", None))
-    # retranslateUi
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", "Dialog"))
+        self.label_2.setText(_translate("Dialog", "Asset Type:"))
+        self.propButton.setText(_translate("Dialog", "Prop"))
+        self.label.setText(_translate("Dialog", "Asset Name:"))
+        self.enviroButton.setText(_translate("Dialog", "Environment"))
+        self.charButton.setText(_translate("Dialog", "Character"))
+
 
+UI_SOURCE_HASH = "dfbe9bf6695d9eea9d42270bb275da1182112e20"
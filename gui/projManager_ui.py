@@ -1,132 +1,101 @@
 # -*- coding: utf-8 -*-
 
-################################################################################
-## Form generated from reading UI file 'projManager.ui'
-##
-## Created by: Qt User Interface Compiler version 6.8.2
-##
-## WARNING! All changes made in this file will be lost when recompiling UI file!
-################################################################################
+# Form implementation generated from reading ui file 'projManager.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
 
-from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
-    QMetaObject, QObject, QPoint, QRect,
-    QSize, QTime, QUrl, Qt)
-from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
-    QFont, QFontDatabase, QGradient, QIcon,
-    QImage, QKeySequence, QLinearGradient, QPainter,
-    QPalette, QPixmap, QRadialGradient, QTransform)
-from PySide6.QtWidgets import (QApplication, QComboBox, QGridLayout, QHeaderView,
-    QLabel, QPushButton, QSizePolicy, QSpacerItem,
-    QTableWidget, QTableWidgetItem, QVBoxLayout, QWidget)
 
 class Ui_Form(object):
     def setupUi(self, Form):
-        if not Form.objectName():
-            Form.setObjectName(u"Form")
+        Form.setObjectName("Form")
         Form.resize(1021, 1000)
-        sizePolicy = QSizePolicy(QSizePolicy.Policy.MinimumExpanding, QSizePolicy.Policy.MinimumExpanding)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding, QtWidgets.QSizePolicy.MinimumExpanding)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
         sizePolicy.setHeightForWidth(Form.sizePolicy().hasHeightForWidth())
         Form.setSizePolicy(sizePolicy)
-        Form.setMinimumSize(QSize(1000, 1000))
-        self.verticalLayoutWidget = QWidget(Form)
-        self.verticalLayoutWidget.setObjectName(u"verticalLayoutWidget")
-        self.verticalLayoutWidget.setGeometry(QRect(10, 10, 1002, 1062))
-        self.verticalLayout = QVBoxLayout(self.verticalLayoutWidget)
-        self.verticalLayout.setObjectName(u"verticalLayout")
+        Form.setMinimumSize(QtCore.QSize(1000, 1000))
+        self.verticalLayoutWidget = QtWidgets.QWidget(Form)
+        self.verticalLayoutWidget.setGeometry(QtCore.QRect(10, 10, 1002, 1062))
+        self.verticalLayoutWidget.setObjectName("verticalLayoutWidget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.verticalLayoutWidget)
         self.verticalLayout.setContentsMargins(0, 0, 0, 0)
-        self.gridLayout = QGridLayout()
-        self.gridLayout.setObjectName(u"gridLayout")
-        self.label_2 = QLabel(self.verticalLayoutWidget)
-        self.label_2.setObjectName(u"label_2")
-
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.gridLayout = QtWidgets.QGridLayout()
+        self.gridLayout.setObjectName("gridLayout")
+        self.label_2 = QtWidgets.QLabel(self.verticalLayoutWidget)
+        self.label_2.setObjectName("label_2")
         self.gridLayout.addWidget(self.label_2, 1, 0, 1, 1)
-
-        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
-
-        self.gridLayout.addItem(self.horizontalSpacer, 1, 5, 1, 1)
-
-        self.assetCreate = QPushButton(self.verticalLayoutWidget)
-        self.assetCreate.setObjectName(u"assetCreate")
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout.addItem(spacerItem, 1, 5, 1, 1)
+        self.assetCreate = QtWidgets.QPushButton(self.verticalLayoutWidget)
         self.assetCreate.setEnabled(False)
-
+        self.assetCreate.setObjectName("assetCreate")
         self.gridLayout.addWidget(self.assetCreate, 2, 2, 1, 1)
-
-        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Preferred)
-
-        self.gridLayout.addItem(self.verticalSpacer, 2, 1, 1, 1)
-
-        self.projectCreate = QPushButton(self.verticalLayoutWidget)
-        self.projectCreate.setObjectName(u"projectCreate")
-
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Preferred)
+        self.gridLayout.addItem(spacerItem1, 2, 1, 1, 1)
+        self.projectCreate = QtWidgets.QPushButton(self.verticalLayoutWidget)
+        self.projectCreate.setObjectName("projectCreate")
         self.gridLayout.addWidget(self.projectCreate, 1, 2, 1, 1)
-
-        self.projectCombo = QComboBox(self.verticalLayoutWidget)
-        self.projectCombo.setObjectName(u"projectCombo")
-
+        self.projectCombo = QtWidgets.QComboBox(self.verticalLayoutWidget)
+        self.projectCombo.setObjectName("projectCombo")
         self.gridLayout.addWidget(self.projectCombo, 1, 1, 1, 1)
-
-        self.openAssetButton = QPushButton(self.verticalLayoutWidget)
-        self.openAssetButton.setObjectName(u"openAssetButton")
+        self.openAssetButton = QtWidgets.QPushButton(self.verticalLayoutWidget)
         self.openAssetButton.setEnabled(False)
-
+        self.openAssetButton.setObjectName("openAssetButton")
         self.gridLayout.addWidget(self.openAssetButton, 1, 6, 1, 1)
-
-        self.renameProj = QPushButton(self.verticalLayoutWidget)
-        self.renameProj.setObjectName(u"renameProj")
+        self.renameProj = QtWidgets.QPushButton(self.verticalLayoutWidget)
         self.renameProj.setEnabled(False)
-
+        self.renameProj.setObjectName("renameProj")
         self.gridLayout.addWidget(self.renameProj, 1, 3, 1, 1)
-
-        self.deleteProj = QPushButton(self.verticalLayoutWidget)
-        self.deleteProj.setObjectName(u"deleteProj")
+        self.deleteProj = QtWidgets.QPushButton(self.verticalLayoutWidget)
         self.deleteProj.setEnabled(False)
-
+        self.deleteProj.setObjectName("deleteProj")
         self.gridLayout.addWidget(self.deleteProj, 1, 4, 1, 1)
-
-        self.renameAsset = QPushButton(self.verticalLayoutWidget)
-        self.renameAsset.setObjectName(u"renameAsset")
+        self.renameAsset = QtWidgets.QPushButton(self.verticalLayoutWidget)
         self.renameAsset.setEnabled(False)
-
+        self.renameAsset.setObjectName("renameAsset")
         self.gridLayout.addWidget(self.renameAsset, 2, 6, 1, 1)
-
-        self.deleteAsset = QPushButton(self.verticalLayoutWidget)
-        self.deleteAsset.setObjectName(u"deleteAsset")
+        self.assetFilter = QtWidgets.QLineEdit(self.verticalLayoutWidget)
+        self.assetFilter.setClearButtonEnabled(True)
+        self.assetFilter.setObjectName("assetFilter")
+        self.gridLayout.addWidget(self.assetFilter, 3, 1, 1, 1)
+        self.deleteAsset = QtWidgets.QPushButton(self.verticalLayoutWidget)
         self.deleteAsset.setEnabled(False)
-
+        self.deleteAsset.setObjectName("deleteAsset")
         self.gridLayout.addWidget(self.deleteAsset, 3, 6, 1, 1)
-
-
         self.verticalLayout.addLayout(self.gridLayout)
-
-        self.assetTable = QTableWidget(self.verticalLayoutWidget)
-        self.assetTable.setObjectName(u"assetTable")
-        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.MinimumExpanding)
-        sizePolicy1.setHorizontalStretch(0)
-        sizePolicy1.setVerticalStretch(0)
-        sizePolicy1.setHeightForWidth(self.assetTable.sizePolicy().hasHeightForWidth())
-        self.assetTable.setSizePolicy(sizePolicy1)
+        self.assetTable = QtWidgets.QTableView(self.verticalLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.MinimumExpanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.assetTable.sizePolicy().hasHeightForWidth())
+        self.assetTable.setSizePolicy(sizePolicy)
         self.assetTable.setAlternatingRowColors(True)
-        self.assetTable.setColumnCount(0)
-
+        self.assetTable.setObjectName("assetTable")
         self.verticalLayout.addWidget(self.assetTable)
 
-
         self.retranslateUi(Form)
-
-        QMetaObject.connectSlotsByName(Form)
-    # setupUi
+        QtCore.QMetaObject.connectSlotsByName(Form)
 
     def retranslateUi(self, Form):
-        Form.setWindowTitle(QCoreApplication.translate("Form", u"Form", None))
-        self.label_2.setText(QCoreApplication.translate("Form", u"Project:", None))
-        self.assetCreate.setText(QCoreApplication.translate("Form", u"+ New Asset", None))
-        self.projectCreate.setText(QCoreApplication.translate("Form", u"+ New Project", None))
-        self.openAssetButton.setText(QCoreApplication.translate("Form", u"Open Asset", None))
-        self.renameProj.setText(QCoreApplication.translate("Form", u"Rename Project", None))
-        self.deleteProj.setText(QCoreApplication.translate("Form", u"Delete Project", None))
-        self.renameAsset.setText(QCoreApplication.translate("Form", u"Rename Asset", None))
-        self.deleteAsset.setText(QCoreApplication.translate("Form", u"Delete Asset", None))
-    # retranslateUi
-
+        _translate = QtCore.QCoreApplication.translate
+        Form.setWindowTitle(_translate("Form", "Form"))
+        self.label_2.setText(_translate("Form", "Project:"))
+        self.assetCreate.setText(_translate("Form", "+ New Asset"))
+        self.projectCreate.setText(_translate("Form", "+ New Project"))
+        self.openAssetButton.setText(_translate("Form", "Open Asset"))
+        self.renameProj.setText(_translate("Form", "Rename Project"))
+        self.deleteProj.setText(_translate("Form", "Delete Project"))
+        self.renameAsset.setText(_translate("Form", "Rename Asset"))
+        self.assetFilter.setPlaceholderText(_translate("Form", "Filter assets..."))
+        self.deleteAsset.setText(_translate("Form", "Delete Asset"))
+
+
+UI_SOURCE_HASH = "b56018cea0587f3fdb9e3197700785616662a4d3"
@@ -0,0 +1,37 @@
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from core.trash import purge
+
+class PurgeSignals(QObject):
+    """
+    Signals posted from a TrashPurgeWorker back to the GUI thread.
+    """
+    # files removed, files to remove
+    progress = pyqtSignal(int, int)
+    # ids of the purged entries, list of (path, message) errors
+    finished = pyqtSignal(list, list)
+
+class TrashPurgeWorker(QRunnable):
+    """
+    Deletes trashed projects and assets for good off the GUI thread.
+    """
+    def __init__(self, older_than=None):
+        """
+        Prepare a purge of the entries deleted more than older_than seconds ago, or of all entries.
+        """
+        super(TrashPurgeWorker, self).__init__()
+        self.older_than = older_than
+        self.signals = PurgeSignals()
+        self._cancelled = False
+
+    def cancel(self):
+        """
+        Ask the purge to stop; unfinished entries are picked up by the next purge.
+        """
+        self._cancelled = True
+
+    def run(self):
+        result = purge(older_than=self.older_than,
+                       progress=self.signals.progress.emit,
+                       cancelled=lambda: self._cancelled)
+        self.signals.finished.emit(list(result.purged), [list(e) for e in result.errors])
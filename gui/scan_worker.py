@@ -0,0 +1,55 @@
+import os
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from core.asset_scan import get_category_dir, scan_assets
+
+class ScanSignals(QObject):
+    """
+    Signals posted from an AssetScanWorker back to the GUI thread.
+    Every signal carries the scan generation so stale results can be dropped.
+    """
+    # generation, list of AssetRecords
+    batchReady = pyqtSignal(int, list)
+    # generation, list of existing category folders to watch
+    finished = pyqtSignal(int, list)
+
+class AssetScanWorker(QRunnable):
+    """
+    Scans a project's asset folders off the GUI thread and posts the
+    resulting AssetRecords back in batches.
+    """
+    def __init__(self, generation, project, assets, stat_cache=None):
+        """
+        Prepare a scan of the given store entries for a project.
+        With a StatCache, unchanged categories are served from it and the
+        cache is saved once the scan completes.
+        """
+        super(AssetScanWorker, self).__init__()
+        self.generation = generation
+        self.project = project
+        self.assets = list(assets)
+        self.stat_cache = stat_cache
+        self.signals = ScanSignals()
+        self._cancelled = False
+
+    def cancel(self):
+        """
+        Ask the scan to stop; batches still in flight are dropped by the receiver.
+        """
+        self._cancelled = True
+
+    def run(self):
+        cancelled = lambda: self._cancelled
+        if self.stat_cache is not None:
+            batches = self.stat_cache.scan(self.assets, cancelled=cancelled)
+        else:
+            batches = scan_assets(self.project, self.assets, cancelled=cancelled)
+        for batch in batches:
+            self.signals.batchReady.emit(self.generation, batch)
+        if self._cancelled:
+            return
+        if self.stat_cache is not None:
+            self.stat_cache.save()
+
+        category_dirs = {get_category_dir(self.project, a.get("type", "Unknown")) for a in self.assets}
+        self.signals.finished.emit(self.generation, [d for d in category_dirs if os.path.isdir(d)])
@@ -0,0 +1,47 @@
+import os
+import hashlib
+import importlib
+
+"""
+Builds widgets from the precompiled *_ui.py modules next to the .ui files.
+
+Each compiled module records a hash of the .ui file it was generated from
+(see gui/build_ui.py). If the .ui file has been edited since, the widget
+falls back to parsing the .ui file at runtime so changes are never lost.
+"""
+
+# Folder holding the .ui files and their compiled modules
+UI_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def ui_source_hash(ui_path):
+    """
+    Return the hash of a .ui file as recorded in its compiled module.
+    Line endings are normalized so CRLF checkouts hash the same.
+    """
+    with open(ui_path, 'rb') as f:
+        return hashlib.sha1(f.read().replace(b"\r\n", b"\n")).hexdigest()
+
+def load_ui(widget, ui_name):
+    """
+    Set up widget from the compiled module gui/<ui_name>_ui.py, or from
+    gui/<ui_name>.ui when the compiled module is missing or out of date.
+    """
+    ui_path = os.path.join(UI_DIR, f"{ui_name}.ui")
+    try:
+        module = importlib.import_module(f"gui.{ui_name}_ui")
+    except ImportError:
+        module = None
+
+    # Frozen builds may ship without the .ui files; the compiled module is then authoritative
+    if module is not None and (not os.path.exists(ui_path)
+                               or getattr(module, "UI_SOURCE_HASH", None) == ui_source_hash(ui_path)):
+        form_class = next(getattr(module, name) for name in dir(module) if name.startswith("Ui_"))
+        form = form_class()
+        form.setupUi(widget)
+        # Expose the child widgets as attributes of the widget, like uic.loadUi does
+        for name, value in vars(form).items():
+            setattr(widget, name, value)
+        return
+
+    from PyQt5 import uic
+    uic.loadUi(ui_path, widget)
@@ -0,0 +1,253 @@
+import sys
+import json
+import argparse
+
+from data.project_data import open_store
+from utils.file_utils import DEFAULT_PROJECT_TREE, AUDIT_WORKERS, is_valid_name
+
+"""
+Headless command-line interface for the Project Management Tool.
+
+Built only on core and data so it never imports Qt and starts quickly on
+farm nodes and in pipeline scripts; core modules are imported by the
+commands that need them. Every command prints JSON to stdout.
+
+Usage: python pmt_cli.py <command> [args]
+"""
+
+class CliError(Exception):
+    """
+    Raised for invalid input; reported as a JSON error with exit code 1.
+    """
+
+def _require_valid_name(kind, name):
+    if not is_valid_name(name):
+        raise CliError(f"{kind} names can only contain letters, numbers, underscores, and dashes.")
+
+def _require_project(store, project):
+    if project not in store.get_projects():
+        raise CliError(f"Project '{project}' does not exist.")
+
+def _find_asset(store, project, asset_name):
+    _require_project(store, project)
+    for asset in store.get_assets(project):
+        if asset["name"] == asset_name:
+            return asset
+    raise CliError(f"Asset '{asset_name}' does not exist in project '{project}'.")
+
+def cmd_create_project(store, args):
+    from core.asset_ops import create_project
+    _require_valid_name("Project", args.name)
+    path = create_project(store, args.name, args.template)
+    return {"project": args.name, "path": path}
+
+def cmd_create_asset(store, args):
+    from core.asset_ops import create_asset
+    _require_project(store, args.project)
+    _require_valid_name("Asset", args.name)
+    if args.type.count("/") != 1:
+        raise CliError(f"Invalid asset type '{args.type}', expected 'Category/Subtype'.")
+    if args.type.split("/")[0] in ("Rigs", "Animations") and not args.reference:
+        raise CliError("Rigs and Animations require a reference object.")
+    path = create_asset(store, args.project, args.type, args.name, args.reference)
+    return {"project": args.project, "name": args.name, "type": args.type, "path": path}
+
+def cmd_list(store, args):
+    if not args.project:
+        return {"projects": store.get_projects()}
+    _require_project(store, args.project)
+    stubs = {}
+    if args.templates:
+        from core.asset_scan import get_asset_key
+        from core.content_index import find_template_stubs
+        stubs = find_template_stubs(args.project)
+    assets = []
+    for asset in store.get_assets(args.project):
+        entry = {"name": asset["name"], "type": asset["type"]}
+        if args.templates:
+            entry["template"] = get_asset_key(asset["type"], asset["name"]) in stubs
+        if args.files:
+            from core.asset_scan import scan_asset
+            record = scan_asset(args.project, asset["name"], asset["type"])
+            entry["path"] = record.path if record else None
+            entry["mtime"] = record.mtime if record else None
+        assets.append(entry)
+    return {"project": args.project, "assets": assets}
+
+def cmd_rename(store, args):
+    if args.asset:
+        from core.asset_ops import rename_asset
+        asset = _find_asset(store, args.project, args.asset)
+        _require_valid_name("Asset", args.new_name)
+        result = rename_asset(store, args.project, asset["type"], args.asset, args.new_name)
+        return {"project": args.project, "renamed": args.asset, "to": args.new_name,
+                "rewritten": result.rewritten}
+
+    from core.asset_ops import rename_project
+    _require_project(store, args.project)
+    _require_valid_name("Project", args.new_name)
+    if args.new_name in store.get_projects():
+        raise CliError(f"Project '{args.new_name}' already exists.")
+    rename_project(store, args.project, args.new_name)
+    return {"renamed": args.project, "to": args.new_name}
+
+def cmd_delete(store, args):
+    from core.trash import trash_asset, trash_project, purge
+    if args.asset:
+        asset = _find_asset(store, args.project, args.asset)
+        entry = trash_asset(store, args.project, asset["type"], args.asset)
+        result = {"project": args.project, "deleted": args.asset}
+    else:
+        _require_project(store, args.project)
+        entry = trash_project(store, args.project)
+        result = {"deleted": args.project}
+    if entry is None:
+        # Its folder was already gone; only the store entry was removed
+        return result
+    if args.keep:
+        result["trash_id"] = entry.id
+        return result
+    errors = purge([entry.id]).errors
+    if errors:
+        result["errors"] = [{"path": path, "error": message} for path, message in errors]
+    return result
+
+def cmd_trash(store, args):
+    from core.trash import list_trash, restore, purge
+    if args.action == "restore":
+        if not args.id:
+            raise CliError("Give the id of the trash entry to restore.")
+        return {"restored": restore(store, args.id)}
+    if args.action == "purge":
+        result = purge(older_than=args.older_than)
+        return {"purged": result.purged,
+                "errors": [{"path": path, "error": message} for path, message in result.errors]}
+    return {"trash": [entry._asdict() for entry in list_trash()]}
+
+def cmd_export(store, args):
+    from core.archive import export_project
+    _require_project(store, args.project)
+    result = export_project(store, args.project, args.archive, skip_templates=args.skip_templates)
+    return dict(result._asdict(), archive=args.archive)
+
+def cmd_import(store, args):
+    from core.archive import import_project
+    if args.name:
+        _require_valid_name("Project", args.name)
+    return dict(import_project(store, args.archive, args.name)._asdict(), archive=args.archive)
+
+def cmd_batch(store, args):
+    from core.batch import create_assets_batch, load_manifest
+    results = create_assets_batch(store, load_manifest(args.manifest))
+    return {
+        "created": sum(1 for r in results if r.error is None),
+        "failed": [dict(r.item, error=r.error) for r in results if r.error],
+    }
+
+def cmd_deps(store, args):
+    from core.asset_scan import get_asset_key
+    from core.reference_index import ReferenceIndex
+    asset = _find_asset(store, args.project, args.asset)
+    index = ReferenceIndex(args.project)
+    if args.rebuild:
+        index.rebuild()
+        index.save()
+    key = get_asset_key(asset["type"], asset["name"])
+    if args.transitive:
+        return {"asset": key, "references": index.all_references(key), "dependents": index.all_dependents(key)}
+    return {"asset": key, "references": index.references(key), "dependents": index.dependents(key)}
+
+def cmd_audit(store, args):
+    from core.audit import audit_project
+    _require_project(store, args.project)
+    result = audit_project(args.project, use_cache=not args.no_cache, max_workers=args.workers)
+    return {
+        "project": args.project,
+        "files": result.files,
+        "read": result.read,
+        "broken": [ref._asdict() for ref in result.broken],
+    }
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="pmt", description="Project Management Tool command line.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    p = commands.add_parser("create-project", help="create a project and its folder tree")
+    p.add_argument("name")
+    p.add_argument("--template", default=DEFAULT_PROJECT_TREE, help="project tree template")
+    p.set_defaults(func=cmd_create_project)
+
+    p = commands.add_parser("create-asset", help="create an asset in a project")
+    p.add_argument("project")
+    p.add_argument("type", help="Category/Subtype, e.g. Models/Props")
+    p.add_argument("name")
+    p.add_argument("--reference", help="asset to reference (required for Rigs and Animations)")
+    p.set_defaults(func=cmd_create_asset)
+
+    p = commands.add_parser("list", help="list projects, or the assets of a project")
+    p.add_argument("project", nargs="?")
+    p.add_argument("--files", action="store_true", help="include each asset's file path and mtime")
+    p.add_argument("--templates", action="store_true", help="flag assets whose file is still an untouched template stub")
+    p.set_defaults(func=cmd_list)
+
+    p = commands.add_parser("rename", help="rename a project, or an asset with --asset")
+    p.add_argument("project")
+    p.add_argument("new_name")
+    p.add_argument("--asset", help="asset to rename instead of the project")
+    p.set_defaults(func=cmd_rename)
+
+    p = commands.add_parser("delete", help="delete a project, or an asset with --asset")
+    p.add_argument("project")
+    p.add_argument("--asset", help="asset to delete instead of the project")
+    p.add_argument("--keep", action="store_true", help="leave it in the trash so it can be restored")
+    p.set_defaults(func=cmd_delete)
+
+    p = commands.add_parser("trash", help="list, restore or purge deleted projects and assets")
+    p.add_argument("action", choices=("list", "restore", "purge"), nargs="?", default="list")
+    p.add_argument("id", nargs="?", help="trash entry to restore")
+    p.add_argument("--older-than", type=float, help="only purge entries deleted more than this many seconds ago")
+    p.set_defaults(func=cmd_trash)
+
+    p = commands.add_parser("export", help="write a project to a tar or zip archive, storing repeated files once")
+    p.add_argument("project")
+    p.add_argument("archive", help=".zip, .tar, .tar.gz, .tar.bz2 or .tar.xz file to write")
+    p.add_argument("--skip-templates", action="store_true",
+                   help="don't store untouched template stubs; import makes them again from the templates")
+    p.set_defaults(func=cmd_export)
+
+    p = commands.add_parser("import", help="restore a project from an archive made by export")
+    p.add_argument("archive")
+    p.add_argument("--name", help="import under this name instead of the archived one")
+    p.set_defaults(func=cmd_import)
+
+    p = commands.add_parser("batch", help="create assets from a CSV or JSON manifest")
+    p.add_argument("manifest")
+    p.set_defaults(func=cmd_batch)
+
+    p = commands.add_parser("deps", help="show what an asset references and which assets depend on it")
+    p.add_argument("project")
+    p.add_argument("asset")
+    p.add_argument("--transitive", action="store_true", help="include indirect references and dependents")
+    p.add_argument("--rebuild", action="store_true", help="rebuild the project's reference index from its files first")
+    p.set_defaults(func=cmd_deps)
+
+    p = commands.add_parser("audit", help="find Maya file references that point to missing files")
+    p.add_argument("project")
+    p.add_argument("--no-cache", action="store_true", help="re-read every file instead of only changed ones")
+    p.add_argument("--workers", type=int, default=AUDIT_WORKERS, help="number of reader processes")
+    p.set_defaults(func=cmd_audit)
+
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        result = args.func(open_store(), args)
+    except (CliError, OSError, ValueError) as e:
+        print(json.dumps({"error": str(e)}))
+        return 1
+    print(json.dumps(result, indent=2))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
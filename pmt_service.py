@@ -0,0 +1,323 @@
+import os
+import sys
+import json
+import time
+import signal
+import asyncio
+import argparse
+import tempfile
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+from data.project_data import ProjectStore, create_backend
+from data.remote_backend import RemoteBackend, ServiceClient, ServiceError, encode_message, error_type
+from utils.file_utils import SERVICE_SOCKET, STORE_BACKEND, STORE_REFRESH_MS
+
+"""
+Optional project service: one process that owns the project store and runs
+project and asset operations for every GUI and CLI on the machine.
+
+Clients connect over a Unix socket (see data.remote_backend for the
+protocol) and are pushed a "changed" event whenever another client changes
+the store, so they no longer poll it. Changes made by processes that use the
+store files directly are picked up every STORE_REFRESH_MS and pushed too.
+When the service isn't running, data.project_data.open_store() falls back
+to the files.
+
+Usage:
+    python pmt_service.py serve [--socket PATH] [--backend json|sqlite|sharded]
+    python pmt_service.py simulate [--clients N] [--ops N]
+"""
+
+# Longest request or response line, in bytes
+MESSAGE_LIMIT = 64 * 1024 * 1024
+
+# Backend methods clients may call
+STORE_READS = {"get_projects", "has_project", "get_assets", "has_asset"}
+STORE_WRITES = {"add_project", "add_asset", "rename_project", "delete_project", "rename_asset", "delete_asset"}
+
+def _create_project(store, project, template):
+    from core.asset_ops import create_project
+    return create_project(store, project, template)
+
+def _create_asset(store, project, asset_type, asset_name, reference):
+    from core.asset_ops import create_asset
+    return create_asset(store, project, asset_type, asset_name, reference)
+
+def _rename_asset(store, project, asset_type, old_name, new_name):
+    from core.asset_ops import rename_asset
+    return list(rename_asset(store, project, asset_type, old_name, new_name))
+
+# Operations on files and store together (see core.asset_ops)
+OPERATIONS = {
+    "ops.create_project": _create_project,
+    "ops.create_asset": _create_asset,
+    "ops.rename_asset": _rename_asset,
+}
+
+class ProjectService:
+    """
+    Serves a ProjectStore to clients on a Unix socket.
+
+    Requests are handled on the event loop and run one at a time on a single
+    worker thread, so the store is never used concurrently and a slow
+    operation doesn't stop events from being delivered.
+    """
+
+    def __init__(self, store, socket_path=SERVICE_SOCKET):
+        """
+        Prepares to serve a store; call serve() to start. store may also be a
+        function returning the store, called on the worker thread, for
+        backends such as sqlite that can only be used on the thread that opened them.
+        """
+        self.socket_path = socket_path
+        self.ready = threading.Event()  # Set once the socket accepts connections
+        self._clients = set()  # StreamWriters of connected clients
+        self.store = None if callable(store) else store
+        self._open_store = store if callable(store) else None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._loop = None
+        self._stopping = None
+
+    async def serve(self):
+        """
+        Serves clients until stop() is called.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._stopping = asyncio.Event()
+        if os.path.exists(self.socket_path):
+            client = ServiceClient.connect(self.socket_path)
+            if client is not None:
+                client.close()
+                raise ServiceError(f"A project service is already listening on {self.socket_path}.")
+            # Left behind by a service that didn't shut down cleanly
+            os.remove(self.socket_path)
+        if self.store is None:
+            self.store = await self._loop.run_in_executor(self._executor, self._open_store)
+        server = await asyncio.start_unix_server(self._handle, self.socket_path, limit=MESSAGE_LIMIT)
+        watcher = asyncio.create_task(self._watch_store())
+        self.ready.set()
+        try:
+            async with server:
+                await self._stopping.wait()
+                for writer in list(self._clients):
+                    writer.close()
+        finally:
+            watcher.cancel()
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+            await self._loop.run_in_executor(self._executor, self.store.save)
+            self._executor.shutdown()
+
+    def stop(self):
+        """
+        Asks the service to shut down; may be called from any thread.
+        """
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._stopping.set)
+
+    async def _handle(self, reader, writer):
+        self._clients.add(writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                response = await self._respond(line, writer)
+                writer.write(encode_message(response))
+                await writer.drain()
+        except (ConnectionError, ValueError):
+            # Dropped connection or an oversized line; the client is gone either way
+            pass
+        finally:
+            self._clients.discard(writer)
+            writer.close()
+
+    async def _respond(self, line, writer):
+        try:
+            request = json.loads(line)
+            request_id = request["id"]
+            method = request["method"]
+            params = request.get("params", [])
+        except (ValueError, TypeError, KeyError) as e:
+            return {"id": 0, "error": {"type": "ValueError", "message": f"Malformed request: {e}"}}
+        try:
+            result = await self._loop.run_in_executor(self._executor, self._execute, method, params)
+        except Exception as e:
+            if error_type(e) == ServiceError.__name__:
+                traceback.print_exc()
+            return {"id": request_id, "error": {"type": error_type(e), "message": str(e)}}
+        finally:
+            if method in STORE_WRITES or method in OPERATIONS or method == "batch":
+                # Like a local store, the client that made the change isn't told about it
+                self._broadcast({"event": "changed"}, exclude=writer)
+        return {"id": request_id, "result": result}
+
+    def _execute(self, method, params):
+        """
+        Runs one request on the worker thread.
+        """
+        backend = self.store.backend
+        if method in STORE_READS or method in STORE_WRITES:
+            return getattr(backend, method)(*params)
+        if method in OPERATIONS:
+            return OPERATIONS[method](self.store, *params)
+        if method == "batch":
+            ops, = params
+            if any(op not in STORE_WRITES for op, _ in ops):
+                raise ValueError("Only store mutations can be batched.")
+            with self.store.transaction():
+                for op, args in ops:
+                    getattr(backend, op)(*args)
+            return None
+        if method == "save":
+            return self.store.save()
+        raise ValueError(f"Unknown service method '{method}'.")
+
+    def _broadcast(self, message, exclude=None):
+        data = encode_message(message)
+        for writer in list(self._clients):
+            if writer is not exclude and not writer.is_closing():
+                writer.write(data)
+
+    async def _watch_store(self):
+        # Commits made directly to the files by processes that don't use the service
+        while True:
+            await asyncio.sleep(STORE_REFRESH_MS / 1000)
+            if await self._loop.run_in_executor(self._executor, self.store.refresh):
+                self._broadcast({"event": "changed"})
+
+def serve(socket_path=SERVICE_SOCKET, backend=STORE_BACKEND):
+    """
+    Runs the service in the foreground until SIGINT or SIGTERM.
+    """
+    service = ProjectService(lambda: ProjectStore(create_backend(backend)), socket_path)
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, service.stop)
+        task = asyncio.create_task(service.serve())
+        while not (service.ready.is_set() or task.done()):
+            await asyncio.sleep(0.01)
+        if service.ready.is_set():
+            print(f"Project service listening on {socket_path}", flush=True)
+        await task
+
+    asyncio.run(run())
+
+def simulate(clients=8, ops=200):
+    """
+    Runs a service on a throwaway JSON store and socket, drives it from
+    several simulated clients at once, and checks that the store ends up
+    consistent, both through the service and on disk, and that every client
+    was pushed exactly one event per change made by the others.
+    Returns a summary dictionary.
+    """
+    from data.json_backend import JsonBackend
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_file = os.path.join(tmp, "project_data.json")
+        socket_path = os.path.join(tmp, "pmt_service.sock")
+        service = ProjectService(ProjectStore(JsonBackend(data_file, data_file + ".journal")), socket_path)
+        thread = threading.Thread(target=asyncio.run, args=(service.serve(),), daemon=True)
+        thread.start()
+        service.ready.wait()
+
+        def run_client(i):
+            client = ServiceClient.connect(socket_path)
+            events = []
+            client.add_listener(lambda message: message.get("event") == "changed" and events.append(message))
+            store = ProjectStore(RemoteBackend(client))
+            project = f"Sim{i}"
+            expected = []
+            calls = 1
+            store.add_project(project)
+            for n in range(ops):
+                if n % 10 == 9:
+                    with store.transaction():
+                        for k in range(3):
+                            store.add_asset(project, f"Batch{n}_{k}", "Models/Props")
+                            expected.append(f"Batch{n}_{k}")
+                elif n % 10 == 4 and expected:
+                    store.rename_asset(project, expected[-1], expected[-1] + "_v2")
+                    expected[-1] += "_v2"
+                elif n % 10 == 7 and expected:
+                    store.delete_asset(project, expected.pop(0))
+                else:
+                    store.add_asset(project, f"Asset{n}", "Models/Props")
+                    expected.append(f"Asset{n}")
+                calls += 1
+            # Sent even when the project exists, so every client makes the same number of requests
+            store.backend.add_project("Shared")
+            store.add_asset("Shared", f"From{i}", "Models/Props")
+            calls += 2
+            return client, store, project, expected, calls, events
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=clients) as pool:
+            results = list(pool.map(run_client, range(clients)))
+        elapsed = time.perf_counter() - start
+
+        total_calls = sum(r[4] for r in results)
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline and any(len(r[5]) < total_calls - r[4] for r in results):
+            time.sleep(0.01)
+
+        problems = []
+        checker = results[0][1]
+        for client, store, project, expected, calls, events in results:
+            if [a["name"] for a in checker.get_assets(project)] != expected:
+                problems.append(f"{project}: assets differ from what the client wrote")
+            if len(events) != total_calls - calls:
+                problems.append(f"{project}: got {len(events)} events, expected {total_calls - calls}")
+        shared = sorted(a["name"] for a in checker.get_assets("Shared"))
+        if shared != sorted(f"From{i}" for i in range(clients)):
+            problems.append("Shared: concurrent additions were lost")
+        snapshot = {p: checker.get_assets(p) for p in checker.get_projects()}
+
+        for client, *_ in results:
+            client.close()
+        service.stop()
+        thread.join()
+        if ServiceClient.connect(socket_path) is not None:
+            problems.append("the service still accepts connections after stopping")
+        direct = ProjectStore(JsonBackend(data_file, data_file + ".journal"))
+        if {p: direct.get_assets(p) for p in direct.get_projects()} != snapshot:
+            problems.append("the store files differ from what the service served")
+
+    return {
+        "clients": clients,
+        "requests": total_calls,
+        "seconds": round(elapsed, 3),
+        "requests_per_second": round(total_calls / elapsed) if elapsed else None,
+        "problems": problems,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local service that owns the project store and pushes changes to clients.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    p = commands.add_parser("serve", help="run the service in the foreground")
+    p.add_argument("--socket", default=SERVICE_SOCKET, help="Unix socket to listen on")
+    p.add_argument("--backend", default=STORE_BACKEND, choices=("json", "sqlite", "sharded"), help="store backend to serve")
+
+    p = commands.add_parser("simulate", help="check the service against simulated clients on a throwaway store")
+    p.add_argument("--clients", type=int, default=8, help="number of concurrent clients")
+    p.add_argument("--ops", type=int, default=200, help="requests per client")
+
+    args = parser.parse_args(argv)
+    if args.command == "serve":
+        try:
+            serve(args.socket, args.backend)
+        except ServiceError as e:
+            print(e, file=sys.stderr)
+            return 1
+        return 0
+    summary = simulate(args.clients, args.ops)
+    print(json.dumps(summary, indent=2))
+    return 1 if summary["problems"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,6 +18,10 @@ hiddenimports = [
     'PyQt5.QtWidgets',
     'PyQt5.QtGui',
     'PyQt5.QtCore',
+    # Compiled UI modules are imported by name in gui/ui_loader.py
+    'gui.projManager_ui',
+    'gui.newAssetDialog_ui',
+    'gui.newProjDialog_ui',
 ]
 
 a = Analysis(
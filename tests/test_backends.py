@@ -0,0 +1,49 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from data.json_backend import JsonBackend
+from data.project_data import ProjectStore, StoreConflictError
+from data.sharded_backend import ShardedBackend
+from data.sqlite_backend import SqliteBackend
+
+class AddAssetToMissingProjectTest(unittest.TestCase):
+    """
+    Every backend refuses an asset whose project is not in the store, rather
+    than creating the project again.
+    """
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def backends(self):
+        data_file = os.path.join(self.folder, "project_data.json")
+        yield JsonBackend(data_file, data_file + ".journal")
+        yield SqliteBackend(os.path.join(self.folder, "project_data.db"))
+        yield ShardedBackend(os.path.join(self.folder, "shards"))
+
+    def test_add_asset_to_missing_project(self):
+        for backend in self.backends():
+            with self.subTest(backend=type(backend).__name__):
+                store = ProjectStore(backend)
+                with self.assertRaises(StoreConflictError):
+                    store.add_asset("Demo", "crate", "Models/Props")
+                self.assertEqual(store.get_projects(), [])
+
+    def test_transaction_rolls_back(self):
+        for backend in self.backends():
+            with self.subTest(backend=type(backend).__name__):
+                store = ProjectStore(backend)
+                store.add_project("Demo")
+                with self.assertRaises(StoreConflictError):
+                    with store.transaction():
+                        store.add_asset("Demo", "crate", "Models/Props")
+                        store.add_asset("Gone", "barrel", "Models/Props")
+                self.assertEqual(store.get_assets("Demo"), [])
+
+if __name__ == "__main__":
+    unittest.main()
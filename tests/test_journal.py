@@ -0,0 +1,55 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from data.json_backend import JsonBackend
+from data.project_data import ProjectStore
+
+class TornJournalTailTest(unittest.TestCase):
+    """
+    A line left half-written by a crashed writer must not swallow later commits.
+    """
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.data_file = os.path.join(self.folder, "project_data.json")
+        self.journal_file = self.data_file + ".journal"
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def open_store(self):
+        return ProjectStore(JsonBackend(self.data_file, self.journal_file))
+
+    def tear_tail(self):
+        with open(self.journal_file, 'ab') as f:
+            f.write(b'{"seq": 3, "op": "add_as')
+
+    def test_commit_after_torn_tail(self):
+        store = self.open_store()
+        store.add_project("Demo")
+        store.add_asset("Demo", "crate", "Models/Props")
+        self.tear_tail()
+        store.add_asset("Demo", "barrel", "Models/Props")
+        store.add_asset("Demo", "lamp", "Models/Props")
+
+        names = [a["name"] for a in self.open_store().get_assets("Demo")]
+        self.assertEqual(names, ["crate", "barrel", "lamp"])
+
+    def test_transaction_after_torn_tail(self):
+        store = self.open_store()
+        store.add_project("Demo")
+        self.tear_tail()
+        with store.transaction():
+            store.add_asset("Demo", "crate", "Models/Props")
+            store.add_asset("Demo", "barrel", "Models/Props")
+
+        reloaded = self.open_store()
+        self.assertEqual([a["name"] for a in reloaded.get_assets("Demo")], ["crate", "barrel"])
+        # Compacting keeps what was committed after the torn line
+        reloaded.save()
+        self.assertEqual([a["name"] for a in self.open_store().get_assets("Demo")], ["crate", "barrel"])
+
+if __name__ == "__main__":
+    unittest.main()
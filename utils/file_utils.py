@@ -1,14 +1,82 @@
 import os
 import json
+import shutil
 import tempfile
 import re
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:  # POSIX
+    msvcrt = None
 
 # Path to the main data file for storing project information
 DATA_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "project_data.json")
+# Append-only log of store operations not yet folded into DATA_FILE
+JOURNAL_FILE = DATA_FILE + ".journal"
+# SQLite database used by the "sqlite" store backend
+SQLITE_FILE = os.path.join(os.path.dirname(DATA_FILE), "project_data.db")
+# Folder holding the catalog and per-project shards of the "sharded" store backend
+SHARD_DIR = os.path.join(os.path.dirname(DATA_FILE), "shards")
+# Number of project shards the "sharded" backend keeps loaded at once
+SHARD_CACHE_SIZE = int(os.environ.get("PMT_SHARD_CACHE_SIZE", "8"))
+# Storage backend used by ProjectStore: "json", "sqlite" or "sharded"
+STORE_BACKEND = os.environ.get("PMT_STORE_BACKEND", "json").lower()
+# Unix socket of the optional project service (pmt_service.py)
+SERVICE_SOCKET = os.environ.get("PMT_SERVICE_SOCKET", os.path.join(os.path.dirname(DATA_FILE), "pmt_service.sock"))
+# Whether the GUI and CLI use the project service when it runs: "auto" or "off"
+SERVICE_MODE = os.environ.get("PMT_SERVICE", "auto").lower()
+# Seconds to wait when connecting to the project service before falling back to the files
+SERVICE_CONNECT_TIMEOUT = float(os.environ.get("PMT_SERVICE_CONNECT_TIMEOUT", "1.0"))
+# Seconds a call to the project service may take before the caller gives up and uses the files
+SERVICE_CALL_TIMEOUT = float(os.environ.get("PMT_SERVICE_CALL_TIMEOUT", "10.0"))
+# Number of journaled operations after which the journal is compacted into DATA_FILE
+JOURNAL_COMPACT_OPS = int(os.environ.get("PMT_JOURNAL_COMPACT_OPS", "500"))
+# Folder holding the asset file templates
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "file_templates")
 # Root directory for temporary project files
 ROOT_DIR = os.path.join(tempfile.gettempdir(), "ProjectManager")
+# Deleted projects and assets wait here until purged; on the same volume as the projects so deleting is a rename
+TRASH_DIR = os.path.join(ROOT_DIR, ".trash")
+# Seconds a deleted project or asset stays restorable before the GUI purges it
+TRASH_PURGE_DELAY_S = float(os.environ.get("PMT_TRASH_PURGE_DELAY_S", "300"))
 # Regex pattern for validating names (alphanumeric, underscores, hyphens)
 VALID_NAME_REGEX = re.compile(r"^[\w\-]+$")
+# Asset table refresh mode: "watch" uses filesystem notifications, "poll" rebuilds on a timer
+REFRESH_MODE = os.environ.get("PMT_REFRESH_MODE", "watch").lower()
+# Polling interval in milliseconds, used in "poll" mode or when notifications are unavailable
+POLL_INTERVAL_MS = int(os.environ.get("PMT_POLL_INTERVAL_MS", "5000"))
+# How often, in milliseconds, the GUI checks the shared store for other artists' changes
+STORE_REFRESH_MS = int(os.environ.get("PMT_STORE_REFRESH_MS", "2000"))
+# In "poll" mode, every Nth poll re-stats every asset file instead of trusting the stat cache
+POLL_FULL_RESCAN_TICKS = int(os.environ.get("PMT_POLL_FULL_RESCAN_TICKS", "12"))
+# Number of threads used to stat asset folders; network shares benefit from more
+SCAN_WORKERS = int(os.environ.get("PMT_SCAN_WORKERS", "16"))
+# Number of threads used to scaffold asset folders during batch creation
+BATCH_WORKERS = int(os.environ.get("PMT_BATCH_WORKERS", "8"))
+# Number of threads used to create sibling folders of a project tree
+TREE_WORKERS = int(os.environ.get("PMT_TREE_WORKERS", "4"))
+# Number of processes used to read Maya files during a reference audit
+AUDIT_WORKERS = int(os.environ.get("PMT_AUDIT_WORKERS", str(os.cpu_count() or 4)))
+# Number of processes used to hash large asset files for the content index
+HASH_WORKERS = int(os.environ.get("PMT_HASH_WORKERS", str(os.cpu_count() or 4)))
+# Number of merged config views core.config keeps in memory
+CONFIG_CACHE_SIZE = int(os.environ.get("PMT_CONFIG_CACHE_SIZE", "256"))
+# Seconds to wait for a running DCC session's command port to accept a file
+DCC_CONNECT_TIMEOUT = float(os.environ.get("PMT_DCC_CONNECT_TIMEOUT", "0.5"))
+# Seconds a newly launched DCC has to open its command port before queued files are dropped
+DCC_STARTUP_TIMEOUT = float(os.environ.get("PMT_DCC_STARTUP_TIMEOUT", "300"))
+# Project tree template used when none is given
+DEFAULT_PROJECT_TREE = os.environ.get("PMT_PROJECT_TREE", "default")
+# How asset stubs are made from templates: "auto" (reflink or in-kernel copy
+# where supported), "copy" (plain copy) or "lazy" (empty placeholder filled on first open)
+STUB_COPY_MODE = os.environ.get("PMT_STUB_COPY_MODE", "auto").lower()
+# Linux ioctl that makes dst share src's blocks copy-on-write (btrfs, XFS, ...)
+FICLONE = 0x40049409
 
 def ensure_dir(path):
     """Ensure that a directory exists, creating it if necessary."""
@@ -16,18 +84,113 @@ def ensure_dir(path):
         os.makedirs(path)
     return path
 
-def load_data():
+def clone_file(src, dst):
+    """Copy src to dst, sharing storage with src where the filesystem allows it.
+
+    Tries a reflink (FICLONE), then an in-kernel copy_file_range, then a
+    regular copy. Returns the method that was used.
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        if fcntl is not None:
+            try:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+                return "reflink"
+            except OSError:
+                pass
+        if hasattr(os, "copy_file_range"):
+            try:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                if remaining == 0:
+                    return "copy_file_range"
+            except OSError:
+                pass
+            # Start over with a plain copy
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+        shutil.copyfileobj(fsrc, fdst)
+        return "copy"
+
+def load_data(path=DATA_FILE):
     """Load project data from the JSON file if it exists."""
-    if os.path.exists(DATA_FILE):
-        with open(DATA_FILE, 'r') as f:
+    if os.path.exists(path):
+        with open(path, 'r') as f:
             return json.load(f)
-        # Fallback in case file doesn't exist (shouldn't reach here)
-        return {"branches": {}}
-    
-def save_data(data):
-    """Save the provided data dictionary to the JSON file."""
-    with open(DATA_FILE, 'w') as f:
-        json.dump(data, f, indent=4)
+    # Fallback in case the file doesn't exist yet
+    return {"projects": {}}
+
+# Process umask, read once at import since os.umask() can only be read by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def match_file_mode(fd, path):
+    """Give a temporary file that will replace path the permissions of path.
+
+    mkstemp creates files readable only by their owner, and os.replace keeps
+    that mode, which would lock other artists out of shared files. New files
+    get the default mode for the process umask.
+    """
+    if not hasattr(os, "fchmod"):
+        return
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    os.fchmod(fd, mode)
+
+def save_data(data, path=DATA_FILE):
+    """Save the provided data dictionary to the JSON file.
+
+    The data is written to a temporary file and swapped in with os.replace,
+    so a crash mid-write never leaves a truncated file behind. The temporary
+    file name is unique, so processes saving the same file never share one.
+    """
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp",
+                                     dir=os.path.dirname(path) or ".")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            match_file_mode(f.fileno(), path)
+            json.dump(data, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+@contextmanager
+def file_lock(path):
+    """Hold an exclusive advisory lock on path (created if missing) for the with block.
+
+    Uses flock on POSIX and msvcrt.locking on Windows. Only processes that
+    take the same lock are excluded; plain readers are never blocked.
+    """
+    with open(path, 'a+b') as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK gives up after about 10 seconds; keep waiting
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
 
 def is_valid_name(name):
     """Check if a name matches the allowed pattern."""
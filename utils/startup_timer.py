@@ -0,0 +1,44 @@
+import os
+import sys
+import time
+
+"""
+Startup instrumentation, enabled by setting PMT_PROFILE_STARTUP=1.
+
+Call mark() at the end of each startup phase and finish() once startup is
+complete; finish() prints how long each phase took to stderr. When
+profiling is disabled every call is a no-op.
+"""
+
+ENABLED = bool(os.environ.get("PMT_PROFILE_STARTUP"))
+
+_start = time.perf_counter()
+_last = _start
+_phases = []  # (phase name, seconds)
+_finished = False
+
+def mark(name):
+    """
+    Record that the phase called name ended now.
+    """
+    global _last
+    if not ENABLED or _finished:
+        return
+    now = time.perf_counter()
+    _phases.append((name, now - _last))
+    _last = now
+
+def finish(name):
+    """
+    Record the last phase and print the breakdown. Only the first call has an effect.
+    """
+    global _finished
+    if not ENABLED or _finished:
+        return
+    mark(name)
+    _finished = True
+    width = max(len(n) for n, _ in _phases)
+    lines = ["Startup timing:"]
+    lines += [f"  {n:<{width}}  {seconds * 1000:8.1f} ms" for n, seconds in _phases]
+    lines.append(f"  {'total':<{width}}  {(_last - _start) * 1000:8.1f} ms")
+    print("\n".join(lines), file=sys.stderr, flush=True)
@@ -0,0 +1,52 @@
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+
+"""
+Stand-in for a DCC application, for trying out core.dcc_launcher without Maya.
+
+Behaves like a Maya session started with a command port: after an optional
+startup delay it listens on the port and records every command it receives.
+The file it was started with and each received command are appended to a
+log as JSON lines. It has no dependencies on the rest of the tool, so a
+config.json can point a DCC's "path" at the Python interpreter with this
+script as the first argument.
+
+Usage: python stub_dcc.py --port N --log FILE [--startup-delay S] [file]
+"""
+
+def log_event(log_path, event, value):
+    with open(log_path, 'a') as f:
+        f.write(json.dumps({"pid": os.getpid(), "event": event, "value": value}) + "\n")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fake DCC session with a command port.")
+    parser.add_argument("--port", type=int, required=True, help="command port to listen on")
+    parser.add_argument("--log", required=True, help="JSON lines file receiving the events")
+    parser.add_argument("--startup-delay", type=float, default=0.0, help="seconds before the port opens")
+    parser.add_argument("file", nargs="?", help="file opened at startup")
+    args, _ = parser.parse_known_args(argv)
+
+    log_event(args.log, "start", args.file)
+    time.sleep(args.startup_delay)
+    server = socket.create_server(("127.0.0.1", args.port))
+    log_event(args.log, "ready", args.port)
+    while True:
+        conn, _ = server.accept()
+        with conn:
+            chunks = []
+            while True:
+                chunk = conn.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        command = b"".join(chunks).decode('utf-8')
+        log_event(args.log, "command", command)
+        if command.strip() == "quit":
+            return 0
+
+if __name__ == "__main__":
+    sys.exit(main())